@@ -10,5 +10,7 @@ violating them.
 More information about PRAW can be found at https://github.com/praw-dev/praw
 """
 
+from .async_reddit import AsyncReddit  # NOQA
 from .const import __version__  # NOQA
 from .reddit import Reddit  # NOQA
+from .response_cache import ResponseCache  # NOQA
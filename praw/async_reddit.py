@@ -0,0 +1,559 @@
+"""Provide the AsyncReddit class."""
+import asyncio
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import partial
+from logging import getLogger
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Union
+from urllib.parse import urljoin
+
+from prawcore import Session
+from prawcore import __version__ as prawcore_version
+from prawcore.exceptions import BadJSON, BadRequest, RequestException
+
+from .const import API_PATH, USER_AGENT_FORMAT
+from .exceptions import ClientException, RedditAPIException
+from .models.listing.generator import ListingGenerator
+from .models.util import _deferred_streams, _StreamDelay, _StreamRequest
+from .reddit import Reddit
+
+try:
+    import aiohttp
+
+    _RETRY_EXCEPTIONS = (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        asyncio.TimeoutError,
+    )
+except ImportError:  # pragma: no cover
+    aiohttp = None
+    _RETRY_EXCEPTIONS = (asyncio.TimeoutError,)
+
+logger = getLogger("praw")
+
+
+def _encode(pairs):
+    """Return ``pairs`` as a list of string pairs, without ``None`` values.
+
+    ``requests`` skips parameters whose value is ``None``, which ``aiohttp``
+    rejects.
+
+    """
+    if isinstance(pairs, dict):
+        pairs = pairs.items()
+    return [(key, str(value)) for key, value in pairs if value is not None]
+
+
+@contextmanager
+def _prefetched(reddit_object, data):
+    """Have the ``_fetch_data`` method of ``reddit_object`` return ``data``."""
+    object.__setattr__(reddit_object, "_fetch_data", lambda: data)
+    try:
+        yield
+    finally:
+        object.__delattr__(reddit_object, "_fetch_data")
+
+
+class _Response:
+    """The parts of an HTTP response used by ``prawcore``'s exceptions."""
+
+    def __init__(self, status_code, headers, content, loads):
+        self.content = content
+        self.headers = headers
+        self.status_code = status_code
+        self._loads = loads
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return self._loads(self.content)
+
+
+class AsyncIterator:
+    """Consume a listing or a stream with ``async for``.
+
+    The pages of a :class:`.ListingGenerator` are requested on the event
+    loop of the owning :class:`.AsyncReddit` instance, and so are the pages
+    and the waits of a generator returned by one of the ``stream`` helpers.
+    Other iterables are iterated over as is.
+
+    """
+
+    def __init__(self, async_reddit: "AsyncReddit", iterable: Iterable[Any]):
+        """Initialize an AsyncIterator instance.
+
+        :param async_reddit: An instance of :class:`.AsyncReddit`.
+        :param iterable: The iterable to consume.
+
+        """
+        self._async_reddit = async_reddit
+        self._iterator = iter(iterable)
+
+    def __aiter__(self) -> "AsyncIterator":
+        """Permit AsyncIterator to operate as an asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> Any:
+        """Return the next item produced by the wrapped iterator."""
+        if isinstance(self._iterator, ListingGenerator):
+            return await self._next_listing_item()
+        value = None
+        while True:
+            item = self._advance(value)
+            value = None
+            if isinstance(item, _StreamDelay):
+                await asyncio.sleep(item.seconds)
+            elif isinstance(item, _StreamRequest):
+                value = await self._async_reddit._collect(item.listing)
+            else:
+                return item
+
+    def _advance(self, value):
+        with _deferred_streams():
+            try:
+                if value is None:
+                    return next(self._iterator)
+                return self._iterator.send(value)
+            except StopIteration:
+                raise StopAsyncIteration()
+
+    async def _next_listing_item(self):
+        generator = self._iterator
+        try:
+            if generator._needs_batch():
+                generator._set_batch(
+                    await self._async_reddit._fetch_listing(generator)
+                )
+            return generator._next_item()
+        except StopIteration:
+            raise StopAsyncIteration()
+
+
+class AsyncReddit:
+    """Provide awaitable access to a :class:`.Reddit` instance.
+
+    Requests are sent with an ``aiohttp`` session, without blocking the event
+    loop, so that many of them can be awaited concurrently. The wrapped
+    :class:`.Reddit` instance, its :class:`.Objector`, and all of the model
+    classes are shared with synchronous code, so objects obtained through an
+    :class:`.AsyncReddit` instance behave exactly like ordinary PRAW objects.
+
+    .. code-block:: python
+
+       import asyncio
+       import praw
+
+       async def main():
+           async with praw.AsyncReddit(client_id="CLIENT_ID",
+                                       client_secret="CLIENT_SECRET",
+                                       user_agent="USERAGENT") as reddit:
+               subreddit = reddit.subreddit("redditdev")
+               await reddit.fetch(subreddit)
+               print(subreddit.subscribers)
+               async for submission in reddit.iterate(subreddit.new()):
+                   print(submission.title)
+
+       asyncio.get_event_loop().run_until_complete(main())
+
+    Attributes that are not defined on this class, such as ``subreddit``,
+    ``front``, or ``config``, are looked up on the wrapped :class:`.Reddit`
+    instance.
+
+    Requests wait for :attr:`.Reddit.rate_limiter` on the event loop, and are
+    retried like those of the wrapped instance. Access tokens are obtained
+    with the wrapped instance's blocking requestor, about once an hour, in
+    the event loop's default executor.
+
+    .. note:: Only the methods of this class are awaitable. Accessing an
+       attribute of an object that has not been fetched, or calling one of
+       its methods, still sends a blocking request. Await :meth:`.fetch`
+       first, and pass such methods to :meth:`.run`. Responses are not
+       stored in :attr:`.Reddit.response_cache`, nor coalesced.
+
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        reddit: Optional[Reddit] = None,
+        session: Optional[Any] = None,
+        **kwargs: Any
+    ):
+        """Initialize an AsyncReddit instance.
+
+        :param reddit: An existing instance of :class:`.Reddit` to wrap. When
+            not provided, a new instance is created from the remaining
+            positional and keyword arguments.
+        :param session: The ``aiohttp.ClientSession`` to send requests with,
+            which is then not closed by :meth:`.close`. When not provided, a
+            session using the ``timeout`` setting is created by the first
+            request.
+
+        Unless ``session`` is provided, ``aiohttp`` must be installed, for
+        instance with ``pip install praw[async]``.
+
+        """
+        if reddit is None:
+            reddit = Reddit(*args, **kwargs)
+        elif args or kwargs:
+            raise TypeError(
+                "`reddit` cannot be combined with Reddit initialization "
+                "arguments."
+            )
+        if session is None and aiohttp is None:
+            raise ClientException(
+                "AsyncReddit requires aiohttp. Install it with "
+                "`pip install praw[async]`."
+            )
+        self.reddit = reddit
+        self._http = session
+        self._owns_http = session is None
+        self._refresh_lock = None
+        self._user_agent = "{} prawcore/{}".format(
+            USER_AGENT_FORMAT.format(reddit.config.user_agent),
+            prawcore_version,
+        )
+
+    def __getattr__(self, attribute: str) -> Any:
+        """Return ``attribute`` from the wrapped :class:`.Reddit` instance."""
+        if attribute.startswith("_"):
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(
+                    self.__class__.__name__, attribute
+                )
+            )
+        return getattr(self.reddit, attribute)
+
+    async def __aenter__(self) -> "AsyncReddit":
+        """Handle the asynchronous context manager open."""
+        return self
+
+    async def __aexit__(self, *_args):
+        """Handle the asynchronous context manager close."""
+        await self.close()
+
+    async def _authorize(self, core):
+        """Return the headers identifying the requests of ``core``."""
+        authorizer = core._authorizer
+        if not authorizer.is_valid() and hasattr(authorizer, "refresh"):
+            if self._refresh_lock is None:
+                self._refresh_lock = asyncio.Lock()
+            async with self._refresh_lock:
+                if not authorizer.is_valid():
+                    await asyncio.get_event_loop().run_in_executor(
+                        None, authorizer.refresh
+                    )
+        return {
+            "Authorization": "bearer {}".format(authorizer.access_token),
+            "User-Agent": self._user_agent,
+        }
+
+    async def _collect(self, listing: Iterable[Any]) -> List[Any]:
+        """Return the items of ``listing``, requested on the event loop."""
+        if not isinstance(listing, ListingGenerator):
+            return await self.run(list, listing)
+        items = []
+        async for item in AsyncIterator(self, listing):
+            items.append(item)
+        return items
+
+    async def _fetch_listing(self, generator: ListingGenerator) -> Any:
+        """Return the next page of ``generator``."""
+        return ListingGenerator._build_listing(
+            self.reddit,
+            await self.request("GET", generator.url, params=generator.params),
+            **generator._fetch_options()
+        )
+
+    async def _objectify_request(self, method: str, path: str, **kwargs):
+        return self.reddit._objector.objectify(
+            await self.request(method, path, **kwargs)
+        )
+
+    async def _request(self, method, path, params, data, json, priority):
+        """Send a request as ``prawcore`` would, and return its JSON data."""
+        core = self.reddit._core
+        rate_limiter = self.reddit.rate_limiter
+        priority = priority or getattr(
+            rate_limiter._local, "priority", "normal"
+        )
+        weight = getattr(rate_limiter._local, "weight", 1)
+        params = deepcopy(params) or {}
+        params["raw_json"] = 1
+        headers = {}
+        if isinstance(data, dict):
+            data = deepcopy(data)
+            data["api_type"] = "json"
+            data = _encode(sorted(data.items()))
+        if isinstance(json, dict):
+            json = deepcopy(json)
+            json["api_type"] = "json"
+        if json is not None:
+            data = self.reddit._json_backend.dumps(json)
+            headers["Content-Type"] = "application/json"
+        url = urljoin(core._requestor.oauth_url, path)
+        retry_strategy = core._retry_strategy_class()
+        while True:
+            sleep_seconds = retry_strategy._sleep_seconds()
+            if sleep_seconds is not None:
+                await asyncio.sleep(sleep_seconds)
+            await rate_limiter.async_delay(priority, weight)
+            try:
+                response = await self._send(
+                    method,
+                    url,
+                    data=data,
+                    headers=dict(headers, **(await self._authorize(core))),
+                    params=_encode(params),
+                )
+            except RequestException as exception:
+                if not retry_strategy.should_retry_on_failure():
+                    raise
+                status = repr(exception.original_exception)
+            else:
+                retry = False
+                if response.status_code == 401:
+                    core._authorizer._clear_access_token()
+                    retry = hasattr(core._authorizer, "refresh")
+                if not retry_strategy.should_retry_on_failure() or not (
+                    retry or response.status_code in Session.RETRY_STATUSES
+                ):
+                    break
+                status = response.status_code
+            logger.warning(
+                "Retrying due to {} status: {} {}".format(status, method, url)
+            )
+            retry_strategy = retry_strategy.consume_available_retry()
+
+        if response.status_code in Session.STATUS_EXCEPTIONS:
+            raise Session.STATUS_EXCEPTIONS[response.status_code](response)
+        if response.status_code == 204:
+            return None
+        assert (
+            response.status_code in Session.SUCCESS_STATUSES
+        ), "Unexpected status code: {}".format(response.status_code)
+        if response.headers.get("content-length") == "0":
+            return ""
+        try:
+            return response.json()
+        except ValueError:
+            raise BadJSON(response)
+
+    async def _send(self, method, url, **kwargs):
+        """Send a single request and return its :class:`._Response`."""
+        if self._http is None:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.reddit.config.timeout)
+            )
+        logger.debug("Fetching: {} {}".format(method, url))
+        try:
+            async with self._http.request(
+                method, url, allow_redirects=False, **kwargs
+            ) as response:
+                content = await response.read()
+        except _RETRY_EXCEPTIONS as exception:
+            raise RequestException(exception, (method, url), kwargs)
+        self.reddit.rate_limiter.update(response.headers)
+        logger.debug(
+            "Response: {} ({} bytes)".format(response.status, len(content))
+        )
+        return _Response(
+            response.status,
+            response.headers,
+            content,
+            self.reddit._json_backend.loads,
+        )
+
+    async def close(self):
+        """Close the ``aiohttp`` session, unless it was provided."""
+        if self._owns_http and self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    async def run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run the blocking ``function`` in a thread and return its result.
+
+        :param function: The blocking callable to run.
+
+        Additional positional and keyword arguments are passed to
+        ``function``, which runs in the event loop's default executor. For
+        example, to await a method that has no dedicated coroutine on this
+        class:
+
+        .. code-block:: python
+
+           submission = reddit.submission("5or86n")
+           await reddit.run(submission.upvote)
+
+        The weight and priority class set on :attr:`.Reddit.rate_limiter` by
+        the calling thread apply to ``function``.
+
+        """
+        function = self.reddit.rate_limiter.bind(function)
+        return await asyncio.get_event_loop().run_in_executor(
+            None, partial(function, *args, **kwargs)
+        )
+
+    async def fetch(self, reddit_object: Any) -> Any:
+        """Fetch the attributes of a lazy :class:`.RedditBase` instance.
+
+        :param reddit_object: The object to fetch.
+        :returns: ``reddit_object``, once its attributes are available.
+
+        .. code-block:: python
+
+           redditor = await reddit.fetch(reddit.redditor("spez"))
+           print(redditor.link_karma)
+
+        The data is requested on the event loop, and the attributes are then
+        set by the object's own synchronous code. Objects that do not request
+        their data this way, such as :class:`.Emoji`, are fetched with
+        :meth:`.run` instead.
+
+        """
+        if not hasattr(reddit_object, "_fetch_info"):
+            await self.run(reddit_object._fetch)
+            return reddit_object
+        name, fields, params = reddit_object._fetch_info()
+        data = await self.request(
+            "GET", API_PATH[name].format(**fields), params=params
+        )
+        with _prefetched(reddit_object, data):
+            reddit_object._fetch()
+        return reddit_object
+
+    def iterate(self, iterable: Iterable[Any]) -> AsyncIterator:
+        """Return an :class:`.AsyncIterator` over ``iterable``.
+
+        :param iterable: A :class:`.ListingGenerator`, or a generator returned
+            by one of the ``stream`` helpers.
+
+        .. code-block:: python
+
+           subreddit = reddit.subreddit("AskReddit")
+           async for comment in reddit.iterate(subreddit.stream.comments()):
+               print(comment.body)
+
+        The ``prefetch`` argument of a :class:`.ListingGenerator` does not
+        apply here, as each page is requested once the previous one is
+        exhausted. Other generators that send requests, such as the one
+        returned by :meth:`.Reddit.info`, block the event loop, so consume
+        them with :meth:`.run` instead.
+
+        """
+        return AsyncIterator(self, iterable)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Union[str, Dict[str, str]]] = None,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        files: Optional[Dict[str, IO]] = None,
+        json=None,
+        priority: Optional[str] = None,
+    ) -> Any:
+        """Await the parsed JSON data returned from a request to URL.
+
+        The arguments are those of :meth:`.Reddit.request`. Requests with
+        ``files`` are sent by the wrapped instance with :meth:`.run`.
+
+        """
+        if data and json:
+            raise ClientException(
+                "At most one of `data` and `json` is supported."
+            )
+        if priority is not None:
+            self.reddit.rate_limiter._check_priority(priority)
+        if files:
+            return await self.run(
+                self.reddit.request,
+                method,
+                path,
+                params=params,
+                data=data,
+                files=files,
+                json=json,
+                priority=priority,
+            )
+        try:
+            return await self._request(
+                method, path, params, data, json, priority
+            )
+        except BadRequest as exception:
+            self.reddit._raise_bad_request(exception)
+
+    async def delete(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        json=None,
+    ) -> Any:
+        """Await :meth:`.Reddit.delete`."""
+        return await self._objectify_request(
+            "DELETE", path, data=data, json=json
+        )
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Union[str, Dict[str, Union[str, int]]]] = None,
+    ) -> Any:
+        """Await :meth:`.Reddit.get`."""
+        return await self._objectify_request("GET", path, params=params)
+
+    async def patch(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        json=None,
+    ) -> Any:
+        """Await :meth:`.Reddit.patch`."""
+        return await self._objectify_request(
+            "PATCH", path, data=data, json=json
+        )
+
+    async def post(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        files: Optional[Dict[str, IO]] = None,
+        params: Optional[Union[str, Dict[str, str]]] = None,
+        json=None,
+    ) -> Any:
+        """Await :meth:`.Reddit.post`."""
+        if json is None:
+            data = data or {}
+        kwargs = {"data": data, "files": files, "params": params, "json": json}
+        try:
+            return await self._objectify_request("POST", path, **kwargs)
+        except RedditAPIException as exception:
+            seconds = self.reddit._handle_rate_limit(exception=exception)
+            if seconds is None:
+                raise
+            logger.debug(
+                "Rate limit hit, sleeping for {:.2f} seconds".format(seconds)
+            )
+            await asyncio.sleep(seconds)
+            return await self._objectify_request("POST", path, **kwargs)
+
+    async def put(
+        self,
+        path: str,
+        data: Optional[
+            Union[Dict[str, Union[str, Any]], bytes, IO, str]
+        ] = None,
+        json=None,
+    ) -> Any:
+        """Await :meth:`.Reddit.put`."""
+        return await self._objectify_request("PUT", path, data=data, json=json)
@@ -84,6 +84,7 @@ class Config:
         self.client_id = self.client_secret = self.oauth_url = None
         self.reddit_url = self.refresh_token = self.redirect_uri = None
         self.password = self.user_agent = self.username = None
+        self.ratelimit_state_file = None
 
         self._initialize_attributes()
 
@@ -114,6 +115,13 @@ class Config:
         self.check_for_updates = self._config_boolean(
             self._fetch_or_not_set("check_for_updates")
         )
+        self.coalesce_requests = self._config_boolean(
+            self._fetch_or_not_set("coalesce_requests")
+        )
+        self.compact_models = self._config_boolean(
+            self._fetch_or_not_set("compact_models")
+        )
+        self.json_backend = self._fetch_default("json_backend", "auto")
         self.kinds = {
             x: self._fetch("{}_kind".format(x))
             for x in [
@@ -132,6 +140,7 @@ class Config:
             "redirect_uri",
             "refresh_token",
             "password",
+            "ratelimit_state_file",
             "user_agent",
             "username",
         ):
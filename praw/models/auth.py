@@ -1,12 +1,7 @@
 """Provide the Auth class."""
 from typing import Dict, List, Optional, Set, Union
 
-from prawcore import (
-    Authorizer,
-    ImplicitAuthorizer,
-    UntrustedAuthenticator,
-    session,
-)
+from prawcore import Authorizer, ImplicitAuthorizer, UntrustedAuthenticator
 
 from ..exceptions import InvalidImplicitAuth, MissingRequiredAttributeException
 from .base import PRAWBase
@@ -37,7 +32,7 @@ class Auth(PRAWBase):
         slight changes in response times and rounding.
 
         """
-        data = self._reddit._core._rate_limiter
+        data = self._reddit.rate_limiter
         return {
             "remaining": data.remaining,
             "reset_timestamp": data.reset_timestamp,
@@ -56,7 +51,7 @@ class Auth(PRAWBase):
         authenticator = self._reddit._read_only_core._authorizer._authenticator
         authorizer = Authorizer(authenticator)
         authorizer.authorize(code)
-        authorized_session = session(authorizer)
+        authorized_session = self._reddit._session(authorizer)
         self._reddit._core = self._reddit._authorized_core = authorized_session
         return authorizer.refresh_token
 
@@ -79,7 +74,7 @@ class Auth(PRAWBase):
         authenticator = self._reddit._read_only_core._authorizer._authenticator
         if not isinstance(authenticator, UntrustedAuthenticator):
             raise InvalidImplicitAuth
-        implicit_session = session(
+        implicit_session = self._reddit._session(
             ImplicitAuthorizer(authenticator, access_token, expires_in, scope)
         )
         self._reddit._core = self._reddit._authorized_core = implicit_session
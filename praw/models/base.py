@@ -8,6 +8,11 @@ Reddit = TypeVar("Reddit")
 class PRAWBase:
     """Superclass for all models in PRAW."""
 
+    # The attributes that are transformed by ``__setattr__`` when set from
+    # ``_data``. When not ``None``, every other attribute of ``_data`` is
+    # stored directly in the instance dictionary.
+    _SPECIAL_ATTRIBUTES = None
+
     @staticmethod
     def _safely_add_arguments(argument_dict, key, **new_arguments):
         """Replace argument_dict[key] with a deepcopy and update.
@@ -40,5 +45,12 @@ class PRAWBase:
         """
         self._reddit = reddit
         if _data:
-            for attribute, value in _data.items():
-                setattr(self, attribute, value)
+            special = self._SPECIAL_ATTRIBUTES
+            if special is None:
+                for attribute, value in _data.items():
+                    setattr(self, attribute, value)
+                return
+            self.__dict__.update(_data)
+            for attribute in special:
+                if attribute in _data:
+                    setattr(self, attribute, self.__dict__.pop(attribute))
@@ -1,8 +1,24 @@
 """Provide CommentForest for Submission comments."""
+import sqlite3
+from collections import deque
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from heapq import heappop, heappush
-from typing import List, Optional, TypeVar, Union
-
-from ..exceptions import DuplicateReplaceException
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from ..const import API_PATH
+from ..exceptions import ClientException, DuplicateReplaceException
+from .reddit.base import _dehydrate
 from .reddit.more import MoreComments
 
 Comment = TypeVar("Comment")
@@ -16,13 +32,17 @@ class CommentForest:
 
     """
 
+    MORECHILDREN_LIMIT = 100
+
     @staticmethod
     def _gather_more_comments(tree, parent_tree=None):
         """Return a list of MoreComments objects obtained from tree."""
+        if isinstance(tree, _SpilledComments) and tree._is_top_level:
+            return tree._store._gather_more_comments()
         more_comments = []
-        queue = [(None, x) for x in tree]
+        queue = deque((None, x) for x in tree)
         while queue:
-            parent, comment = queue.pop(0)
+            parent, comment = queue.popleft()
             if isinstance(comment, MoreComments):
                 heappush(more_comments, comment)
                 if parent:
@@ -86,29 +106,284 @@ class CommentForest:
             parent = self._submission._comments_by_id[comment.parent_id]
             parent.replies._comments.append(comment)
 
+    def _fetch_more_children(self, more_comments):
+        ids = [id_ for item in more_comments for id_ in item.children]
+        comments = []
+        for start in range(0, len(ids), self.MORECHILDREN_LIMIT):
+            data = {
+                "children": ",".join(
+                    ids[start : start + self.MORECHILDREN_LIMIT]
+                ),
+                "link_id": self._submission.fullname,
+                "sort": self._submission.comment_sort,
+            }
+            comments.extend(
+                self._submission._reddit.post(
+                    API_PATH["morechildren"], data=data
+                )
+            )
+        return comments
+
+    def _fetch_replacements(self, batched, batch):
+        if batch and batched[0].children:
+            return self._fetch_more_children(batched)
+        return batched[0].comments(update=False)
+
+    def _merge(self, items, changes, requested):
+        """Merge new and edited comments of ``items`` into the forest.
+
+        Return the :class:`.MoreComments` instances of ``items``, with only
+        the children that are neither in the forest nor in ``requested``.
+
+        """
+        comments_by_id = self._submission._comments_by_id
+        more_comments = []
+        for item in items:
+            if isinstance(item, MoreComments):
+                item.children = [
+                    id_
+                    for id_ in item.children
+                    if id_ not in requested
+                    and "t1_{}".format(id_) not in comments_by_id
+                ]
+                requested.update(item.children)
+                if item.children:
+                    more_comments.append(item)
+                continue
+            existing = comments_by_id.get(item.name)
+            if existing is not None:
+                if (existing.body, existing.edited) != (
+                    item.body,
+                    item.edited,
+                ):
+                    # The values are already objectified, so bypass
+                    # ``__setattr__``, which would objectify them again
+                    for attribute, value in item._attributes().items():
+                        if not attribute.startswith("_"):
+                            object.__setattr__(existing, attribute, value)
+                    comments_by_id[existing.name] = existing
+                    changes["edited"].append(existing)
+            elif item.is_root or item.parent_id in comments_by_id:
+                # Replies are merged one at a time as they are reached
+                item._replies = []
+                self._insert_comment(item)
+                changes["added"].append(item)
+        return more_comments
+
+    def _pop_batch(self, item, more_comments, remaining, threshold, batch):
+        batched = [item]
+        if batch and item.children:
+            size = len(item.children)
+            while (
+                more_comments
+                and size < self.MORECHILDREN_LIMIT
+                and (remaining is None or remaining > 0)
+                and more_comments[0].children
+                and more_comments[0].count >= threshold
+            ):
+                batched.append(heappop(more_comments))
+                size += len(batched[-1].children)
+                if remaining is not None:
+                    remaining -= 1
+        return batched, remaining
+
+    def _prefetch(
+        self,
+        prefetched,
+        submit,
+        more_comments,
+        remaining,
+        threshold,
+        batch,
+        workers,
+    ):
+        """Fetch the next ``workers`` batches of ``more_comments`` ahead.
+
+        The batches are those :meth:`.replace_more` pops next if the current
+        batch adds no :class:`.MoreComments` instance to the heap. Fetches
+        that are no longer among them are cancelled, and their results, if
+        any, are discarded.
+
+        """
+        upcoming = {}
+        heap = list(more_comments)
+        while heap and len(upcoming) < workers:
+            item = heappop(heap)
+            if remaining is not None and remaining <= 0:
+                break
+            if item.count < threshold:
+                continue
+            if remaining is not None:
+                remaining -= 1
+            batched, remaining = self._pop_batch(
+                item, heap, remaining, threshold, batch
+            )
+            key = tuple(map(id, batched))
+            future = prefetched.pop(key, None)
+            upcoming[key] = submit(batched) if future is None else future
+        for future in prefetched.values():
+            future.cancel()
+        prefetched.clear()
+        prefetched.update(upcoming)
+
+    def _traverse(self, depth_first, max_depth, predicate, skip_more):
+        queue = deque((0, comment) for comment in self._comments)
+        if depth_first:
+            queue.reverse()
+            pop = queue.pop
+        else:
+            pop = queue.popleft
+        while queue:
+            depth, comment = pop()
+            if isinstance(comment, MoreComments):
+                if skip_more:
+                    continue
+            elif max_depth is None or depth < max_depth:
+                replies = comment.replies._comments
+                if depth_first:
+                    replies = reversed(replies)
+                queue.extend((depth + 1, reply) for reply in replies)
+            if predicate is None or predicate(comment):
+                yield comment
+
     def _update(self, comments):
         self._comments = comments
         for comment in comments:
             comment.submission = self._submission
 
+    def iter_bfs(
+        self,
+        max_depth: Optional[int] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        skip_more: bool = False,
+    ) -> Iterator[Union[Comment, MoreComments]]:
+        """Yield the comments of the forest in breadth-first order.
+
+        :param max_depth: The maximum depth of the comments yielded, where
+            top-level comments have a depth of 0. ``None`` yields comments
+            at any depth (default: None).
+        :param predicate: A function called with each comment, which is only
+            yielded when the function returns ``True``. The replies of a
+            comment are visited either way (default: None).
+        :param skip_more: When ``True``, :class:`.MoreComments` instances are
+            not yielded (default: False).
+
+        Every top-level comment is yielded first, then every reply to them,
+        and so on. Each comment is visited once, so the traversal of a forest
+        of ``n`` comments takes ``O(n)`` time.
+
+        For example, to print the top-level comments and their direct replies
+        that have a score of at least 10:
+
+        .. code-block:: python
+
+           for comment in submission.comments.iter_bfs(
+               max_depth=1,
+               predicate=lambda comment: comment.score >= 10,
+               skip_more=True,
+           ):
+               print(comment.body)
+
+        """
+        return self._traverse(False, max_depth, predicate, skip_more)
+
+    def iter_dfs(
+        self,
+        max_depth: Optional[int] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        skip_more: bool = False,
+    ) -> Iterator[Union[Comment, MoreComments]]:
+        """Yield the comments of the forest in depth-first order.
+
+        :param max_depth: The maximum depth of the comments yielded, where
+            top-level comments have a depth of 0. ``None`` yields comments
+            at any depth (default: None).
+        :param predicate: A function called with each comment, which is only
+            yielded when the function returns ``True``. The replies of a
+            comment are visited either way (default: None).
+        :param skip_more: When ``True``, :class:`.MoreComments` instances are
+            not yielded (default: False).
+
+        Each comment is yielded before its replies, in the order in which
+        they are displayed on Reddit. Each comment is visited once, so the
+        traversal of a forest of ``n`` comments takes ``O(n)`` time.
+
+        """
+        return self._traverse(True, max_depth, predicate, skip_more)
+
     def list(self) -> Union[Comment, MoreComments]:
         """Return a flattened list of all Comments.
 
         This list may contain :class:`.MoreComments` instances if
-        :meth:`.replace_more` was not called first.
+        :meth:`.replace_more` was not called first. The comments are in the
+        order of :meth:`.iter_bfs`.
 
         """
-        comments = []
-        queue = list(self)
-        while queue:
-            comment = queue.pop(0)
-            comments.append(comment)
-            if not isinstance(comment, MoreComments):
-                queue.extend(comment.replies)
-        return comments
+        return list(self.iter_bfs())
+
+    def refresh_incremental(
+        self, limit: Optional[int] = None
+    ) -> Dict[str, List[Comment]]:
+        """Merge new and edited comments into the forest.
+
+        :param limit: The maximum number of comments to request, newest first
+            (default: the submission's ``comment_limit``).
+
+        :returns: A dictionary with the lists of comments that were ``added``
+            and ``edited``.
+
+        The comments of the submission are requested sorted by ``new``.
+        Comments that are not yet in the forest are added to it, and the
+        attributes of comments whose ``body`` or ``edited`` attribute changed
+        are updated, while other comments are left as they are. Only the
+        children of :class:`.MoreComments` instances that are not yet in the
+        forest are requested. Comments whose parent is not in the forest, for
+        instance because it was not replaced by :meth:`.replace_more`, are
+        ignored.
+
+        This is cheaper than refreshing the whole forest when monitoring a
+        submission with many comments:
+
+        .. code-block:: python
+
+           submission = reddit.submission(id="5or86n")
+           submission.comments.replace_more(limit=None)
+           while True:
+               time.sleep(300)
+               changes = submission.comments.refresh_incremental()
+               for comment in changes["added"]:
+                   print(comment.body)
+
+        """
+        submission = self._submission
+        submission_listing, comment_listing = submission._reddit.request(
+            "GET",
+            API_PATH["submission"].format(id=submission.id),
+            {"limit": limit or submission.comment_limit, "sort": "new"},
+        )
+        submission._update_submission(submission_listing, keep_comments=True)
+
+        changes = {"added": [], "edited": []}
+        requested = set()
+        more_comments = self._merge(
+            submission._reddit._objector._iter_comment_tree(
+                comment_listing["data"]["children"], []
+            ),
+            changes,
+            requested,
+        )
+        while more_comments:
+            more_comments = self._merge(
+                self._fetch_more_children(more_comments), changes, requested
+            )
+        return changes
 
     def replace_more(
-        self, limit: int = 32, threshold: int = 0
+        self,
+        limit: int = 32,
+        threshold: int = 0,
+        batch: bool = False,
+        workers: int = 1,
     ) -> List[MoreComments]:
         """Update the comment forest by resolving instances of MoreComments.
 
@@ -121,6 +396,18 @@ class CommentForest:
             replaced. :class:`.MoreComments` instances that represent "continue
             this thread" links unfortunately appear to have 0
             children. (default: 0).
+        :param batch: When ``True``, the children of several
+            :class:`.MoreComments` instances are requested together, in
+            requests of up to :attr:`.MORECHILDREN_LIMIT` comments, so that
+            fewer requests are made. ``limit`` still counts the instances
+            replaced (default: False).
+        :param workers: The number of requests for :class:`.MoreComments`
+            instances made at once, from a pool of threads. Requests are still
+            scheduled by :attr:`.Reddit.rate_limiter`. The instances expected
+            to be replaced next are requested ahead, but are only replaced in
+            the order of a single worker, so that the resulting forest is the
+            same. Requests made ahead for instances that are not replaced next
+            are discarded (default: 1).
 
         :returns: A list of :class:`.MoreComments` instances that were not
             replaced.
@@ -166,34 +453,266 @@ class CommentForest:
         remaining = limit
         more_comments = self._gather_more_comments(self._comments)
         skipped = []
+        executor = ThreadPoolExecutor(workers) if workers > 1 else None
+        fetch = self._submission._reddit.rate_limiter.bind(
+            self._fetch_replacements
+        )
+        prefetched = {}
+
+        try:
+            # Fetch largest more_comments until reaching the limit or the
+            # threshold
+            while more_comments:
+                item = heappop(more_comments)
+                if (
+                    remaining is not None
+                    and remaining <= 0
+                    or item.count < threshold
+                ):
+                    skipped.append(item)
+                    item._remove_from.remove(item)
+                    continue
+                if remaining is not None:
+                    remaining -= 1
+                batched, remaining = self._pop_batch(
+                    item, more_comments, remaining, threshold, batch
+                )
+
+                if executor is None:
+                    new_comments = fetch(batched, batch)
+                else:
+                    future = prefetched.pop(tuple(map(id, batched)), None)
+                    if future is None:
+                        future = executor.submit(fetch, batched, batch)
+                    self._prefetch(
+                        prefetched,
+                        lambda batched: executor.submit(fetch, batched, batch),
+                        more_comments,
+                        remaining,
+                        threshold,
+                        batch,
+                        workers - 1,
+                    )
+                    new_comments = future.result()
+
+                # Add new MoreComment objects to the heap of more_comments
+                for more in self._gather_more_comments(
+                    new_comments, self._comments
+                ):
+                    more.submission = self._submission
+                    heappush(more_comments, more)
+                # Insert all items into the tree
+                for comment in new_comments:
+                    self._insert_comment(comment)
+
+                # Remove from forest
+                for item in batched:
+                    item._remove_from.remove(item)
+        finally:
+            if executor is not None:
+                for future in prefetched.values():
+                    future.cancel()
+                executor.shutdown()
 
-        # Fetch largest more_comments until reaching the limit or the threshold
-        while more_comments:
-            item = heappop(more_comments)
-            if (
-                remaining is not None
-                and remaining <= 0
-                or item.count < threshold
-            ):
-                skipped.append(item)
-                item._remove_from.remove(item)
-                continue
+        return more_comments + skipped
 
-            new_comments = item.comments(update=False)
-            if remaining is not None:
-                remaining -= 1
+    def spill(self, path: str = "") -> "CommentStore":
+        """Move the comments of the forest to an SQLite database.
 
-            # Add new MoreComment objects to the heap of more_comments
-            for more in self._gather_more_comments(
-                new_comments, self._comments
-            ):
-                more.submission = self._submission
-                heappush(more_comments, more)
-            # Insert all items into the tree
-            for comment in new_comments:
-                self._insert_comment(comment)
+        :param path: The path to the database. Any comments it already holds
+            are discarded (default: "", a temporary database that is deleted
+            when it is closed).
 
-            # Remove from forest
-            item._remove_from.remove(item)
+        :returns: The :class:`.CommentStore` holding the comments.
 
-        return more_comments + skipped
+        :raises: :class:`.ClientException` if the forest is not the
+            :attr:`.Submission.comments` of its submission.
+
+        After this call, the forest is used as before, but its comments are
+        built from the database whenever they are accessed, and comments
+        added by :meth:`.replace_more` are written to it. This keeps the
+        memory used by submissions with a very large number of comments low:
+
+        .. code-block:: python
+
+           submission = reddit.submission(id="5or86n")
+           submission.comments.spill()
+           submission.comments.replace_more(limit=None)
+           for comment in submission.comments.iter_dfs(skip_more=True):
+               print(comment.body)
+
+        See :class:`.CommentStore` for the differences with a forest held in
+        memory.
+
+        """
+        submission = self._submission
+        if vars(submission).get("_comments") is not self:
+            raise ClientException(
+                "Only the forest of Submission.comments can be spilled."
+            )
+        if isinstance(submission._comments_by_id, CommentStore):
+            return submission._comments_by_id
+        store = CommentStore(submission, path)
+        comments = self._comments
+        submission._comments_by_id = store
+        self._comments = _SpilledComments(store, store._top_level)
+        for comment in comments:
+            comment.submission = submission
+            self._comments.append(comment)
+        return store
+
+
+class _SpilledComments:
+    """A list of comments that are built from a :class:`.CommentStore`."""
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(link) for link in self._links[index]]
+        return self._build(self._links[index])
+
+    def __init__(self, store, links):
+        self._links = links
+        self._store = store
+
+    def __iter__(self):
+        return map(self._build, self._links)
+
+    def __len__(self):
+        return len(self._links)
+
+    def __reversed__(self):
+        return map(self._build, reversed(self._links))
+
+    def _build(self, link):
+        if isinstance(link, MoreComments):
+            return link
+        return self._store[link]
+
+    @property
+    def _is_top_level(self):
+        return self._links is self._store._top_level
+
+    def append(self, comment):
+        self._links.append(self._store._link(comment))
+
+    def remove(self, comment):
+        self._links.remove(self._store._link(comment))
+
+
+class CommentStore(MutableMapping):
+    """Hold the comments of a submission in an SQLite database.
+
+    A store is created by :meth:`.CommentForest.spill`, and maps the fullname
+    of each comment of the submission to the comment. Only the fullnames, the
+    order of the replies of each comment, and the :class:`.MoreComments`
+    instances are held in memory. The data of each comment is stored in the
+    database, from which the comment is built whenever it is accessed, for
+    instance while traversing the forest.
+
+    .. note:: As a result, each access to a comment returns a distinct
+       instance, and changes made to an instance are not stored, with the
+       exception of those made by :meth:`.CommentForest.refresh_incremental`.
+
+    """
+
+    @staticmethod
+    def _link(item):
+        if isinstance(item, MoreComments):
+            return item
+        return item.name
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether the comment with fullname ``name`` is stored."""
+        return name in self._children
+
+    def __delitem__(self, name: str):
+        """Remove the comment with fullname ``name``, but not its replies."""
+        del self._children[name]
+        self._database.execute("DELETE FROM comments WHERE name = ?", (name,))
+
+    def __getitem__(self, name: str) -> Comment:
+        """Return the comment with fullname ``name``, built from its data."""
+        links = self._children[name]
+        (data,) = self._database.execute(
+            "SELECT data FROM comments WHERE name = ?", (name,)
+        ).fetchone()
+        reddit = self._submission._reddit
+        comment = self._comment_class(
+            reddit, _data=reddit._json_backend.loads(data)
+        )
+        comment._submission = self._submission
+        comment._replies = CommentForest(
+            self._submission, _SpilledComments(self, links)
+        )
+        return comment
+
+    def __init__(self, submission: Submission, path: str = ""):
+        """Initialize a CommentStore instance.
+
+        :param submission: The submission the comments belong to.
+        :param path: The path to the database. Any comments it already holds
+            are discarded (default: "", a temporary database that is deleted
+            when it is closed).
+
+        """
+        reddit = submission._reddit
+        self._children = {}
+        self._comment_class = reddit._objector.parsers[
+            reddit.config.kinds["comment"]
+        ]
+        self._submission = submission
+        self._top_level = []
+        self.path = path
+        # The database is a scratch space that never outlives the store
+        self._database = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._database.execute("PRAGMA journal_mode = OFF")
+        self._database.execute("PRAGMA synchronous = OFF")
+        self._database.execute("DROP TABLE IF EXISTS comments")
+        self._database.execute(
+            "CREATE TABLE comments (name TEXT PRIMARY KEY, data BLOB)"
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the fullnames of the stored comments."""
+        return iter(self._children)
+
+    def __len__(self) -> int:
+        """Return the number of stored comments."""
+        return len(self._children)
+
+    def __setitem__(self, name: str, comment: Comment):
+        """Store ``comment`` under its fullname ``name``.
+
+        The replies of a comment held in memory are not stored, but are
+        linked to it in their order.
+
+        """
+        replies = comment._replies
+        if isinstance(replies, CommentForest):
+            replies = replies._comments
+        if not isinstance(replies, _SpilledComments):
+            self._children[name] = [self._link(reply) for reply in replies]
+        self._database.execute(
+            "INSERT OR REPLACE INTO comments VALUES (?, ?)",
+            (
+                name,
+                self._submission._reddit._json_backend.dumps(
+                    _dehydrate(comment)
+                ),
+            ),
+        )
+
+    def _gather_more_comments(self):
+        more_comments = []
+        for links in chain([self._top_level], self._children.values()):
+            for link in links:
+                if isinstance(link, MoreComments):
+                    heappush(more_comments, link)
+                    link._remove_from = _SpilledComments(self, links)
+        return more_comments
+
+    def close(self):
+        """Close the database."""
+        self._database.close()
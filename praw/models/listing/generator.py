@@ -1,9 +1,23 @@
 """Provide the ListingGenerator class."""
 from copy import deepcopy
-from typing import Any, Dict, Iterator, Optional, TypeVar, Union
+from functools import partial
+from queue import Queue
+from threading import Event, Semaphore, Thread
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from ..base import PRAWBase
-from .listing import FlairListing
+from .listing import FlairListing, LazyListing, RawListing
 
 Reddit = TypeVar("Reddit")
 
@@ -18,12 +32,63 @@ class ListingGenerator(PRAWBase, Iterator):
 
     """
 
+    ALWAYS_FIELDS = frozenset({"id", "name"})
+
+    @staticmethod
+    def _build_listing(
+        reddit, listing, lazy=False, objector=None, fields=None, raw=False
+    ):
+        """Return the listing built from the JSON data of a response."""
+        lazy = lazy or objector is not None or fields or raw
+        objector = objector or reddit._objector
+        if lazy:
+            if isinstance(listing, list):
+                listing = listing[1]  # for submission duplicates
+            if listing.get("kind") == "Listing":
+                if fields:
+                    _project(
+                        listing["data"]["children"], fields, objector.parsers
+                    )
+                if raw:
+                    return RawListing(reddit, _data=listing["data"])
+                return LazyListing(
+                    reddit, _data=listing["data"], objector=objector
+                )
+        return _unwrap_listing(reddit, objector.objectify(listing))
+
+    @classmethod
+    def _fetch_listing(
+        cls,
+        reddit,
+        url,
+        params,
+        lazy=False,
+        objector=None,
+        fields=None,
+        raw=False,
+    ):
+        if lazy or objector is not None or fields or raw:
+            return cls._build_listing(
+                reddit,
+                reddit.request("GET", url, params=params),
+                lazy=lazy,
+                objector=objector,
+                fields=fields,
+                raw=raw,
+            )
+        return _unwrap_listing(reddit, reddit.get(url, params=params))
+
     def __init__(
         self,
         reddit: Reddit,
         url: str,
         limit: int = 100,
         params: Optional[Dict[str, Union[str, int]]] = None,
+        prefetch: int = 0,
+        lazy: bool = False,
+        compact: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        raw: bool = False,
     ):
         """Initialize a ListingGenerator instance.
 
@@ -36,46 +101,142 @@ class ListingGenerator(PRAWBase, Iterator):
             requests (default: 100).
         :param params: A dictionary containing additional query string
             parameters to send with the request.
+        :param prefetch: The number of following pages to request in a
+            background thread while the current page is being consumed. A
+            value of ``0`` fetches each page only once the previous one is
+            exhausted (default: 0).
+        :param lazy: When ``True``, keep the items of each page as returned by
+            Reddit until they are yielded, instead of building every model of a
+            page as soon as it arrives. The items yielded are unchanged
+            (default: False).
+        :param compact: When ``True``, yield instances of
+            :class:`.CompactComment` and :class:`.CompactSubmission` instead of
+            :class:`.Comment` and :class:`.Submission`, which use less memory.
+            This implies ``lazy`` (default: False).
+        :param fields: The names of the only attributes to keep on each item,
+            such as ``["author", "created_utc", "score"]``. The other
+            attributes returned by Reddit are discarded as soon as a page is
+            received, so that less memory and time is spent on them. ``id``,
+            ``name``, and the attribute used as the string representation of
+            each item, such as ``display_name`` for a :class:`.Subreddit`, are
+            always kept. This implies ``lazy`` (default: None).
+        :param raw: When ``True``, yield the data of each item as a
+            dictionary, as returned by Reddit, instead of a model such as a
+            :class:`.Submission`. Responses that are not listings, such as
+            flair lists, are unaffected (default: False).
+
+        .. note:: Accessing an attribute discarded through ``fields`` fetches
+            the item again for lazy models such as :class:`.Submission`,
+            :class:`.Subreddit`, and :class:`.Redditor`, but raises
+            :py:class:`AttributeError` for :class:`.Comment` and
+            :class:`.Message`, which are not fetched again once built from
+            Reddit's data. Use ``getattr`` with a default value for
+            attributes that may be absent.
+
+        When ``prefetch`` is used, call :meth:`.close` to stop the background
+        thread if the generator is abandoned before it is exhausted. This also
+        happens automatically once the generator is garbage collected.
 
         """
         super().__init__(reddit, _data=None)
         self._exhausted = False
         self._listing = None
         self._list_index = None
+        self._prefetcher = None
         self.limit = limit
         self.params = deepcopy(params) if params else {}
         self.params["limit"] = limit or 1024
+        self.compact = compact
+        self.fields = (
+            None if fields is None else self.ALWAYS_FIELDS.union(fields)
+        )
+        self.lazy = lazy
+        self.raw = raw
+        self.prefetch = prefetch
         self.url = url
         self.yielded = 0
 
+    def __del__(self):
+        """Stop prefetching when the generator is garbage collected."""
+        self._stop_prefetching()
+
     def __iter__(self) -> Iterator[Any]:
         """Permit ListingGenerator to operate as an iterator."""
         return self
 
     def __next__(self) -> Any:
         """Permit ListingGenerator to operate as a generator."""
+        if self._needs_batch():
+            self._next_batch()
+        return self._next_item()
+
+    def _fetch_options(self):
+        options = {"fields": self.fields, "lazy": self.lazy, "raw": self.raw}
+        if self.compact:
+            options["objector"] = self._reddit._compact_objector
+        return options
+
+    def _needs_batch(self):
+        """Return whether the next item requires another page.
+
+        :raises: :py:class:`StopIteration` once ``limit`` items were yielded.
+
+        """
         if self.limit is not None and self.yielded >= self.limit:
+            self._stop_prefetching()
+            raise StopIteration()
+        if self._listing is not None and self._list_index < len(self._listing):
+            return False
+        if self._exhausted:
             raise StopIteration()
+        return True
 
-        if self._listing is None or self._list_index >= len(self._listing):
-            self._next_batch()
+    def _next_batch(self):
+        if self.prefetch:
+            if self._prefetcher is None:
+                self._prefetcher = _PagePrefetcher(
+                    self._reddit.rate_limiter.bind(
+                        partial(
+                            self._fetch_listing,
+                            self._reddit,
+                            self.url,
+                            **self._fetch_options()
+                        )
+                    ),
+                    self.params,
+                    self.prefetch,
+                    self.limit,
+                )
+            try:
+                listing = self._prefetcher.next_page()
+            except Exception:
+                # The worker stopped at the failed page, which a new
+                # prefetcher requests again on the next call
+                self._stop_prefetching()
+                self._prefetcher = None
+                raise
+        else:
+            listing = self._fetch_listing(
+                self._reddit, self.url, self.params, **self._fetch_options()
+            )
+        self._set_batch(listing)
 
+    def _next_item(self):
         self._list_index += 1
         self.yielded += 1
         return self._listing[self._list_index - 1]
 
-    def _next_batch(self):
-        if self._exhausted:
-            raise StopIteration()
+    def _set_batch(self, listing):
+        """Make ``listing`` the page to yield items from.
+
+        :raises: :py:class:`StopIteration` when ``listing`` is empty.
 
-        self._listing = self._reddit.get(self.url, params=self.params)
-        if isinstance(self._listing, list):
-            self._listing = self._listing[1]  # for submission duplicates
-        elif isinstance(self._listing, dict):
-            self._listing = FlairListing(self._reddit, self._listing)
+        """
+        self._listing = listing
         self._list_index = 0
 
         if not self._listing:
+            self._stop_prefetching()
             raise StopIteration()
 
         if self._listing.after and self._listing.after != self.params.get(
@@ -84,3 +245,118 @@ class ListingGenerator(PRAWBase, Iterator):
             self.params["after"] = self._listing.after
         else:
             self._exhausted = True
+            self._stop_prefetching()
+
+    def _stop_prefetching(self):
+        prefetcher = getattr(self, "_prefetcher", None)
+        if prefetcher is not None:
+            prefetcher.stop()
+
+    def close(self):
+        """Stop the generator and any requests made in the background.
+
+        Like the ``close`` method of a Python generator, any further iteration
+        raises :py:class:`StopIteration`.
+
+        """
+        self._exhausted = True
+        self._listing = None
+        self._stop_prefetching()
+
+
+def _unwrap_listing(reddit, listing):
+    if isinstance(listing, list):
+        return listing[1]  # for submission duplicates
+    if isinstance(listing, dict):
+        return FlairListing(reddit, listing)
+    return listing
+
+
+def _project(
+    children: List[Dict[str, Any]],
+    fields: FrozenSet[str],
+    parsers: Dict[str, Any],
+):
+    """Keep only ``fields`` in the data of each thing in a listing.
+
+    The ``STR_FIELD`` of the model of each kind is kept as well, as models
+    such as :class:`.Subreddit` cannot be built without it.
+
+    """
+    fields_by_kind = {}
+    for child in children:
+        data = child.get("data")
+        kind = child.get("kind")
+        if not isinstance(data, dict) or kind == "more":
+            continue
+        kept = fields_by_kind.get(kind)
+        if kept is None:
+            str_field = getattr(parsers.get(kind), "STR_FIELD", None)
+            kept = fields_by_kind[kind] = (
+                fields if str_field is None else fields.union((str_field,))
+            )
+        child["data"] = {key: data[key] for key in kept if key in data}
+
+
+class _PagePrefetcher:
+    """Request the pages of a listing ahead of their consumption.
+
+    The worker thread only references the callable used to fetch a page, so
+    that the owning :class:`.ListingGenerator` can be garbage collected while
+    the thread is waiting for buffer space.
+
+    """
+
+    POLL_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        fetch: Callable[[Dict[str, Any]], Any],
+        params: Dict[str, Any],
+        pages: int,
+        limit: Optional[int],
+    ):
+        self._pages = Queue()
+        self._slots = Semaphore(pages)
+        self._stopped = Event()
+        self._thread = Thread(
+            target=self._run, args=(fetch, deepcopy(params), limit)
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _acquire_slot(self):
+        while not self._stopped.is_set():
+            if self._slots.acquire(timeout=self.POLL_INTERVAL):
+                return True
+        return False
+
+    def _run(self, fetch, params, limit):
+        fetched = 0
+        while self._acquire_slot():
+            try:
+                listing = fetch(dict(params))
+            except Exception as exception:  # pylint: disable=broad-except
+                self._pages.put(exception)
+                return
+            self._pages.put(listing)
+            if not listing:
+                return
+            fetched += len(listing)
+            if limit is not None and fetched >= limit:
+                return
+            if not listing.after or listing.after == params.get("after"):
+                return
+            params["after"] = listing.after
+
+    def next_page(self) -> Any:
+        """Return the next page, waiting for it to be fetched if necessary."""
+        page = self._pages.get()
+        self._slots.release()
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    def stop(self):
+        """Ask the worker thread to stop before its next request."""
+        self._stopped.set()
@@ -1,8 +1,14 @@
 """Provide the Listing class."""
-from typing import Any, Optional
+from collections.abc import Sequence
+from typing import Any, Dict, List, Optional, TypeVar, Union
 
 from ..base import PRAWBase
 
+Objector = TypeVar("Objector")
+Reddit = TypeVar("Reddit")
+
+_UNPARSED = object()
+
 
 class Listing(PRAWBase):
     """A listing is a collection of RedditBase instances."""
@@ -33,3 +39,88 @@ class FlairListing(Listing):
     def after(self) -> Optional[Any]:
         """Return the next attribute or None."""
         return getattr(self, "next", None)
+
+
+class RawListing(Listing):
+    """A listing whose children are the data of each item, as a dictionary.
+
+    No model, such as a :class:`.Submission`, is built for the children.
+
+    """
+
+    def __setattr__(self, attribute: str, value: Any):
+        """Keep the data of each child of the CHILD_ATTRIBUTE attribute."""
+        if attribute == self.CHILD_ATTRIBUTE:
+            value = [child["data"] for child in value]
+        PRAWBase.__setattr__(self, attribute, value)
+
+
+class LazyChildren(Sequence):
+    """A sequence that objectifies the children of a listing on access.
+
+    Each child is turned into a model, such as a :class:`.Submission`, the
+    first time it is indexed or iterated over, and the result is kept.
+
+    """
+
+    def __init__(self, objector: Objector, raw: List[Dict[str, Any]]):
+        """Initialize a LazyChildren instance.
+
+        :param objector: The :class:`.Objector` used to build the children.
+        :param raw: The children as returned by Reddit.
+
+        """
+        self._objector = objector
+        self._objects = [_UNPARSED] * len(raw)
+        self.raw = raw
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Return the objectified child, or children, at ``index``."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._objects[index]
+        if item is _UNPARSED:
+            item = self._objects[index] = self._objector.objectify(
+                self.raw[index]
+            )
+        return item
+
+    def __len__(self) -> int:
+        """Return the number of children."""
+        return len(self.raw)
+
+    @property
+    def parsed(self) -> int:
+        """Return the number of children that have been objectified."""
+        return sum(item is not _UNPARSED for item in self._objects)
+
+
+class LazyListing(Listing):
+    """A listing whose children are objectified only when accessed.
+
+    The children are held in a :class:`.LazyChildren` sequence, whose ``raw``
+    attribute provides the unparsed data of every child.
+
+    """
+
+    def __init__(
+        self,
+        reddit: Reddit,
+        _data: Optional[Dict[str, Any]],
+        objector: Optional[Objector] = None,
+    ):
+        """Initialize a LazyListing instance.
+
+        :param reddit: An instance of :class:`.Reddit`.
+        :param objector: The :class:`.Objector` used to build the children
+            (default: the objector of ``reddit``).
+
+        """
+        self._objector = objector or reddit._objector
+        super().__init__(reddit, _data=_data)
+
+    def __setattr__(self, attribute: str, value: Any):
+        """Wrap the CHILD_ATTRIBUTE attribute in :class:`.LazyChildren`."""
+        if attribute == self.CHILD_ATTRIBUTE:
+            value = LazyChildren(self._objector, value)
+        PRAWBase.__setattr__(self, attribute, value)
@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional, TypeVar, Union
 from urllib.parse import urlparse
 
 from ...exceptions import InvalidURL
+from ...util.cache import cachedproperty
 from ..base import PRAWBase
 
 Reddit = TypeVar("Reddit")
@@ -65,11 +66,54 @@ class RedditBase(PRAWBase):
         """Return whether the other instance differs from the current."""
         return not self == other
 
+    def _attributes(self) -> Dict[str, Any]:
+        return vars(self)
+
     def _fetch(self):  # pragma: no cover
         self._fetched = True
 
+    def _update_attributes(self, other: "RedditBase"):
+        self.__dict__.update(other.__dict__)
+
     def _reset_attributes(self, *attributes):
         for attribute in attributes:
             if attribute in self.__dict__:
                 del self.__dict__[attribute]
         self._fetched = False
+
+
+def _dehydrate(thing, private=False):
+    """Return the attributes of ``thing`` as data that can be encoded as JSON.
+
+    Attributes that start with an underscore are skipped, unless ``private``
+    is ``True``, in which case they are included without the underscore, as
+    they were set from Reddit's data.
+
+    """
+    data = {}
+    attributes = (
+        thing._attributes() if isinstance(thing, RedditBase) else vars(thing)
+    )
+    for attribute, value in attributes.items():
+        if isinstance(getattr(type(thing), attribute, None), cachedproperty):
+            continue
+        if attribute.startswith("_"):
+            if not private or attribute == "_reddit":
+                continue
+            attribute = attribute[1:]
+        if attribute == "author" and value is None:
+            value = "[deleted]"  # Inverse of Redditor.from_data
+        data[attribute] = _dehydrate_value(value)
+    return data
+
+
+def _dehydrate_value(value):
+    if isinstance(value, RedditBase):
+        return str(value)
+    if isinstance(value, PRAWBase):
+        return _dehydrate(value, private=True)
+    if isinstance(value, list):
+        return [_dehydrate_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _dehydrate_value(item) for key, item in value.items()}
+    return value
@@ -69,6 +69,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         "This comment does not appear to be in the comment tree"
     )
     STR_FIELD = "id"
+    _SPECIAL_ATTRIBUTES = ("author", "replies", "subreddit")
 
     @staticmethod
     def id_from_url(url: str) -> str:
@@ -146,11 +147,17 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
     @submission.setter
     def submission(self, submission: Submission):
         """Update the Submission associated with the Comment."""
-        submission._comments_by_id[self.name] = self
-        self._submission = submission
-        # pylint: disable=not-an-iterable
-        for reply in getattr(self, "replies", []):
-            reply.submission = submission
+        comments = [self]
+        while comments:
+            comment = comments.pop()
+            submission._comments_by_id[comment.name] = comment
+            comment._submission = submission
+            # pylint: disable=not-an-iterable
+            for reply in getattr(comment, "replies", []):
+                if isinstance(reply, Comment):
+                    comments.append(reply)
+                else:
+                    reply.submission = submission
 
     def __init__(
         self,
@@ -213,7 +220,7 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
 
         comment_data = data["children"][0]["data"]
         other = type(self)(self._reddit, _data=comment_data)
-        self.__dict__.update(other.__dict__)
+        self._update_attributes(other)
         self._fetched = True
 
     def _extract_submission_id(self):
@@ -311,9 +318,12 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
             params["limit"] = self.reply_limit
         if "reply_sort" in self.__dict__:
             params["sort"] = self.reply_sort
-        comment_list = self._reddit.get(comment_path, params=params)[
-            1
-        ].children
+        comment_listing = self._reddit.request(
+            "GET", comment_path, params=params
+        )[1]
+        comment_list = self._reddit._objector.objectify_comment_tree(
+            comment_listing["data"]["children"]
+        )
         if not comment_list:
             raise ClientException(self.MISSING_COMMENT_MESSAGE)
 
@@ -328,9 +338,10 @@ class Comment(InboxableMixin, UserContentMixin, FullnameMixin, RedditBase):
         if comment.id != self.id:
             raise ClientException(self.MISSING_COMMENT_MESSAGE)
 
-        if self._submission is not None:
-            del comment.__dict__["_submission"]  # Don't replace if set
-        self.__dict__.update(comment.__dict__)
+        submission = self._submission
+        self._update_attributes(comment)
+        if submission is not None:
+            self._submission = submission  # Don't replace if set
 
         for reply in comment_list:
             reply.submission = self.submission
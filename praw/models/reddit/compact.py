@@ -0,0 +1,237 @@
+"""Provide memory-lean variants of the Comment and Submission classes."""
+from typing import Any, Dict, Optional, TypeVar
+
+from .comment import Comment
+from .submission import Submission
+
+Reddit = TypeVar("Reddit")
+
+
+class CompactMixin:
+    """Store the attributes of a model in slots and a shared-key record.
+
+    The attributes named in ``_FIELDS`` are stored in slots. The values of all
+    other attributes received from Reddit are stored in a single tuple, whose
+    keys are shared by every instance received with the same keys. Only
+    attributes assigned after initialization use the instance dictionary.
+
+    """
+
+    __slots__ = ()
+    _FIELDS = frozenset()
+    _SHAPES = {}
+
+    @classmethod
+    def _slots(cls):
+        return [
+            name
+            for klass in cls.__mro__
+            for name in vars(klass).get("__slots__", ())
+        ]
+
+    def __getattr__(self, attribute: str) -> Any:
+        """Return ``attribute`` from the record of remaining attributes."""
+        if not attribute.startswith("_"):
+            try:
+                index = self._overflow_index[attribute]
+            except (AttributeError, KeyError):
+                pass
+            else:
+                return self._overflow_values[index]
+        return super().__getattr__(attribute)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the attributes held in slots and in the dictionary."""
+        state = dict(self.__dict__)
+        for name in self._slots():
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore the attributes held in slots and in the dictionary."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def _attributes(self) -> Dict[str, Any]:
+        """Return the attributes of the instance, like ``vars()``.
+
+        The attributes held in slots and in the record are included.
+
+        """
+        state = self.__getstate__()
+        values = state.pop("_overflow_values", ())
+        attributes = {
+            key: values[position]
+            for key, position in state.pop("_overflow_index", {}).items()
+        }
+        attributes.update(state)
+        return attributes
+
+    def _hydrate(self, data: Dict[str, Any]):
+        fields = self._FIELDS
+        special = self._SPECIAL_ATTRIBUTES
+        remaining = []
+        for key, value in data.items():
+            if key in special:
+                setattr(self, key, value)
+            elif key in fields:
+                object.__setattr__(self, key, value)
+            else:
+                remaining.append(key)
+        keys = tuple(remaining)
+        index = self._SHAPES.get(keys)
+        if index is None:
+            index = self._SHAPES.setdefault(
+                keys, {key: position for position, key in enumerate(keys)}
+            )
+        self._overflow_index = index
+        self._overflow_values = tuple(data[key] for key in keys)
+
+    def _update_attributes(self, other: "CompactMixin"):
+        self.__setstate__(other.__getstate__())
+
+
+class CompactComment(CompactMixin, Comment):
+    """A :class:`.Comment` that uses less memory per instance.
+
+    Instances behave like those of :class:`.Comment`, but ``vars()`` only
+    includes the attributes assigned after initialization. Use the
+    ``compact_models`` setting, or the ``compact`` argument of
+    :class:`.ListingGenerator`, to receive instances of this class.
+
+    **Typical Attributes**
+
+    This table describes the attributes held in slots. The other attributes
+    of :class:`.Comment` are available as well, and are held in a record of
+    the remaining attributes received from Reddit.
+
+    ======================= ===================================================
+    Attribute               Description
+    ======================= ===================================================
+    ``author``              Provides an instance of :class:`.Redditor`.
+    ``body``                The body of the comment.
+    ``created_utc``         Time the comment was created, represented in Unix
+                            Time.
+    ``id``                  The ID of the comment.
+    ``link_id``             The submission ID that the comment belongs to.
+    ``parent_id``           The ID of the parent comment (prefixed with
+                            ``t1_``). If it is a top-level comment, this
+                            returns the submission ID instead (prefixed with
+                            ``t3_``).
+    ``replies``             Provides an instance of :class:`.CommentForest`.
+    ``score``               The number of upvotes for the comment.
+    ``submission``          Provides an instance of :class:`.Submission`. The
+                            submission that the comment belongs to.
+    ``subreddit``           Provides an instance of :class:`.Subreddit`. The
+                            subreddit that the comment belongs to.
+    ======================= ===================================================
+
+    """
+
+    __slots__ = (
+        "_fetched",
+        "_overflow_index",
+        "_overflow_values",
+        "_reddit",
+        "_replies",
+        "_submission",
+        "author",
+        "body",
+        "created_utc",
+        "id",
+        "link_id",
+        "parent_id",
+        "score",
+        "subreddit",
+    )
+    _FIELDS = frozenset(
+        {"body", "created_utc", "id", "link_id", "parent_id", "score"}
+    )
+
+    def __init__(
+        self,
+        reddit: Reddit,
+        id: Optional[str] = None,  # pylint: disable=redefined-builtin
+        url: Optional[str] = None,
+        _data: Optional[Dict[str, Any]] = None,
+    ):
+        """Construct an instance of the CompactComment object."""
+        super().__init__(
+            reddit, id=id, url=url, _data=None if _data is None else {}
+        )
+        self._hydrate(_data or {})
+
+
+class CompactSubmission(CompactMixin, Submission):
+    """A :class:`.Submission` that uses less memory per instance.
+
+    Instances behave like those of :class:`.Submission`, but ``vars()`` only
+    includes the attributes assigned after initialization. Use the
+    ``compact_models`` setting, or the ``compact`` argument of
+    :class:`.ListingGenerator`, to receive instances of this class.
+
+    **Typical Attributes**
+
+    This table describes the attributes held in slots. The other attributes
+    of :class:`.Submission` are available as well, and are held in a record
+    of the remaining attributes received from Reddit.
+
+    =========================== ===============================================
+    Attribute                   Description
+    =========================== ===============================================
+    ``author``                  Provides an instance of :class:`.Redditor`.
+    ``comment_limit``           The maximum number of comments fetched.
+    ``comment_sort``            The sort order of the comments fetched.
+    ``created_utc``             Time the submission was created, represented in
+                                Unix Time.
+    ``id``                      ID of the submission.
+    ``num_comments``            The number of comments on the submission.
+    ``poll_data``               A :class:`.PollData` object representing the
+                                data of this submission, if it is a poll
+                                submission.
+    ``score``                   The number of upvotes for the submission.
+    ``subreddit``               Provides an instance of :class:`.Subreddit`.
+    ``title``                   The title of the submission.
+    ``url``                     The URL the submission links to, or the
+                                permalink if a selfpost.
+    =========================== ===============================================
+
+    """
+
+    __slots__ = (
+        "_comments_by_id",
+        "_fetched",
+        "_overflow_index",
+        "_overflow_values",
+        "_reddit",
+        "author",
+        "comment_limit",
+        "comment_sort",
+        "created_utc",
+        "id",
+        "num_comments",
+        "poll_data",
+        "score",
+        "subreddit",
+        "title",
+        "url",
+    )
+    _FIELDS = frozenset(
+        {"created_utc", "id", "num_comments", "score", "title", "url"}
+    )
+
+    def __init__(
+        self,
+        reddit: Reddit,
+        id: Optional[str] = None,  # pylint: disable=redefined-builtin
+        url: Optional[str] = None,
+        _data: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize a CompactSubmission instance."""
+        super().__init__(
+            reddit, id=id, url=url, _data=None if _data is None else {}
+        )
+        self._hydrate(_data or {})
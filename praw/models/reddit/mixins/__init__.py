@@ -19,6 +19,12 @@ class ThingModerationMixin:
 
     REMOVAL_MESSAGE_API = None
 
+    def _post(self, *args, **kwargs):
+        """Issue a POST request with the ``"high"`` priority class."""
+        reddit = self.thing._reddit
+        with reddit.rate_limiter.priority("high"):
+            return reddit.post(*args, **kwargs)
+
     def _add_removal_reason(self, mod_note="", reason_id=None):
         """Add a removal reason for a Comment or Submission.
 
@@ -41,9 +47,7 @@ class ThingModerationMixin:
             "mod_note": mod_note,
             "reason_id": reason_id,
         }
-        self.thing._reddit.post(
-            API_PATH["removal_reasons"], data={"json": dumps(data)}
-        )
+        self._post(API_PATH["removal_reasons"], data={"json": dumps(data)})
 
     def approve(self):
         """Approve a :class:`~.Comment` or :class:`~.Submission`.
@@ -65,9 +69,7 @@ class ThingModerationMixin:
            submission.mod.approve()
 
         """
-        self.thing._reddit.post(
-            API_PATH["approve"], data={"id": self.thing.fullname}
-        )
+        self._post(API_PATH["approve"], data={"id": self.thing.fullname})
 
     def distinguish(self, how="yes", sticky=False):
         """Distinguish a :class:`~.Comment` or :class:`~.Submission`.
@@ -96,7 +98,7 @@ class ThingModerationMixin:
         data = {"how": how, "id": self.thing.fullname}
         if sticky and getattr(self.thing, "is_root", False):
             data["sticky"] = True
-        self.thing._reddit.post(API_PATH["distinguish"], data=data)
+        self._post(API_PATH["distinguish"], data=data)
 
     def ignore_reports(self):
         """Ignore future reports on a :class:`~.Comment` or :class:`~.Submission`.
@@ -120,7 +122,7 @@ class ThingModerationMixin:
         .. seealso:: :meth:`~.unignore_reports`
 
         """
-        self.thing._reddit.post(
+        self._post(
             API_PATH["ignore_reports"], data={"id": self.thing.fullname}
         )
 
@@ -141,9 +143,7 @@ class ThingModerationMixin:
         .. seealso:: :meth:`~.unlock`
 
         """
-        self.thing._reddit.post(
-            API_PATH["lock"], data={"id": self.thing.fullname}
-        )
+        self._post(API_PATH["lock"], data={"id": self.thing.fullname})
 
     def remove(self, spam=False, mod_note="", reason_id=None):
         """Remove a :class:`~.Comment` or :class:`~.Submission`.
@@ -173,7 +173,7 @@ class ThingModerationMixin:
 
         """
         data = {"id": self.thing.fullname, "spam": bool(spam)}
-        self.thing._reddit.post(API_PATH["remove"], data=data)
+        self._post(API_PATH["remove"], data=data)
         if any([reason_id, mod_note]):
             self._add_removal_reason(mod_note, reason_id)
 
@@ -217,7 +217,7 @@ class ThingModerationMixin:
             "type": type,
         }
 
-        return self.thing._reddit.post(url, data={"json": dumps(data)}) or None
+        return self._post(url, data={"json": dumps(data)}) or None
 
     def undistinguish(self):
         """Remove mod, admin, or special distinguishing from an object.
@@ -261,7 +261,7 @@ class ThingModerationMixin:
         .. seealso:: :meth:`~.ignore_reports`
 
         """
-        self.thing._reddit.post(
+        self._post(
             API_PATH["unignore_reports"], data={"id": self.thing.fullname}
         )
 
@@ -282,9 +282,7 @@ class ThingModerationMixin:
         .. seealso:: :meth:`~.lock`
 
         """
-        self.thing._reddit.post(
-            API_PATH["unlock"], data={"id": self.thing.fullname}
-        )
+        self._post(API_PATH["unlock"], data={"id": self.thing.fullname})
 
 
 class UserContentMixin(
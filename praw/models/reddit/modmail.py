@@ -265,9 +265,10 @@ class ModmailConversation(RedditBase):
             "isAuthorHidden": author_hidden,
             "isInternal": internal,
         }
-        response = self._reddit.post(
-            API_PATH["modmail_conversation"].format(id=self.id), data=data
-        )
+        with self._reddit.rate_limiter.priority("high"):
+            response = self._reddit.post(
+                API_PATH["modmail_conversation"].format(id=self.id), data=data
+            )
         message_id = response["conversation"]["objIds"][-1]["id"]
         message_data = response["messages"][message_id]
         return self._reddit._objector.objectify(message_data)
@@ -57,17 +57,19 @@ class MoreComments(PRAWBase):
         path = "{}_/{}".format(
             API_PATH["submission"].format(id=self.submission.id), comment_id
         )
-        _, comments = self._reddit.get(
+        _, comment_listing = self._reddit.request(
+            "GET",
             path,
             params={
                 "limit": self.submission.comment_limit,
                 "sort": self.submission.comment_sort,
             },
         )
-        assert (
-            len(comments.children) == 1
-        ), "Please file a bug report with PRAW."
-        return comments.children[0]
+        comments = self._reddit._objector.objectify_comment_tree(
+            comment_listing["data"]["children"]
+        )
+        assert len(comments) == 1, "Please file a bug report with PRAW."
+        return comments[0]
 
     def comments(self, update: bool = True) -> List[Comment]:
         """Fetch and return the comments for a single MoreComments object."""
@@ -1,21 +1,31 @@
 """Provide the Submission class."""
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urljoin
 
 from prawcore import Conflict
 
 from ...const import API_PATH
-from ...exceptions import InvalidURL
+from ...exceptions import ClientException, InvalidURL
 from ...util.cache import cachedproperty
 from ..comment_forest import CommentForest
-from ..listing.listing import Listing
 from ..listing.mixins import SubmissionListingMixin
-from .base import RedditBase
+from .base import RedditBase, _dehydrate
 from .mixins import FullnameMixin, ThingModerationMixin, UserContentMixin
+from .more import MoreComments
 from .poll import PollData
 from .redditor import Redditor
 from .subreddit import Subreddit
 
+_Comment = TypeVar("_Comment")
 _Submission = TypeVar("_Submission")
 Reddit = TypeVar("Reddit")
 
@@ -415,7 +425,66 @@ class Submission(
 
     """
 
+    SNAPSHOT_VERSION = 1
     STR_FIELD = "id"
+    _SPECIAL_ATTRIBUTES = ("author", "poll_data", "subreddit")
+
+    @classmethod
+    def from_snapshot(cls, reddit: Reddit, file: IO[bytes]) -> _Submission:
+        """Return a submission and its comments loaded from a snapshot.
+
+        :param reddit: An instance of :class:`~.Reddit`.
+        :param file: A binary file object containing a snapshot written by
+            :meth:`.snapshot`.
+
+        :raises: :class:`.ClientException` if the snapshot was written with
+            an unsupported version of the format.
+
+        The submission is loaded as if it had been fetched, including the
+        :class:`.MoreComments` instances not yet replaced, without making any
+        request. For example:
+
+        .. code-block:: python
+
+           with open("5or86n.jsonl", "rb") as file:
+               submission = praw.models.Submission.from_snapshot(reddit, file)
+           submission.comments.replace_more()
+
+        """
+        loads = reddit._json_backend.loads
+        parsers = reddit._objector.parsers
+        lines = iter(file)
+        header = loads(next(lines))
+        if header.get("version") != cls.SNAPSHOT_VERSION:
+            raise ClientException(
+                "Unsupported snapshot version: {!r}".format(
+                    header.get("version")
+                )
+            )
+        data = header["data"]
+        comment_limit = data.pop("comment_limit")
+        comment_sort = data.pop("comment_sort")
+        submission = cls(reddit, _data=data)
+        submission.comment_limit = comment_limit
+        submission.comment_sort = comment_sort
+
+        # Each comment precedes its replies, which are listed in order
+        comments_by_id = {}
+        top_level = []
+        for line in lines:
+            node = loads(line)
+            item = parsers[node["kind"]].parse(node["data"], reddit)
+            parent = comments_by_id.get(item.parent_id)
+            if parent is None:
+                top_level.append(item)
+            else:
+                parent._replies.append(item)
+            if not isinstance(item, MoreComments):
+                comments_by_id[item.name] = item
+        submission._comments = CommentForest(submission)
+        submission._comments._update(top_level)
+        submission._fetched = True
+        return submission
 
     @staticmethod
     def id_from_url(url: str) -> str:
@@ -592,19 +661,58 @@ class Submission(
         return self._reddit.request("GET", path, params)
 
     def _fetch(self):
-        data = self._fetch_data()
-        submission_listing, comment_listing = data
-        comment_listing = Listing(self._reddit, _data=comment_listing["data"])
+        for _ in self.iter_comments():
+            pass
 
+    def _update_submission(self, submission_listing, keep_comments=False):
         submission_data = submission_listing["data"]["children"][0]["data"]
         submission = type(self)(self._reddit, _data=submission_data)
         delattr(submission, "comment_limit")
         delattr(submission, "comment_sort")
-        submission._comments = CommentForest(self)
+        if keep_comments:
+            delattr(submission, "_comments_by_id")
+            delattr(submission, "_fetched")
+        else:
+            submission._comments = CommentForest(self)
+        self._update_attributes(submission)
+
+    def iter_comments(self) -> Generator[_Comment, None, None]:
+        """Fetch the submission and yield its comments as they are built.
+
+        Comments are yielded depth-first, each before its replies, as soon as
+        it is built, rather than once the whole comment tree has been built as
+        when :attr:`.comments` is first accessed, so the first comment is
+        available sooner. The whole response is still decoded before the first
+        comment is built, so the peak memory used is the same as that of
+        :attr:`.comments`. :class:`.MoreComments` instances are not yielded.
+
+        The :class:`.CommentForest` of :attr:`.comments` is only set once the
+        generator is exhausted. If the generator is abandoned before, accessing
+        :attr:`.comments` fetches the submission again.
 
-        self.__dict__.update(submission.__dict__)
-        self.comments._update(comment_listing.children)
+        For example, to print the comments of a submission as they arrive:
 
+        .. code-block:: python
+
+           submission = reddit.submission(id="5or86n")
+           submission.comment_limit = 2048
+           for comment in submission.iter_comments():
+               print(comment.body)
+
+        """
+        submission_listing, comment_listing = self._fetch_data()
+        self._update_submission(submission_listing)
+        # Keep a partial forest out of reach until the tree is complete
+        forest = self._comments
+        del self._comments
+        top_level = []
+        for item in self._reddit._objector._iter_comment_tree(
+            comment_listing["data"]["children"], top_level, self
+        ):
+            if not isinstance(item, MoreComments):
+                yield item
+        forest._update(top_level)
+        self._comments = forest
         self._fetched = True
 
     def mark_visited(self):
@@ -724,5 +832,49 @@ class Submission(
 
         return self._reddit.post(API_PATH["submit"], data=data)
 
+    def snapshot(self, file: IO[bytes]):
+        """Write the submission and its comments to a snapshot.
+
+        :param file: A binary file object to write the snapshot to.
+
+        The snapshot keeps the structure of the comment forest, including the
+        :class:`.MoreComments` instances not yet replaced, and is loaded with
+        :meth:`.from_snapshot`. It contains one JSON object per line: the
+        submission, followed by each comment before its replies. The
+        submission is fetched first if it was not already.
+
+        For example, to save a submission after replacing its
+        :class:`.MoreComments`:
+
+        .. code-block:: python
+
+           submission = reddit.submission(id="5or86n")
+           submission.comments.replace_more(limit=None)
+           with open("5or86n.jsonl", "wb") as file:
+               submission.snapshot(file)
+
+        """
+        dumps = self._reddit._json_backend.dumps
+        comment_kind = self._reddit.config.kinds["comment"]
+        comments = self.comments
+        file.write(
+            dumps(
+                {
+                    "data": _dehydrate(self),
+                    "kind": self._reddit.config.kinds["submission"],
+                    "version": self.SNAPSHOT_VERSION,
+                }
+            )
+            + b"\n"
+        )
+        for item in comments.iter_dfs():
+            data = _dehydrate(item)
+            if isinstance(item, MoreComments):
+                del data["submission"]
+                kind = "more"
+            else:
+                kind = comment_kind
+            file.write(dumps({"data": data, "kind": kind}) + b"\n")
+
 
 Subreddit._submission_class = Submission
@@ -1,7 +1,7 @@
 """Provide the Redditors class."""
 from itertools import islice
 from types import SimpleNamespace
-from typing import Dict, Iterable, Iterator, TypeVar, Union
+from typing import Any, Dict, Iterable, Iterator, TypeVar, Union
 
 import prawcore
 
@@ -80,11 +80,14 @@ class Redditors(PRAWBase):
         return stream_generator(self.new, **stream_options)
 
     def partial_redditors(
-        self, ids: Iterable[str]
-    ) -> Iterator[PartialRedditor]:
+        self, ids: Iterable[str], raw: bool = False
+    ) -> Iterator[Union[PartialRedditor, Dict[str, Any]]]:
         """Get user summary data by redditor IDs.
 
         :param ids: An iterable of redditor fullname IDs.
+        :param raw: When ``True``, yield the data of each redditor as a
+            dictionary, as returned by Reddit, with an added ``fullname`` key
+            (default: False).
         :returns: A iterator producing types.SimpleNamespace objects.
 
         Each ID must be prefixed with ``t2_``.
@@ -107,4 +110,8 @@ class Redditors(PRAWBase):
                 continue
 
             for fullname, user_data in results.items():
-                yield PartialRedditor(fullname=fullname, **user_data)
+                if raw:
+                    user_data["fullname"] = fullname
+                    yield user_data
+                else:
+                    yield PartialRedditor(fullname=fullname, **user_data)
@@ -1,31 +1,158 @@
 """Provide helper classes used by other models."""
+import json
+import math
+import os
 import random
 import time
-from typing import Any, Callable, Generator, List, Optional, Set
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from itertools import chain
+from threading import local
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+
+class AdaptivePoller:
+    """Schedule the requests of a stream from the rate at which items arrive.
+
+    A poller is passed to a stream through ``stream_options``, for example:
+
+    .. code-block:: python
+
+       from praw.models.util import AdaptivePoller
+
+       poller = AdaptivePoller(target_latency=60)
+       for comment in reddit.subreddit("redditdev").stream.comments(
+           poller=poller
+       ):
+           print(comment)
+
+    The time between new items is estimated from the ``created_utc``
+    attribute of the items, as an exponentially weighted moving average, and
+    is raised while no new item arrives. From it, the poller waits as long as
+    possible between requests without exceeding ``target_latency``, or
+    without expecting more than half a page of new items, and requests pages
+    of twice the number of items expected. A stream that returns a full page
+    is requested again without waiting.
+
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        target_latency: float = 30,
+        min_delay: float = 1,
+        min_limit: int = 10,
+        smoothing: float = 0.2,
+    ):
+        """Initialize an instance of AdaptivePoller.
+
+        :param target_latency: The longest time in seconds, between the
+            creation of an item and the request that returns it, that the
+            poller aims for (default: 30).
+        :param min_delay: The shortest time in seconds between requests
+            (default: 1).
+        :param min_limit: The smallest number of items requested
+            (default: 10).
+        :param smoothing: The weight of each new time between items in the
+            estimate, between 0 and 1 (default: 0.2).
+
+        """
+        self.min_delay = min_delay
+        self.min_limit = min_limit
+        self.smoothing = smoothing
+        self.target_latency = target_latency
+        self._gap = None
+        self._newest = None
+
+    @property
+    def gap(self) -> Optional[float]:
+        """Return the estimated number of seconds between items, if any."""
+        return self._gap
+
+    def delay(self) -> float:
+        """Return the number of seconds to wait before the next request."""
+        delay = self.target_latency
+        if self._gap is not None:
+            delay = min(delay, self.PAGE_SIZE / 2 * self._gap)
+        return max(delay, self.min_delay)
+
+    def limit(self) -> int:
+        """Return the number of items to request."""
+        if not self._gap:
+            return self.PAGE_SIZE
+        expected = self.delay() / self._gap
+        return min(
+            max(math.ceil(2 * expected), self.min_limit), self.PAGE_SIZE
+        )
+
+    def observe(self, created: List[float], now: Optional[float] = None):
+        """Update the estimates with the creation times of new items.
+
+        :param created: The ``created_utc`` attribute of each new item.
+        :param now: The current time as a Unix timestamp (default: the result
+            of :py:func:`time.time`).
+
+        """
+        for timestamp in sorted(created):
+            if self._newest is not None:
+                gap = max(timestamp - self._newest, 0)
+                if self._gap is None:
+                    self._gap = gap
+                else:
+                    self._gap += self.smoothing * (gap - self._gap)
+            if self._newest is None or timestamp > self._newest:
+                self._newest = timestamp
+        if not created and self._gap is not None:
+            # No item arrived since the newest one, so the gap is at least as
+            # long as the time since then
+            now = time.time() if now is None else now
+            self._gap = max(self._gap, now - self._newest)
 
 
 class BoundedSet:
     """A set with a maximum size that evicts the oldest items when necessary.
 
+    Items are kept in the order in which they were last added, and adding and
+    evicting an item take constant time.
+
     This class does not implement the complete set interface.
     """
 
     def __init__(self, max_items: int):
         """Construct an instance of the BoundedSet."""
         self.max_items = max_items
-        self._fifo = []
-        self._set = set()
+        self._set = OrderedDict()
 
     def __contains__(self, item: Any) -> bool:
         """Test if the BoundedSet contains item."""
         return item in self._set
 
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items, from the oldest to the newest."""
+        return iter(self._set)
+
+    def __len__(self) -> int:
+        """Return the number of items in the BoundedSet."""
+        return len(self._set)
+
     def add(self, item: Any):
         """Add an item to the set discarding the oldest item if necessary."""
+        if item in self._set:
+            self._set.move_to_end(item)
+            return
         if len(self._set) == self.max_items:
-            self._set.remove(self._fifo.pop(0))
-        self._fifo.append(item)
-        self._set.add(item)
+            self._set.popitem(last=False)
+        self._set[item] = None
 
 
 class ExponentialCounter:
@@ -52,6 +179,29 @@ class ExponentialCounter:
         self._base = 1
 
 
+class _StreamDelay:
+    """The time a stream waits before its next request."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float):
+        """Initialize a _StreamDelay instance."""
+        self.seconds = seconds
+
+
+class _StreamRequest:
+    """A page that a stream needs, as a list of its items, to continue."""
+
+    __slots__ = ("listing",)
+
+    def __init__(self, listing: Iterable[Any]):
+        """Initialize a _StreamRequest instance."""
+        self.listing = listing
+
+
+_deferral = local()
+
+
 def permissions_string(
     permissions: Optional[List[str]], known_permissions: Set[str]
 ) -> str:
@@ -79,12 +229,118 @@ def permissions_string(
     return ",".join(to_set)
 
 
+def _backfill(
+    function, items, attribute_name, seen_attributes, function_kwargs
+):
+    """Return the unseen items older than ``items``, newest first.
+
+    Pages are requested with ``after`` until one contains a seen item or is
+    not full.
+
+    """
+    older = []
+    page = items
+    while page:
+        after = _stream_attribute(page[-1], attribute_name)
+        page = yield from _stream_fetch(
+            function,
+            limit=100,
+            **dict(function_kwargs, params={"after": after})
+        )
+        for item in page:
+            if _stream_attribute(item, attribute_name) in seen_attributes:
+                return older
+            older.append(item)
+        if len(page) < 100:
+            break
+    return older
+
+
+@contextmanager
+def _deferred_streams():
+    """Have streams yield their waits and requests instead of blocking.
+
+    This applies to streams advanced by the current thread within the
+    context. They yield a :class:`._StreamDelay` instead of sleeping, and a
+    :class:`._StreamRequest` instead of iterating over a page, which must
+    then be sent back to the stream as a list of its items. Their consumer
+    can thus wait and request without blocking the thread.
+
+    """
+    previous = getattr(_deferral, "deferred", False)
+    _deferral.deferred = True
+    try:
+        yield
+    finally:
+        _deferral.deferred = previous
+
+
+def _load_checkpoint(path, seen_attributes):
+    """Add the attributes seen at ``path`` and return the ``before`` cursor."""
+    try:
+        with open(path) as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+    except FileNotFoundError:
+        return None
+    for attribute in checkpoint["seen"]:
+        seen_attributes.add(attribute)
+    return checkpoint["before"]
+
+
+def _save_checkpoint(path, before_attribute, seen_attributes):
+    temporary_path = "{}.tmp".format(path)
+    with open(temporary_path, "w") as checkpoint_file:
+        json.dump(
+            {"before": before_attribute, "seen": list(seen_attributes)},
+            checkpoint_file,
+        )
+    os.replace(temporary_path, path)
+
+
+def _stream_created(item: Any) -> Optional[float]:
+    if isinstance(item, dict):
+        return item.get("created_utc")
+    try:
+        # Bypass ``__getattr__``, which would fetch lazy objects
+        return object.__getattribute__(item, "created_utc")
+    except AttributeError:
+        return None
+
+
+def _stream_fetch(
+    function: Callable[..., Iterable[Any]], **kwargs: Any
+) -> Generator[_StreamRequest, List[Any], List[Any]]:
+    listing = function(**kwargs)
+    if getattr(_deferral, "deferred", False):
+        items = yield _StreamRequest(listing)
+        return items
+    return list(listing)
+
+
+def _stream_sleep(seconds: float) -> Iterator[_StreamDelay]:
+    if getattr(_deferral, "deferred", False):
+        yield _StreamDelay(seconds)
+    else:
+        time.sleep(seconds)
+
+
+def _stream_attribute(item: Any, attribute_name: str) -> Any:
+    if isinstance(item, dict):
+        # Items yielded with ``raw=True`` store the fullname under ``name``.
+        return item["name" if attribute_name == "fullname" else attribute_name]
+    return getattr(item, attribute_name)
+
+
 def stream_generator(
     function: Callable[[Any], Any],
     pause_after: Optional[int] = None,
     skip_existing: bool = False,
     attribute_name: str = "fullname",
     exclude_before: bool = False,
+    max_seen: int = 301,
+    checkpoint: Optional[str] = None,
+    poller: Optional[AdaptivePoller] = None,
+    counters: Optional[Counter] = None,
     **function_kwargs: Any
 ) -> Generator[Any, None, None]:
     """Yield new items from ListingGenerators and ``None`` when paused.
@@ -109,13 +365,38 @@ def stream_generator(
     :param exclude_before: When True does not pass ``params`` to ``functions``
          (default: False).
 
+    :param max_seen: The number of most recent ids kept to recognize items
+        that were already yielded (default: 301).
+
+    :param checkpoint: The path to a file in which the most recent ids and the
+        id of the newest item are saved after each item is handled. When the
+        file exists, the stream resumes from the item following the last one
+        handled, and ``skip_existing`` is ignored (default: None).
+
+    :param poller: An :class:`.AdaptivePoller` setting the delay between
+        requests and the number of items requested, in place of the
+        exponential delay and the limit of 100 items (default: None).
+
+    :param counters: A :py:class:`collections.Counter` in which the number of
+        gaps found in the stream is counted under ``"gaps"``, and the number
+        of items recovered from them under ``"backfilled"`` (default: None).
+
+    Requests are made without ``before`` when the previous response had no new
+    items, since the item it refers to may have been removed. When such a
+    full response contains no item that was already seen, more items may have
+    arrived since the previous request than fit in a response. The older
+    items are then requested with ``after`` until a seen item is reached, and
+    are yielded first, so that no item is skipped. This does not apply when
+    ``exclude_before`` is True.
+
     Additional keyword arguments will be passed to ``function``.
 
-    .. note:: This function internally uses an exponential delay with jitter
-       between subsequent responses that contain no new results, up to a
-       maximum delay of just over a 16 seconds. In practice that means that the
-       time before pause for ``pause_after=N+1`` is approximately twice the
-       time before pause for ``pause_after=N``.
+    .. note:: Unless ``poller`` is given, this function internally uses an
+       exponential delay with jitter between subsequent responses that contain
+       no new results, up to a maximum delay of just over a 16 seconds. In
+       practice that means that the time before pause for
+       ``pause_after=N+1`` is approximately twice the time before pause for
+       ``pause_after=N``.
 
     For example, to create a stream of comment replies, try:
 
@@ -153,6 +434,33 @@ def stream_generator(
                break
            print(comment)
 
+    To only keep some attributes of each comment, which uses less memory,
+    try:
+
+    .. code-block:: python
+
+       subreddit = reddit.subreddit("redditdev")
+       fields = ["author", "body", "created_utc"]
+       for comment in subreddit.stream.comments(fields=fields):
+           print(comment.body)
+
+    To receive the data of each comment as a dictionary, without building a
+    :class:`.Comment`, try:
+
+    .. code-block:: python
+
+       subreddit = reddit.subreddit("redditdev")
+       for data in subreddit.stream.comments(raw=True):
+           print(data["body"])
+
+    To resume a stream where it stopped when the program is restarted, try:
+
+    .. code-block:: python
+
+       subreddit = reddit.subreddit("redditdev")
+       for comment in subreddit.stream.comments(checkpoint="comments.json"):
+           print(comment)
+
     To bypass the internal exponential backoff, try the following. This
     approach is useful if you are monitoring a subreddit with infrequent
     activity, and you want the to consistently learn about new items from the
@@ -170,40 +478,84 @@ def stream_generator(
     """
     before_attribute = None
     exponential_counter = ExponentialCounter(max_counter=16)
-    seen_attributes = BoundedSet(301)
+    seen_attributes = BoundedSet(max_seen)
+    if checkpoint is not None:
+        before_attribute = _load_checkpoint(checkpoint, seen_attributes)
+        if seen_attributes:
+            skip_existing = False
     without_before_counter = 0
     responses_without_new = 0
     valid_pause_after = pause_after is not None
     while True:
         found = False
         newest_attribute = None
-        limit = 100
+        limit = 100 if poller is None else poller.limit()
         if before_attribute is None:
-            limit -= without_before_counter
+            if limit > without_before_counter:
+                limit -= without_before_counter
+            else:
+                limit += without_before_counter
             without_before_counter = (without_before_counter + 1) % 30
         if not exclude_before:
             function_kwargs["params"] = {"before": before_attribute}
-        for item in reversed(list(function(limit=limit, **function_kwargs))):
-            attribute = getattr(item, attribute_name)
+        items = yield from _stream_fetch(
+            function, limit=limit, **function_kwargs
+        )
+        backfilled = []
+        if (
+            not exclude_before
+            and before_attribute is None
+            and seen_attributes
+            and len(items) >= limit
+            and not any(
+                _stream_attribute(item, attribute_name) in seen_attributes
+                for item in items
+            )
+        ):
+            backfilled = yield from _backfill(
+                function,
+                items,
+                attribute_name,
+                seen_attributes,
+                function_kwargs,
+            )
+            if counters is not None and backfilled:
+                counters["gaps"] += 1
+                counters["backfilled"] += len(backfilled)
+        created = []
+        for item in chain(reversed(backfilled), reversed(items)):
+            attribute = _stream_attribute(item, attribute_name)
             if attribute in seen_attributes:
                 continue
             found = True
             seen_attributes.add(attribute)
             newest_attribute = attribute
+            if poller is not None:
+                created.append(_stream_created(item))
             if not skip_existing:
                 yield item
+                if checkpoint is not None:
+                    _save_checkpoint(checkpoint, attribute, seen_attributes)
+        if checkpoint is not None and skip_existing and found:
+            _save_checkpoint(checkpoint, newest_attribute, seen_attributes)
         before_attribute = newest_attribute
         skip_existing = False
+        if poller is not None:
+            poller.observe([value for value in created if value is not None])
         if valid_pause_after and pause_after < 0:
             yield None
         elif found:
             exponential_counter.reset()
             responses_without_new = 0
+            if poller is not None and len(items) < limit:
+                yield from _stream_sleep(poller.delay())
         else:
             responses_without_new += 1
             if valid_pause_after and responses_without_new > pause_after:
                 exponential_counter.reset()
                 responses_without_new = 0
                 yield None
+            elif poller is not None:
+                yield from _stream_sleep(poller.delay())
             else:
-                time.sleep(exponential_counter.counter())
+                yield from _stream_sleep(exponential_counter.counter())
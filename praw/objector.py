@@ -1,13 +1,13 @@
 """Provides the Objector class."""
 
-from json import loads
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generator, List, Optional, TypeVar, Union
 
 from .exceptions import ClientException, RedditAPIException
 from .models.reddit.base import RedditBase
 from .util import snake_case_keys
 
 Reddit = TypeVar("Reddit")
+Submission = TypeVar("Submission")
 
 
 class Objector:
@@ -54,6 +54,7 @@ class Objector:
 
         """
         self.parsers = {} if parsers is None else parsers
+        self._dispatch = {}
         self._reddit = reddit
 
     def _objectify_dict(self, data):
@@ -62,70 +63,168 @@ class Objector:
         :param data: The structured data, assumed to be a dict.
         :returns: An instance of :class:`~.RedditBase`.
 
+        The rule applying to ``data`` only depends on which of the keys in
+        :attr:`._SHAPE_KEYS` it contains, so the outcome of :attr:`._RULES`
+        is memoized for each such shape.
+
         """
-        if {"conversation", "messages", "modActions"}.issubset(data):
-            parser = self.parsers["ModmailConversation"]
-        elif {"actionTypeId", "author", "date"}.issubset(data):
-            # Modmail mod action
-            data = snake_case_keys(data)
-            parser = self.parsers["ModmailAction"]
-        elif {"bodyMarkdown", "isInternal"}.issubset(data):
-            # Modmail message
-            data = snake_case_keys(data)
-            parser = self.parsers["ModmailMessage"]
-        elif {"kind", "short_name", "violation_reason"}.issubset(data):
-            # This is a Rule
-            parser = self.parsers["rule"]
-        elif {"isAdmin", "isDeleted"}.issubset(data):
-            # Modmail author
-            data = snake_case_keys(data)
-            # Prevent clobbering base-36 id
-            del data["id"]
-            data["is_subreddit_mod"] = data.pop("is_mod")
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"banStatus", "muteStatus", "recentComments"}.issubset(data):
-            # Modmail user
-            data = snake_case_keys(data)
-            data["created_string"] = data.pop("created")
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"displayName", "id", "type"}.issubset(data):
-            # Modmail subreddit
-            data = snake_case_keys(data)
-            parser = self.parsers[self._reddit.config.kinds[data["type"]]]
-        elif {"date", "id", "name"}.issubset(data) or {
-            "id",
-            "name",
-            "permissions",
-        }.issubset(data):
-            parser = self.parsers[self._reddit.config.kinds["redditor"]]
-        elif {"text", "url"}.issubset(data):
-            if "color" in data or "linkUrl" in data:
-                parser = self.parsers["Button"]
-            else:
-                parser = self.parsers["MenuLink"]
-        elif {"children", "text"}.issubset(data):
-            parser = self.parsers["Submenu"]
-        elif {"height", "url", "width"}.issubset(data):
-            parser = self.parsers["Image"]
-        elif {"isSubscribed", "name", "subscribers"}.issubset(data):
-            # discards icon and subscribed information
-            return self._reddit.subreddit(data["name"])
-        elif {"authorFlairType", "name"}.issubset(data):
-            # discards flair information
-            return self._reddit.redditor(data["name"])
-        elif {"parent_id"}.issubset(data):
-            parser = self.parsers[self._reddit.config.kinds["comment"]]
-        elif "collection_id" in data.keys():
-            parser = self.parsers["Collection"]
-        else:
-            if "user" in data:
-                parser = self.parsers[self._reddit.config.kinds["redditor"]]
-                data["user"] = parser.parse(
-                    {"name": data["user"]}, self._reddit
+        return self._handler(data)(self, data)
+
+    def _handler(self, data):
+        shape = self._SHAPE_KEYS.intersection(data)
+        handler = self._dispatch.get(shape)
+        if handler is None:
+            handler = self._dispatch[shape] = self._match_rule(shape)
+        return handler
+
+    def _iter_comment_tree(
+        self,
+        children: List[Dict[str, Any]],
+        top_level: List[Any],
+        submission: Optional[Submission] = None,
+    ) -> Generator[Any, None, None]:
+        """Build a tree of comments without recursion, yielding each item.
+
+        :param children: The children of a listing of comments, as returned by
+            Reddit. The list is emptied, so that the data of each item can be
+            released once the item is built.
+        :param top_level: The list to which the top-level items are appended.
+        :param submission: The submission to assign to each item (default:
+            None).
+
+        Items are built depth-first, each before its replies, which are
+        appended to its ``_replies`` list rather than objectified through a
+        :class:`.Listing`.
+
+        """
+        stack = [(top_level, child) for child in reversed(children)]
+        del children[:]
+        while stack:
+            siblings, child = stack.pop()
+            replies = child["data"].pop("replies", "")
+            item = self.objectify(child)
+            siblings.append(item)
+            if replies:
+                stack.extend(
+                    (item._replies, reply)
+                    for reply in reversed(replies["data"]["children"])
                 )
-            return data
+            if submission is not None:
+                item.submission = submission
+            yield item
+
+    def _parse_button(self, data):
+        return self.parsers["Button"].parse(data, self._reddit)
+
+    def _parse_collection(self, data):
+        return self.parsers["Collection"].parse(data, self._reddit)
+
+    def _parse_comment(self, data):
+        parser = self.parsers[self._reddit.config.kinds["comment"]]
         return parser.parse(data, self._reddit)
 
+    def _parse_image(self, data):
+        return self.parsers["Image"].parse(data, self._reddit)
+
+    def _parse_menu_link(self, data):
+        return self.parsers["MenuLink"].parse(data, self._reddit)
+
+    def _parse_modmail_action(self, data):
+        data = snake_case_keys(data)
+        return self.parsers["ModmailAction"].parse(data, self._reddit)
+
+    def _parse_modmail_author(self, data):
+        data = snake_case_keys(data)
+        # Prevent clobbering base-36 id
+        del data["id"]
+        data["is_subreddit_mod"] = data.pop("is_mod")
+        return self._parse_redditor(data)
+
+    def _parse_modmail_conversation(self, data):
+        return self.parsers["ModmailConversation"].parse(data, self._reddit)
+
+    def _parse_modmail_message(self, data):
+        data = snake_case_keys(data)
+        return self.parsers["ModmailMessage"].parse(data, self._reddit)
+
+    def _parse_modmail_subreddit(self, data):
+        data = snake_case_keys(data)
+        parser = self.parsers[self._reddit.config.kinds[data["type"]]]
+        return parser.parse(data, self._reddit)
+
+    def _parse_modmail_user(self, data):
+        data = snake_case_keys(data)
+        data["created_string"] = data.pop("created")
+        return self._parse_redditor(data)
+
+    def _parse_plain_dict(self, data):
+        if "user" in data:
+            parser = self.parsers[self._reddit.config.kinds["redditor"]]
+            data["user"] = parser.parse({"name": data["user"]}, self._reddit)
+        return data
+
+    def _parse_redditor(self, data):
+        parser = self.parsers[self._reddit.config.kinds["redditor"]]
+        return parser.parse(data, self._reddit)
+
+    def _parse_redditor_name(self, data):
+        # discards flair information
+        return self._reddit.redditor(data["name"])
+
+    def _parse_rule(self, data):
+        return self.parsers["rule"].parse(data, self._reddit)
+
+    def _parse_submenu(self, data):
+        return self.parsers["Submenu"].parse(data, self._reddit)
+
+    def _parse_subreddit_name(self, data):
+        # discards icon and subscribed information
+        return self._reddit.subreddit(data["name"])
+
+    # Each rule is a tuple of key sets followed by the method handling data
+    # containing all of the keys of any of the sets. The first matching rule
+    # applies, and data matching no rule is handled by ``_parse_plain_dict``.
+    _RULES = (
+        (
+            ({"conversation", "messages", "modActions"},),
+            _parse_modmail_conversation,
+        ),
+        (({"actionTypeId", "author", "date"},), _parse_modmail_action),
+        (({"bodyMarkdown", "isInternal"},), _parse_modmail_message),
+        (({"kind", "short_name", "violation_reason"},), _parse_rule),
+        (({"isAdmin", "isDeleted"},), _parse_modmail_author),
+        (
+            ({"banStatus", "muteStatus", "recentComments"},),
+            _parse_modmail_user,
+        ),
+        (({"displayName", "id", "type"},), _parse_modmail_subreddit),
+        (
+            ({"date", "id", "name"}, {"id", "name", "permissions"}),
+            _parse_redditor,
+        ),
+        (
+            ({"color", "text", "url"}, {"linkUrl", "text", "url"}),
+            _parse_button,
+        ),
+        (({"text", "url"},), _parse_menu_link),
+        (({"children", "text"},), _parse_submenu),
+        (({"height", "url", "width"},), _parse_image),
+        (({"isSubscribed", "name", "subscribers"},), _parse_subreddit_name,),
+        (({"authorFlairType", "name"},), _parse_redditor_name),
+        (({"parent_id"},), _parse_comment),
+        (({"collection_id"},), _parse_collection),
+    )
+    _SHAPE_KEYS = frozenset(
+        key for key_sets, _ in _RULES for keys in key_sets for key in keys
+    )
+
+    @classmethod
+    def _match_rule(cls, shape):
+        for key_sets, handler in cls._RULES:
+            if any(keys.issubset(shape) for keys in key_sets):
+                return handler
+        return cls._parse_plain_dict
+
     def objectify(
         self, data: Optional[Union[Dict[str, Any], List[Any]]]
     ) -> Optional[Union[RedditBase, Dict[str, Any], List[Any]]]:
@@ -156,7 +255,11 @@ class Objector:
             if "things" in data["json"]["data"]:  # Submission.reply
                 return self.objectify(data["json"]["data"]["things"])
             if "rules" in data["json"]["data"]:
-                return self.objectify(loads(data["json"]["data"]["rules"]))
+                return self.objectify(
+                    self._reddit._json_backend.loads(
+                        data["json"]["data"]["rules"]
+                    )
+                )
             if "url" in data["json"]["data"]:  # Subreddit.submit
                 # The URL is the URL to the submission, so it's removed.
                 del data["json"]["data"]["url"]
@@ -183,3 +286,24 @@ class Objector:
             return self._objectify_dict(data)
 
         return data
+
+    def objectify_comment_tree(
+        self,
+        children: List[Dict[str, Any]],
+        submission: Optional[Submission] = None,
+    ) -> List[Any]:
+        """Return the top-level comments built from ``children``.
+
+        :param children: The children of a listing of comments, as returned by
+            Reddit.
+        :param submission: The submission to assign to each comment (default:
+            None).
+
+        Unlike :meth:`.objectify`, the replies of each comment are built
+        iteratively, which avoids deep recursion for long chains of replies.
+
+        """
+        top_level = []
+        for _ in self._iter_comment_tree(children, top_level, submission):
+            pass
+        return top_level
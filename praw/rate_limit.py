@@ -0,0 +1,456 @@
+"""Provide the RateLimiter class and its state backends."""
+import asyncio
+import json
+import os
+import time
+from contextlib import contextmanager
+from logging import getLogger
+from threading import Lock, local
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+    import msvcrt
+
+logger = getLogger("praw")
+
+
+class RateLimitState:
+    """Interface for the storage of a :class:`.RateLimiter`'s bucket.
+
+    Subclasses provide :meth:`.transaction`, through which the rate limiter
+    reads and modifies the state while no other user of the same storage can.
+    The state is a dictionary with the keys ``remaining``, ``used``,
+    ``reset_timestamp``, ``tokens``, and ``refill_timestamp``, whose values
+    are numbers or ``None``.
+
+    """
+
+    INITIAL_STATE = {
+        "refill_timestamp": None,
+        "remaining": None,
+        "reset_timestamp": None,
+        "tokens": 0.0,
+        "used": None,
+    }
+
+    def peek(self) -> Dict[str, Any]:
+        """Return a copy of the current state."""
+        with self.transaction() as state:
+            return dict(state)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        """Provide exclusive access to the state for modification."""
+        raise NotImplementedError  # pragma: no cover
+        yield  # pragma: no cover
+
+
+class LocalRateLimitState(RateLimitState):
+    """Keep the state of a bucket in the memory of the current process."""
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state without its lock."""
+        return {"state": self._state}
+
+    def __init__(self):
+        """Initialize a LocalRateLimitState instance."""
+        self._lock = Lock()
+        self._state = dict(self.INITIAL_STATE)
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore the state from a pickle."""
+        self._lock = Lock()
+        self._state = state["state"]
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        """Provide exclusive access to the state for modification."""
+        with self._lock:
+            yield self._state
+
+
+class FileRateLimitState(RateLimitState):
+    """Share the state of a bucket between processes through a locked file.
+
+    Every process using the same ``path`` draws from a single budget. Use one
+    file per OAuth client, as Reddit accounts rate limits per client.
+
+    """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state without its lock."""
+        return {"path": self.path}
+
+    def __init__(self, path: str):
+        """Initialize a FileRateLimitState instance.
+
+        :param path: The path to the file holding the state. It is created
+            when missing.
+
+        """
+        self._lock = Lock()
+        self.path = path
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore the state from a pickle."""
+        self.__init__(state["path"])
+
+    @staticmethod
+    def _lock_file(descriptor, lock):
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX if lock else fcntl.LOCK_UN)
+        else:  # pragma: no cover
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            msvcrt.locking(
+                descriptor, msvcrt.LK_LOCK if lock else msvcrt.LK_UNLCK, 1
+            )
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        """Provide exclusive access to the state for modification."""
+        with self._lock:
+            descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                self._lock_file(descriptor, True)
+                try:
+                    with os.fdopen(descriptor, "r+", closefd=False) as fp:
+                        content = fp.read()
+                        state = dict(self.INITIAL_STATE)
+                        if content:
+                            state.update(json.loads(content))
+                        original = dict(state)
+                        yield state
+                        if state != original:
+                            fp.seek(0)
+                            fp.truncate()
+                            fp.write(json.dumps(state))
+                            fp.flush()
+                finally:
+                    self._lock_file(descriptor, False)
+            finally:
+                os.close(descriptor)
+
+
+class RateLimiter:
+    """Schedule requests to Reddit using a token bucket shared by threads.
+
+    A single instance is attached to every session of a :class:`.Reddit`
+    instance. It reads the ``X-Ratelimit-Remaining``, ``X-Ratelimit-Used``,
+    and ``X-Ratelimit-Reset`` headers of each response, and spreads the
+    remaining requests of the current window evenly over the time left in it.
+    Requests beyond one per second until the reset may be issued in a burst.
+    Threads that need to wait reserve their tokens in the order they arrived.
+
+    Each request consumes one token by default. Requests from a caller that
+    should leave more of the budget to others can be made to consume more
+    tokens with :meth:`.weight`.
+
+    Requests also belong to one of the priority classes in
+    :attr:`.PRIORITIES`, set with :meth:`.priority` or the ``priority``
+    argument of :meth:`.Reddit.request`:
+
+    * ``"high"`` requests never wait for tokens, only for the window to reset
+      when no requests remain. Moderation actions use this class.
+    * ``"normal"`` requests, the default, reserve their tokens in the order
+      they arrived.
+    * ``"low"`` requests only consume tokens that no other request has
+      reserved, and thus get whatever budget is left.
+
+    The bucket is stored in :attr:`.state`, which is kept in memory by
+    default. Processes that share an OAuth client can share a budget by using
+    a :class:`.FileRateLimitState` with the same path, for instance through
+    the ``ratelimit_state_file`` setting.
+
+    """
+
+    PRIORITIES = ("high", "normal", "low")
+
+    @staticmethod
+    def _capacity(state, seconds_to_reset):
+        return max(state["remaining"] - seconds_to_reset, 1.0)
+
+    @classmethod
+    def _check_priority(cls, priority):
+        if priority not in cls.PRIORITIES:
+            raise ValueError(
+                "`priority` must be one of {}.".format(
+                    ", ".join(repr(item) for item in cls.PRIORITIES)
+                )
+            )
+
+    @classmethod
+    def _refill(cls, state, now):
+        """Add the tokens accrued since the last refill.
+
+        Return False when the state of the current window is unknown.
+
+        """
+        if state["remaining"] is None:
+            return False
+        seconds_to_reset = state["reset_timestamp"] - now
+        if seconds_to_reset <= 0:
+            state["remaining"] = None
+            return False
+        rate = state["remaining"] / seconds_to_reset
+        state["tokens"] = min(
+            cls._capacity(state, seconds_to_reset),
+            state["tokens"] + (now - state["refill_timestamp"]) * rate,
+        )
+        state["refill_timestamp"] = now
+        return True
+
+    @classmethod
+    def _reserve(cls, state, weight, now, priority="normal"):
+        """Consume the tokens of a request and return the seconds to wait.
+
+        Tokens may be consumed ahead of their accrual, in which case a
+        ``"normal"`` caller waits until the bucket is no longer in debt, and a
+        ``"high"`` caller does not wait at all. A ``"low"`` caller consumes
+        nothing until enough tokens are available, and is instead told how
+        long to wait before trying again.
+
+        """
+        if not cls._refill(state, now):
+            return 0
+        seconds_to_reset = state["reset_timestamp"] - now
+        if state["remaining"] < 1:
+            return seconds_to_reset
+        rate = state["remaining"] / seconds_to_reset
+        weight = min(weight, cls._capacity(state, seconds_to_reset))
+        if priority == "low" and state["tokens"] < weight:
+            return (weight - state["tokens"]) / rate
+        state["tokens"] -= weight
+        state["remaining"] -= 1
+        state["used"] += 1
+        if priority == "high":
+            return 0
+        return max(-state["tokens"] / rate, 0)
+
+    @property
+    def budget(self) -> Optional[float]:
+        """Return the number of tokens that can be consumed without waiting.
+
+        The value is ``None`` until a response providing rate limit headers
+        has been received, or once the current window has reset.
+
+        """
+        state = self.state.peek()
+        if not self._refill(state, time.time()):
+            return None
+        return max(min(state["tokens"], state["remaining"]), 0)
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Return the number of requests remaining in the current window."""
+        return self.state.peek()["remaining"]
+
+    @property
+    def reset_timestamp(self) -> Optional[float]:
+        """Return the unix timestamp at which the current window resets."""
+        return self.state.peek()["reset_timestamp"]
+
+    @property
+    def used(self) -> Optional[int]:
+        """Return the number of requests made in the current window."""
+        return self.state.peek()["used"]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state of the rate limiter without its thread state."""
+        return {"state": self.state}
+
+    def __init__(self, state: Optional[RateLimitState] = None):
+        """Initialize a RateLimiter instance.
+
+        :param state: An instance of :class:`.RateLimitState` holding the
+            bucket (default: a new :class:`.LocalRateLimitState`).
+
+        """
+        self._local = local()
+        self.state = LocalRateLimitState() if state is None else state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore the rate limiter from a pickle."""
+        self.__init__(state["state"])
+
+    def call(
+        self,
+        request_function: Callable[..., Any],
+        set_header_callback: Callable[[], Dict[str, str]],
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        """Rate limit the call to ``request_function``.
+
+        :param request_function: A function call that returns an HTTP response
+            object.
+        :param set_header_callback: A callback function used to set the request
+            headers. This callback is called after any necessary sleep time
+            occurs.
+
+        Additional positional and keyword arguments are passed to
+        ``request_function``.
+
+        """
+        self.delay()
+        kwargs["headers"] = set_header_callback()
+        response = request_function(*args, **kwargs)
+        self.update(response.headers)
+        return response
+
+    def bind(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``function`` bound to the current thread's request settings.
+
+        :param function: The callable to wrap.
+
+        The weight and priority set with :meth:`.weight` and :meth:`.priority`
+        apply to the thread that set them. Use this method to carry them over
+        to a callable that runs in another thread.
+
+        """
+        priority = getattr(self._local, "priority", "normal")
+        weight = getattr(self._local, "weight", 1)
+
+        def bound(*args, **kwargs):
+            with self.priority(priority), self.weight(weight):
+                return function(*args, **kwargs)
+
+        return bound
+
+    def _delays(
+        self, priority: Optional[str] = None, weight: Optional[float] = None
+    ) -> Iterator[float]:
+        """Reserve the tokens of a request and yield the seconds to wait.
+
+        ``priority`` and ``weight`` default to those of the current thread.
+
+        """
+        if priority is None:
+            priority = getattr(self._local, "priority", "normal")
+        if weight is None:
+            weight = getattr(self._local, "weight", 1)
+        while True:
+            with self.state.transaction() as state:
+                sleep_seconds = self._reserve(
+                    state, weight, time.time(), priority
+                )
+            if sleep_seconds <= 0:
+                return
+            logger.debug(
+                "Rate limit budget exhausted, sleeping {:.2f} seconds".format(
+                    sleep_seconds
+                )
+            )
+            yield sleep_seconds
+            if priority != "low":
+                return
+
+    async def async_delay(
+        self, priority: Optional[str] = None, weight: Optional[float] = None
+    ):
+        """Wait on the event loop until a request may be issued.
+
+        :param priority: The priority class of the request (default: the
+            priority set with :meth:`.priority`, otherwise ``"normal"``).
+        :param weight: The number of tokens the request consumes (default: the
+            weight set with :meth:`.weight`, otherwise 1).
+
+        Like :meth:`.delay`, but waits with :py:func:`asyncio.sleep`, so that
+        other coroutines run in the meantime. As coroutines share the thread
+        of their event loop, pass ``priority`` and ``weight`` rather than
+        relying on the context managers, whose settings would also apply to
+        the coroutines that run while this one waits.
+
+        """
+        self._check_priority(priority or "normal")
+        for sleep_seconds in self._delays(priority, weight):
+            await asyncio.sleep(sleep_seconds)
+
+    def delay(self):
+        """Sleep until the current thread may issue a request."""
+        for sleep_seconds in self._delays():
+            time.sleep(sleep_seconds)
+
+    @contextmanager
+    def priority(self, priority: str) -> Iterator[None]:
+        """Set the priority class of requests from the current thread.
+
+        :param priority: One of ``"high"``, ``"normal"``, or ``"low"``.
+
+        For example, to have a crawl only use the budget left over by the
+        other threads sharing the instance:
+
+        .. code-block:: python
+
+           with reddit.rate_limiter.priority("low"):
+               for submission in reddit.subreddit("all").new(limit=None):
+                   process(submission)
+
+        """
+        self._check_priority(priority)
+        previous = getattr(self._local, "priority", "normal")
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def update(self, response_headers: Dict[str, str]):
+        """Update the state of the bucket from a response's headers.
+
+        Responses without rate limit headers do not change the state, as the
+        request was already accounted for by :meth:`.delay`. The tokens are
+        set from the headers alone when they start a new window.
+
+        """
+        if "x-ratelimit-remaining" not in response_headers:
+            return
+        now = time.time()
+        reset = int(response_headers["x-ratelimit-reset"])
+        with self.state.transaction() as state:
+            # Reddit sends a reset of 0 at the boundary of its windows
+            new_window = (
+                state["remaining"] is None
+                or state["reset_timestamp"] <= now
+                or reset <= 0
+            )
+            state["remaining"] = float(
+                response_headers["x-ratelimit-remaining"]
+            )
+            state["used"] = int(response_headers["x-ratelimit-used"])
+            state["reset_timestamp"] = now + reset
+            seconds_to_reset = max(reset, 1)
+            if new_window:
+                state["tokens"] = self._capacity(state, seconds_to_reset)
+                state["refill_timestamp"] = now
+            else:
+                self._refill(state, now)
+                state["tokens"] = min(
+                    state["tokens"], self._capacity(state, seconds_to_reset)
+                )
+
+    @contextmanager
+    def weight(self, weight: float) -> Iterator[None]:
+        """Set the number of tokens used by requests from the current thread.
+
+        :param weight: The number of tokens each request consumes.
+
+        Reddit still counts every request once, but a weighted request has to
+        wait for more tokens to accrue. For example, to have a bulk job leave
+        most of the budget to the other threads sharing the instance:
+
+        .. code-block:: python
+
+           with reddit.rate_limiter.weight(3):
+               for submission in reddit.subreddit("all").new(limit=None):
+                   process(submission)
+
+        """
+        previous = getattr(self._local, "weight", 1)
+        self._local.weight = weight
+        try:
+            yield
+        finally:
+            self._local.weight = previous
@@ -1,8 +1,10 @@
 """Provide the Reddit class."""
 import configparser
+import hashlib
 import os
 import re
 import time
+from functools import partial
 from itertools import islice
 from logging import getLogger
 from typing import IO, Any, Dict, Generator, Iterable, Optional, Type, Union
@@ -30,6 +32,10 @@ from .exceptions import (
     RedditAPIException,
 )
 from .objector import Objector
+from .rate_limit import FileRateLimitState, RateLimiter
+from .response_cache import ResponseCache
+from .util.json_backend import JSONBackend
+from .util.single_flight import SingleFlight
 
 try:
     from update_checker import update_check
@@ -126,6 +132,7 @@ class Reddit:
         config_interpolation: Optional[str] = None,
         requestor_class: Optional[Type[Requestor]] = None,
         requestor_kwargs: Dict[str, Any] = None,
+        response_cache: Optional[ResponseCache] = None,
         **config_settings: str
     ):  # noqa: D207, D301
         """Initialize a Reddit instance.
@@ -142,6 +149,9 @@ class Reddit:
             requestor. If not set, use ``prawcore.Requestor`` (default: None).
         :param requestor_kwargs: Dictionary with additional keyword arguments
             used to initialize the requestor (default: None).
+        :param response_cache: An instance of :class:`.ResponseCache` used to
+            serve repeated reads of slow-changing endpoints without issuing
+            requests (default: None).
 
         Additional keyword arguments will be used to initialize the
         :class:`.Config` object. This can be used to specify configuration
@@ -180,6 +190,8 @@ class Reddit:
         """
         self._core = self._authorized_core = self._read_only_core = None
         self._objector = None
+        self._single_flight = SingleFlight()
+        self.response_cache = response_cache
         self._unique_counter = 0
         self._validate_on_submit = False
 
@@ -226,7 +238,29 @@ class Reddit:
             )
 
         self._check_for_update()
+        self._json_backend = JSONBackend(self.config.json_backend)
         self._prepare_objector()
+
+        rate_limit_state = None
+        if self.config.ratelimit_state_file:
+            rate_limit_state = FileRateLimitState(
+                os.path.expanduser(self.config.ratelimit_state_file)
+            )
+        self.rate_limiter = RateLimiter(rate_limit_state)
+        """An instance of :class:`.RateLimiter`.
+
+        Schedules the requests of every thread using this instance according
+        to the rate limit reported by Reddit. When the
+        ``ratelimit_state_file`` setting is provided, the budget is shared
+        with every process using the same file. For example, to see how many
+        requests can be issued right away run:
+
+        .. code-block:: python
+
+           print(reddit.rate_limiter.budget)
+
+        """
+
         self._prepare_prawcore(requestor_class, requestor_kwargs)
 
         self.auth = models.Auth(self, None)
@@ -355,6 +389,27 @@ class Reddit:
 
         """
 
+    def _cache_identity(self):
+        """Return a string identifying the user that responses are for.
+
+        Tokens are hashed, so that they are not stored by the response cache.
+
+        """
+        if self.read_only:
+            return ""
+        authorizer = self._core._authorizer
+        if isinstance(authorizer, ScriptAuthorizer):
+            return "user:{}".format(self.config.username.lower())
+        token = (
+            getattr(authorizer, "refresh_token", None)
+            or authorizer.access_token
+        )
+        if token is None:
+            return ""
+        return "token:{}".format(
+            hashlib.sha256(token.encode("utf-8")).hexdigest()
+        )
+
     def _check_for_update(self):
         if UPDATE_CHECKER_MISSING:
             return
@@ -401,7 +456,18 @@ class Reddit:
             "textarea": models.TextArea,
             "widget": models.Widget,
         }
-        self._objector = Objector(self, mappings)
+        compact_mappings = dict(
+            mappings,
+            **{
+                self.config.kinds["comment"]: models.CompactComment,
+                self.config.kinds["submission"]: models.CompactSubmission,
+            }
+        )
+        self._compact_objector = Objector(self, compact_mappings)
+        if self.config.compact_models:
+            self._objector = self._compact_objector
+        else:
+            self._objector = Objector(self, mappings)
 
     def _prepare_prawcore(self, requestor_class=None, requestor_kwargs=None):
         requestor_class = requestor_class or Requestor
@@ -413,6 +479,7 @@ class Reddit:
             self.config.reddit_url,
             **requestor_kwargs
         )
+        requestor.request = self._json_backend.wrap(requestor.request)
 
         if self.config.client_secret:
             self._prepare_trusted_prawcore(requestor)
@@ -427,16 +494,18 @@ class Reddit:
             self.config.redirect_uri,
         )
         read_only_authorizer = ReadOnlyAuthorizer(authenticator)
-        self._read_only_core = session(read_only_authorizer)
+        self._read_only_core = self._session(read_only_authorizer)
 
         if self.config.username and self.config.password:
             script_authorizer = ScriptAuthorizer(
                 authenticator, self.config.username, self.config.password
             )
-            self._core = self._authorized_core = session(script_authorizer)
+            self._core = self._authorized_core = self._session(
+                script_authorizer
+            )
         elif self.config.refresh_token:
             authorizer = Authorizer(authenticator, self.config.refresh_token)
-            self._core = self._authorized_core = session(authorizer)
+            self._core = self._authorized_core = self._session(authorizer)
         else:
             self._core = self._read_only_core
 
@@ -445,13 +514,60 @@ class Reddit:
             requestor, self.config.client_id, self.config.redirect_uri
         )
         read_only_authorizer = DeviceIDAuthorizer(authenticator)
-        self._read_only_core = session(read_only_authorizer)
+        self._read_only_core = self._session(read_only_authorizer)
         if self.config.refresh_token:
             authorizer = Authorizer(authenticator, self.config.refresh_token)
-            self._core = self._authorized_core = session(authorizer)
+            self._core = self._authorized_core = self._session(authorizer)
         else:
             self._core = self._read_only_core
 
+    def _request(self, method, path, params, data, files=None, json=None):
+        try:
+            return self._core.request(
+                method,
+                path,
+                data=data,
+                files=files,
+                params=params,
+                timeout=self.config.timeout,
+                json=json,
+            )
+        except BadRequest as exception:
+            self._raise_bad_request(exception)
+
+    @staticmethod
+    def _raise_bad_request(exception: BadRequest):
+        """Raise the :class:`.RedditAPIException` described by ``exception``.
+
+        ``exception`` itself is raised again when it does not describe one.
+
+        """
+        try:
+            data = exception.response.json()
+        except ValueError:
+            # TODO: Remove this exception after 2020-12-31 if no one has
+            # filed a bug against it.
+            raise Exception(
+                "Unexpected BadRequest without json body. Please file a "
+                "bug at https://github.com/praw-dev/praw/issues"
+            ) from exception
+        if set(data) == {"error", "message"}:
+            raise exception
+        if "fields" in data:
+            assert len(data["fields"]) == 1
+            field = data["fields"][0]
+        else:
+            field = None
+        raise RedditAPIException(
+            [data["reason"], data["explanation"], field]
+        ) from exception
+
+    def _session(self, authorizer):
+        """Return a prawcore session that uses the shared rate limiter."""
+        core = session(authorizer)
+        core._rate_limiter = self.rate_limiter
+        return core
+
     def comment(
         self,  # pylint: disable=invalid-name
         id: Optional[str] = None,  # pylint: disable=redefined-builtin
@@ -496,13 +612,18 @@ class Reddit:
         self,
         fullnames: Optional[Iterable[str]] = None,
         url: Optional[str] = None,
-    ) -> Generator[Union[Subreddit, Comment, Submission], None, None]:
+        raw: bool = False,
+    ) -> Generator[
+        Union[Subreddit, Comment, Submission, Dict[str, Any]], None, None
+    ]:
         """Fetch information about each item in ``fullnames`` or from ``url``.
 
         :param fullnames: A list of fullnames for comments, submissions, and/or
             subreddits.
         :param url: A url (as a string) to retrieve lists of link submissions
             from.
+        :param raw: When ``True``, yield the data of each item as a dictionary,
+            as returned by Reddit, instead of a model (default: False).
         :returns: A generator that yields found items in their relative order.
 
         Items that cannot be matched will not be generated. Requests will be
@@ -526,6 +647,12 @@ class Reddit:
                 "Mutually exclusive parameters: `fullnames`, `url`"
             )
 
+        def fetch(params):
+            if raw:
+                listing = self.request("GET", API_PATH["info"], params=params)
+                return [child["data"] for child in listing["data"]["children"]]
+            return self.get(API_PATH["info"], params=params)
+
         if fullnames is not None:
             if isinstance(fullnames, str):
                 raise TypeError("`fullnames` must be a non-str iterable.")
@@ -537,15 +664,13 @@ class Reddit:
                     if not chunk:
                         break
 
-                    params = {"id": ",".join(chunk)}
-                    for result in self.get(API_PATH["info"], params=params):
+                    for result in fetch({"id": ",".join(chunk)}):
                         yield result
 
             return generator(fullnames)
 
         def generator(url):
-            params = {"url": url}
-            for result in self.get(API_PATH["info"], params=params):
+            for result in fetch({"url": url}):
                 yield result
 
         return generator(url)
@@ -762,6 +887,7 @@ class Reddit:
         ] = None,
         files: Optional[Dict[str, IO]] = None,
         json=None,
+        priority: Optional[str] = None,
     ) -> Any:
         """Return the parsed JSON data returned from a request to URL.
 
@@ -776,42 +902,48 @@ class Reddit:
         :param json: JSON-serializable object to send in the body
             of the request with a Content-Type header of application/json
             (default: None). If ``json`` is provided, ``data`` should not be.
+        :param priority: The priority class of the request, one of ``"high"``,
+            ``"normal"``, or ``"low"`` (default: the priority set with
+            :meth:`.RateLimiter.priority`, otherwise ``"normal"``).
 
         """
         if data and json:
             raise ClientException(
                 "At most one of `data` and `json` is supported."
             )
-        try:
-            return self._core.request(
+        if priority is not None:
+            with self.rate_limiter.priority(priority):
+                return self.request(
+                    method,
+                    path,
+                    params=params,
+                    data=data,
+                    files=files,
+                    json=json,
+                )
+        if files or json is not None:
+            return self._request(method, path, params, data, files, json)
+        request_function = partial(self._request, method, path, params, data)
+        if method == "GET" and not data and self.config.coalesce_requests:
+            if isinstance(params, dict):
+                key = tuple(sorted(params.items()))
+            else:
+                key = params
+            request_function = partial(
+                self._single_flight.call,
+                (self._core, path.strip("/"), key),
+                request_function,
+            )
+        if self.response_cache is not None:
+            return self.response_cache.fetch(
+                request_function,
                 method,
                 path,
-                data=data,
-                files=files,
                 params=params,
-                timeout=self.config.timeout,
-                json=json,
+                data=data,
+                identity=self._cache_identity(),
             )
-        except BadRequest as exception:
-            try:
-                data = exception.response.json()
-            except ValueError:
-                # TODO: Remove this exception after 2020-12-31 if no one has
-                # filed a bug against it.
-                raise Exception(
-                    "Unexpected BadRequest without json body. Please file a "
-                    "bug at https://github.com/praw-dev/praw/issues"
-                ) from exception
-            if set(data) == {"error", "message"}:
-                raise
-            if "fields" in data:
-                assert len(data["fields"]) == 1
-                field = data["fields"][0]
-            else:
-                field = None
-            raise RedditAPIException(
-                [data["reason"], data["explanation"], field]
-            ) from exception
+        return request_function()
 
     def submission(  # pylint: disable=invalid-name,redefined-builtin
         self, id: Optional[str] = None, url: Optional[str] = None
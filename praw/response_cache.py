@@ -0,0 +1,220 @@
+"""Provide the ResponseCache class."""
+import json
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Union
+
+from .endpoints import API_PATH
+from .util.cache import copy_json
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """Cache the decoded responses of slow-changing endpoints.
+
+    A cache is enabled by passing it to :class:`.Reddit` through the
+    ``response_cache`` argument:
+
+    .. code-block:: python
+
+       from praw import Reddit, ResponseCache
+
+       cache = ResponseCache(ttls={"subreddit_about": 30, "rules": 600})
+       reddit = Reddit(..., response_cache=cache)
+
+    Only requests to the endpoints in :attr:`.ttls` are cached, and only when
+    they are made with the GET method, or with the POST method to one of the
+    endpoints in :attr:`.POST_ENDPOINTS`, which only read data. Responses are
+    stored by user, method, path, query parameters, and form data, as some of
+    them, such as those of ``subreddit_about``, include fields that depend on
+    the user. A cached response is returned without issuing a request or
+    decoding JSON, until its time to live expires.
+
+    .. note:: Changes made through PRAW are not reflected by cached responses
+       until they expire. Use :meth:`.clear` after such changes if needed.
+
+    """
+
+    DEFAULT_TTLS = {
+        "emoji_list": 300,
+        "flairselector": 300,
+        "post_requirements": 300,
+        "removal_reasons_list": 300,
+        "rules": 300,
+        "subreddit_about": 60,
+        "widgets": 300,
+    }
+    POST_ENDPOINTS = frozenset({"flairselector"})
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the settings of the cache without its entries."""
+        return {
+            "max_entries": self.max_entries,
+            "path": self.path,
+            "ttls": self.ttls,
+        }
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+    ):
+        """Initialize a ResponseCache instance.
+
+        :param ttls: A dictionary mapping the names of endpoints in
+            ``praw.endpoints.API_PATH`` to the number of seconds their
+            responses are kept (default: :attr:`.DEFAULT_TTLS`).
+        :param max_entries: The number of responses kept in memory. The least
+            recently used response is discarded when more are stored (default:
+            1024).
+        :param path: The path to an SQLite database in which responses are
+            also stored, so that they outlive the process (default: None).
+
+        """
+        self._lock = Lock()
+        self._memory = OrderedDict()
+        self.max_entries = max_entries
+        self.path = path
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self._patterns = [
+            (self._compile(API_PATH[name]), name) for name in self.ttls
+        ]
+        self._database = None
+        if path is not None:
+            self._database = sqlite3.connect(path, check_same_thread=False)
+            self._database.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, expires REAL, body TEXT)"
+            )
+            self._database.commit()
+
+    def __len__(self) -> int:
+        """Return the number of responses held in memory."""
+        return len(self._memory)
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore the cache from a pickle."""
+        self.__init__(**state)
+
+    def _cacheable(self, method, endpoint, data):
+        if method == "GET":
+            return True
+        return (
+            method == "POST"
+            and endpoint in self.POST_ENDPOINTS
+            and (data is None or isinstance(data, dict))
+        )
+
+    @staticmethod
+    def _compile(template):
+        pattern = re.sub(
+            r"\\\{\w+\\\}", "[^/]+", re.escape(template.strip("/"))
+        )
+        return re.compile(pattern + "$", re.IGNORECASE)
+
+    @staticmethod
+    def _key(identity, method, path, params, data):
+        def normalize(value):
+            if isinstance(value, dict):
+                return sorted((str(k), str(v)) for k, v in value.items())
+            return value
+
+        return json.dumps(
+            [identity, method, path, normalize(params), normalize(data)],
+            separators=(",", ":"),
+        )
+
+    def _endpoint(self, path: str) -> Optional[str]:
+        for pattern, name in self._patterns:
+            if pattern.match(path):
+                return name
+        return None
+
+    def _load(self, key, now):
+        value = self._memory.get(key, _MISSING)
+        if value is not _MISSING:
+            expires, response = value
+            if expires > now:
+                self._memory.move_to_end(key)
+                return response
+            del self._memory[key]
+        if self._database is None:
+            return _MISSING
+        row = self._database.execute(
+            "SELECT expires, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or row[0] <= now:
+            return _MISSING
+        response = json.loads(row[1])
+        self._remember(key, row[0], response)
+        return response
+
+    def _remember(self, key, expires, response):
+        self._memory[key] = (expires, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _store(self, key, expires, response):
+        self._remember(key, expires, response)
+        if self._database is not None:
+            self._database.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, expires, json.dumps(response)),
+            )
+            self._database.commit()
+
+    def clear(self):
+        """Discard every cached response."""
+        with self._lock:
+            self._memory.clear()
+            if self._database is not None:
+                self._database.execute("DELETE FROM responses")
+                self._database.commit()
+
+    def fetch(
+        self,
+        request_function: Callable[[], Any],
+        method: str,
+        path: str,
+        params: Optional[Union[str, Dict[str, Any]]] = None,
+        data: Optional[Any] = None,
+        identity: str = "",
+    ) -> Any:
+        """Return a cached response, or the result of ``request_function``.
+
+        :param request_function: A callable issuing the request and returning
+            its decoded JSON.
+        :param method: The HTTP method of the request.
+        :param path: The path of the request.
+        :param params: The query parameters of the request (default: None).
+        :param data: The form data of the request (default: None).
+        :param identity: A string identifying the user the request is made
+            for. Cached responses are only returned for the same identity
+            (default: "", for requests made without a user).
+
+        Requests that are not cacheable are passed through to
+        ``request_function``.
+
+        """
+        path = path.strip("/")
+        endpoint = self._endpoint(path)
+        if (
+            endpoint is None
+            or self.ttls[endpoint] <= 0
+            or not self._cacheable(method, endpoint, data)
+        ):
+            return request_function()
+        key = self._key(identity, method, path, params, data)
+        with self._lock:
+            response = self._load(key, time.time())
+        if response is _MISSING:
+            response = request_function()
+            with self._lock:
+                self._store(key, time.time() + self.ttls[endpoint], response)
+        return copy_json(response)
@@ -44,3 +44,17 @@ class cachedproperty:
     def __repr__(self) -> str:
         """Return repr(self)."""
         return "<%s %s>" % (self.__class__.__name__, self.func)
+
+
+def copy_json(value: Any) -> Any:
+    """Return a copy of decoded JSON that shares no mutable containers.
+
+    This is considerably faster than both :func:`copy.deepcopy` and decoding
+    the JSON again, as only dictionaries and lists need to be copied.
+
+    """
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
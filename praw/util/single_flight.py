@@ -0,0 +1,66 @@
+"""Provide the SingleFlight class."""
+from threading import Event, Lock
+from typing import Any, Callable, Hashable, Tuple
+
+from .cache import copy_json
+
+
+class _Call:
+    def __init__(self):
+        self.done = Event()
+        self.exception = None
+        self.result = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share the result of a call among threads making an identical call.
+
+    The first thread to call :meth:`.call` with a given key runs the function.
+    Threads calling with the same key while it runs wait for it to finish and
+    receive a copy of its decoded JSON result, or the exception it raised.
+
+    """
+
+    def __init__(self):
+        """Initialize a SingleFlight instance."""
+        self._calls = {}
+        self._lock = Lock()
+
+    def __reduce__(self) -> Tuple[type, Tuple]:
+        """Pickle a new instance, as calls in progress cannot be shared."""
+        return (self.__class__, ())
+
+    def call(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Return the result of ``function``, sharing it with identical calls.
+
+        :param key: A value identifying the call.
+        :param function: The function to call when no identical call is in
+            progress.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return copy_json(call.result)
+        try:
+            call.result = function()
+        except Exception as exception:
+            call.exception = exception
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        if call.waiters:
+            return copy_json(call.result)
+        return call.result
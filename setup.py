@@ -14,6 +14,7 @@ with open(path.join(HERE, PACKAGE_NAME, "const.py"), encoding="utf-8") as fp:
     VERSION = re.search('__version__ = "([^"]+)"', fp.read()).group(1)
 
 extras = {
+    "async": ["aiohttp >=3.5, <4"],
     "ci": ["coveralls"],
     "dev": ["pre-commit"],
     "lint": [
@@ -1,4 +1,6 @@
 """Test praw.models.listing.generator."""
+from praw.models import Comment, Submission
+
 from ... import IntegrationTest
 
 
@@ -25,3 +27,24 @@ class TestListingGenerator(IntegrationTest):
         with self.recorder.use_cassette("TestListingGenerator.test_no_items"):
             submissions = list(self.reddit.redditor("spez").top("hour"))
         assert len(submissions) == 0
+
+    def test_exhaust_items__prefetch(self):
+        with self.recorder.use_cassette(
+            "TestListingGenerator.test_exhaust_items"
+        ):
+            submissions = list(
+                self.reddit.redditor("spez").top(limit=None, prefetch=2)
+            )
+        assert len(submissions) > 100
+
+    def test_exhaust_items__lazy(self):
+        with self.recorder.use_cassette(
+            "TestListingGenerator.test_exhaust_items"
+        ):
+            submissions = list(
+                self.reddit.redditor("spez").top(limit=None, lazy=True)
+            )
+        assert len(submissions) > 100
+        assert all(
+            isinstance(item, (Comment, Submission)) for item in submissions
+        )
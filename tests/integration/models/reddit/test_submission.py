@@ -16,6 +16,26 @@ class TestSubmission(IntegrationTest):
             assert isinstance(submission.comments[0], Comment)
             assert isinstance(submission.comments[0].replies[0], Comment)
 
+    def test_iter_comments(self):
+        with self.recorder.use_cassette(
+            "TestCommentForest.test_replace__all",
+            match_requests_on=["uri", "method", "body"],
+        ):
+            submission = Submission(self.reddit, "3hahrw")
+            comments = list(submission.iter_comments())
+            forest = submission.comments.list()
+            assert len(comments) > 1
+            assert all(isinstance(comment, Comment) for comment in comments)
+            assert sorted(comments, key=id) == sorted(
+                (
+                    comment
+                    for comment in forest
+                    if isinstance(comment, Comment)
+                ),
+                key=id,
+            )
+            assert all(comment.submission is submission for comment in forest)
+
     def test_clear_vote(self):
         self.reddit.read_only = False
         with self.recorder.use_cassette("TestSubmission.test_clear_vote"):
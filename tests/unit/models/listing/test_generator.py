@@ -1,13 +1,277 @@
 """Test praw.models.front."""
+from unittest import mock
+
+import pytest
+
+from praw.exceptions import ClientException
+from praw.models import CompactSubmission, Listing, Submission, Subreddit
 from praw.models.listing.generator import ListingGenerator
+from praw.models.listing.listing import LazyChildren
 
 from ... import UnitTest
 
 
 class TestListingGenerator(UnitTest):
+    @staticmethod
+    def _raw_page(after, ids):
+        return {
+            "kind": "Listing",
+            "data": {
+                "after": after,
+                "children": [
+                    {"kind": "t3", "data": {"id": id_, "title": id_}}
+                    for id_ in ids
+                ],
+            },
+        }
+
+    def test_compact(self):
+        with mock.patch.object(
+            self.reddit,
+            "request",
+            return_value=self._raw_page(None, ["a", "b"]),
+        ):
+            generator = ListingGenerator(self.reddit, "url", compact=True)
+            items = list(generator)
+        assert all(isinstance(item, CompactSubmission) for item in items)
+        assert [item.title for item in items] == ["a", "b"]
+        assert isinstance(generator._listing.children, LazyChildren)
+
+    def test_fields(self):
+        page = self._raw_page(None, ["a"])
+        page["data"]["children"][0]["data"].update(name="t3_a", score=1)
+        page["data"]["children"].append(
+            {"kind": "more", "data": {"children": ["b"], "id": "b"}}
+        )
+        with mock.patch.object(self.reddit, "request", return_value=page):
+            generator = ListingGenerator(self.reddit, "url", fields=["score"])
+            submission, more = list(generator)
+        assert vars(submission) == {
+            "_comments_by_id": {},
+            "_fetched": False,
+            "_reddit": self.reddit,
+            "comment_limit": 2048,
+            "comment_sort": "confidence",
+            "id": "a",
+            "name": "t3_a",
+            "score": 1,
+        }
+        assert more.children == ["b"]
+
+    def test_fields__compact(self):
+        with mock.patch.object(
+            self.reddit, "request", return_value=self._raw_page(None, ["a"])
+        ):
+            generator = ListingGenerator(
+                self.reddit, "url", compact=True, fields=[]
+            )
+            submission = next(generator)
+        assert isinstance(submission, CompactSubmission)
+        assert submission.id == "a"
+        assert submission._overflow_values == ()
+
+    def test_fields__comment(self):
+        page = {
+            "kind": "Listing",
+            "data": {
+                "after": None,
+                "children": [{"kind": "t1", "data": {"body": "a", "id": "a"}}],
+            },
+        }
+        with mock.patch.object(self.reddit, "request", return_value=page):
+            comment = next(ListingGenerator(self.reddit, "url", fields=[]))
+        with pytest.raises(AttributeError):
+            comment.body
+
+    def test_fields__str_field(self):
+        page = {
+            "kind": "Listing",
+            "data": {
+                "after": None,
+                "children": [
+                    {
+                        "kind": "t5",
+                        "data": {
+                            "display_name": "redditdev",
+                            "id": "2qizd",
+                            "name": "t5_2qizd",
+                            "subscribers": 1,
+                            "title": "redditdev",
+                        },
+                    }
+                ],
+            },
+        }
+        with mock.patch.object(self.reddit, "request", return_value=page):
+            generator = ListingGenerator(
+                self.reddit, "url", fields=["subscribers"]
+            )
+            subreddit = next(generator)
+        assert isinstance(subreddit, Subreddit)
+        assert str(subreddit) == "redditdev"
+        assert subreddit.subscribers == 1
+        assert "title" not in vars(subreddit)
+
+    def test_fields__stream(self):
+        subreddit = self.reddit.subreddit("redditdev")
+        with mock.patch.object(
+            self.reddit, "request", return_value=self._raw_page(None, ["a"])
+        ) as mock_request:
+            stream = subreddit.stream.submissions(fields=["score"])
+            submission = next(stream)
+        assert "title" not in vars(submission)
+        assert mock_request.call_args[1]["params"]["limit"] == 100
+
+    def test_raw(self):
+        pages = [
+            self._raw_page("t3_b", ["a", "b"]),
+            self._raw_page(None, ["c"]),
+        ]
+        with mock.patch.object(self.reddit, "request", side_effect=pages):
+            generator = ListingGenerator(
+                self.reddit, "url", limit=None, raw=True
+            )
+            items = list(generator)
+        assert items == [
+            {"id": "a", "title": "a"},
+            {"id": "b", "title": "b"},
+            {"id": "c", "title": "c"},
+        ]
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_raw__stream(self, _):
+        pages = [
+            self._raw_page(None, ["b", "a"]),
+            self._raw_page(None, ["c", "b"]),
+        ]
+        for page in pages:
+            for child in page["data"]["children"]:
+                child["data"]["name"] = "t3_" + child["data"]["id"]
+        subreddit = self.reddit.subreddit("redditdev")
+        with mock.patch.object(
+            self.reddit, "request", side_effect=pages
+        ) as mock_request:
+            stream = subreddit.stream.submissions(raw=True)
+            assert [next(stream)["id"] for _ in range(3)] == ["a", "b", "c"]
+        assert mock_request.call_args[1]["params"]["before"] == "t3_b"
+
+    def test_lazy(self):
+        pages = [
+            self._raw_page("t3_b", ["a", "b"]),
+            self._raw_page(None, ["c"]),
+        ]
+        with mock.patch.object(
+            self.reddit, "request", side_effect=pages
+        ) as mock_request:
+            generator = ListingGenerator(
+                self.reddit, "url", limit=None, lazy=True
+            )
+            first = next(generator)
+            assert isinstance(first, Submission)
+            assert first.id == "a"
+            assert generator._listing.children.parsed == 1
+            assert [item.id for item in generator] == ["b", "c"]
+        assert mock_request.call_count == 2
+        mock_request.assert_called_with(
+            "GET", "url", params={"after": "t3_b", "limit": 1024}
+        )
+
+    def test_lazy__duplicates(self):
+        page = self._raw_page(None, ["b"])
+        with mock.patch.object(
+            self.reddit,
+            "request",
+            return_value=[self._raw_page(None, ["a"]), page],
+        ):
+            generator = ListingGenerator(self.reddit, "url", lazy=True)
+            assert [item.id for item in generator] == ["b"]
+
+    def test_lazy__not_a_listing(self):
+        with mock.patch.object(
+            self.reddit,
+            "request",
+            return_value={"users": [{"user": "spez"}], "next": None},
+        ):
+            generator = ListingGenerator(self.reddit, "url", lazy=True)
+            assert next(generator)["user"] == "spez"
+
     def test_params_are_not_modified(self):
         params = {"prawtest": "yes"}
         generator = ListingGenerator(None, None, params=params)
         assert "limit" in generator.params
         assert "limit" not in params
         assert ("prawtest", "yes") in generator.params.items()
+
+    @staticmethod
+    def _pages(reddit, count):
+        pages = []
+        for index in range(count):
+            after = "t3_{}".format(index) if index < count - 1 else None
+            pages.append(
+                Listing(
+                    reddit,
+                    _data={
+                        "after": after,
+                        "children": [
+                            {"page": index, "item": item} for item in range(2)
+                        ],
+                    },
+                )
+            )
+        return pages
+
+    def test_prefetch(self):
+        pages = self._pages(self.reddit, 3)
+        with mock.patch.object(
+            self.reddit, "get", side_effect=pages
+        ) as mock_get:
+            generator = ListingGenerator(
+                self.reddit, "url", limit=None, prefetch=2
+            )
+            items = list(generator)
+        assert [(item["page"], item["item"]) for item in items] == [
+            (page, item) for page in range(3) for item in range(2)
+        ]
+        assert mock_get.call_count == 3
+        assert [
+            call[1]["params"].get("after") for call in mock_get.call_args_list
+        ] == [None, "t3_0", "t3_1"]
+
+    def test_prefetch__close(self):
+        pages = self._pages(self.reddit, 10)
+        with mock.patch.object(self.reddit, "get", side_effect=pages):
+            generator = ListingGenerator(
+                self.reddit, "url", limit=None, prefetch=1
+            )
+            assert next(generator)["page"] == 0
+            generator.close()
+            generator._prefetcher._thread.join(timeout=5)
+            assert not generator._prefetcher._thread.is_alive()
+            with pytest.raises(StopIteration):
+                next(generator)
+
+    def test_prefetch__exception(self):
+        with mock.patch.object(
+            self.reddit, "get", side_effect=ClientException("error")
+        ):
+            generator = ListingGenerator(self.reddit, "url", prefetch=1)
+            with pytest.raises(ClientException):
+                next(generator)
+
+    def test_prefetch__retry_after_exception(self):
+        pages = self._pages(self.reddit, 3)
+        with mock.patch.object(
+            self.reddit,
+            "get",
+            side_effect=[pages[0], ClientException("error")] + pages[1:],
+        ) as mock_get:
+            generator = ListingGenerator(
+                self.reddit, "url", limit=None, prefetch=1
+            )
+            assert [next(generator)["page"] for _ in range(2)] == [0, 0]
+            with pytest.raises(ClientException):
+                next(generator)
+            assert [item["page"] for item in generator] == [1, 1, 2, 2]
+        assert [
+            call[1]["params"].get("after") for call in mock_get.call_args_list
+        ] == [None, "t3_0", "t3_0", "t3_1"]
@@ -0,0 +1,41 @@
+"""Test praw.models.listing.listing."""
+from praw.models import Submission
+from praw.models.listing.listing import LazyChildren, LazyListing
+
+from ... import UnitTest
+
+
+class TestLazyListing(UnitTest):
+    def setup(self):
+        super().setup()
+        self.listing = LazyListing(
+            self.reddit,
+            _data={
+                "after": None,
+                "children": [
+                    {"kind": "t3", "data": {"id": id_}} for id_ in "abc"
+                ],
+            },
+        )
+
+    def test_children(self):
+        children = self.listing.children
+        assert isinstance(children, LazyChildren)
+        assert len(self.listing) == 3
+        assert children.parsed == 0
+        assert children.raw[1] == {"kind": "t3", "data": {"id": "b"}}
+
+    def test_getitem(self):
+        item = self.listing[1]
+        assert isinstance(item, Submission)
+        assert item.id == "b"
+        assert self.listing[1] is item
+        assert self.listing.children.parsed == 1
+
+    def test_getitem__slice(self):
+        assert [item.id for item in self.listing.children[::2]] == ["a", "c"]
+        assert self.listing.children.parsed == 2
+
+    def test_iter(self):
+        assert [item.id for item in self.listing.children] == ["a", "b", "c"]
+        assert self.listing[-1].id == "c"
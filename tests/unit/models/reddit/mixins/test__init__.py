@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from praw.models.reddit.mixins import ThingModerationMixin
@@ -11,3 +13,16 @@ class TestThingModerationMixin(UnitTest):
             ThingModerationMixin().send_removal_message(
                 "public", "title", "message"
             )
+
+    def test_priority(self):
+        priorities = []
+        submission = self.reddit.submission("2gmzqe")
+
+        def post(*args, **kwargs):
+            priorities.append(self.reddit.rate_limiter._local.priority)
+
+        with mock.patch.object(self.reddit, "post", side_effect=post):
+            submission.mod.approve()
+            submission.mod.remove()
+        assert priorities == ["high", "high"]
+        assert self.reddit.rate_limiter._local.priority == "normal"
@@ -1,9 +1,11 @@
 import pickle
+from unittest import mock
 
 import pytest
 
+from praw import Reddit
 from praw.exceptions import ClientException
-from praw.models import Comment
+from praw.models import Comment, CompactComment, Redditor, Subreddit
 
 from ... import UnitTest
 
@@ -48,6 +50,23 @@ class TestComment(UnitTest):
             Comment(self.reddit, "dummy", "dummy", {"id": "dummy"})
         assert str(excinfo.value) == message
 
+    def test_construct_from_data(self):
+        comment = Comment(
+            self.reddit,
+            _data={
+                "author": "spez",
+                "body": "dummy",
+                "id": "cklhv0f",
+                "replies": "",
+                "subreddit": "redditdev",
+            },
+        )
+        assert comment.body == "dummy"
+        assert isinstance(comment.author, Redditor)
+        assert isinstance(comment.subreddit, Subreddit)
+        assert "replies" not in vars(comment)
+        assert comment._replies == []
+
     def test_construct_from_url(self):
         url = "https://reddit.com/comments/2gmzqe/_/cklhv0f/"
         assert Comment(self.reddit, url=url) == "cklhv0f"
@@ -97,6 +116,46 @@ class TestComment(UnitTest):
             other = pickle.loads(pickle.dumps(comment, protocol=level))
             assert comment == other
 
+    def test_refresh__compact(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            compact_models=True,
+            user_agent="dummy",
+        )
+        submission = reddit.submission("a")
+        comment = CompactComment(
+            reddit,
+            _data={
+                "body": "old",
+                "id": "b",
+                "link_id": "t3_a",
+                "name": "t1_b",
+            },
+        )
+        comment.submission = submission
+        data = {
+            "body": "new",
+            "edited": True,
+            "id": "b",
+            "link_id": "t3_a",
+            "name": "t1_b",
+            "parent_id": "t3_a",
+            "replies": "",
+        }
+        response = [
+            {"kind": "Listing", "data": {"children": []}},
+            {
+                "kind": "Listing",
+                "data": {"children": [{"kind": "t1", "data": data}]},
+            },
+        ]
+        with mock.patch.object(reddit, "request", return_value=response):
+            assert comment.refresh() is comment
+        assert comment.body == "new"
+        assert comment.edited
+        assert comment.submission is submission
+
     def test_repr(self):
         comment = Comment(self.reddit, id="dummy")
         assert repr(comment) == "Comment(id='dummy')"
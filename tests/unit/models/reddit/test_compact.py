@@ -0,0 +1,107 @@
+import pickle
+
+import pytest
+
+from praw import Reddit
+from praw.models import (
+    Comment,
+    CompactComment,
+    CompactSubmission,
+    Redditor,
+    Submission,
+    Subreddit,
+)
+
+from ... import UnitTest
+
+
+class TestCompactComment(UnitTest):
+    def setup(self):
+        super().setup()
+        self.data = {
+            "author": "spez",
+            "body": "dummy",
+            "distinguished": None,
+            "id": "dummy",
+            "link_id": "t3_dummy",
+            "parent_id": "t3_dummy",
+            "score": 1,
+            "subreddit": "redditdev",
+        }
+
+    def test_attributes(self):
+        comment = CompactComment(self.reddit, _data=self.data)
+        assert isinstance(comment, Comment)
+        assert isinstance(comment.author, Redditor)
+        assert isinstance(comment.subreddit, Subreddit)
+        assert comment.body == "dummy"
+        assert comment.distinguished is None
+        assert comment.fullname == "t1_dummy"
+        assert len(comment.replies) == 0
+        assert vars(comment) == {}
+
+    def test_attribute_error(self):
+        comment = CompactComment(self.reddit, _data=self.data)
+        with pytest.raises(AttributeError):
+            comment.mark_as_read()
+
+    def test_assignment(self):
+        comment = CompactComment(self.reddit, _data=self.data)
+        comment.distinguished = "moderator"
+        comment.dummy = 1
+        assert comment.distinguished == "moderator"
+        assert vars(comment) == {"distinguished": "moderator", "dummy": 1}
+
+    def test_shared_keys(self):
+        first = CompactComment(self.reddit, _data=dict(self.data))
+        second = CompactComment(self.reddit, _data=dict(self.data, id="a"))
+        assert first._overflow_index is second._overflow_index
+
+    def test_pickle(self):
+        comment = CompactComment(self.reddit, _data=self.data)
+        comment.dummy = 1
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(comment, protocol=level))
+            assert comment == other
+            assert other.body == "dummy"
+            assert other.distinguished is None
+            assert other.dummy == 1
+
+    def test_update_attributes(self):
+        comment = CompactComment(self.reddit, "dummy")
+        comment._update_attributes(
+            CompactComment(self.reddit, _data=self.data)
+        )
+        assert comment.body == "dummy"
+        assert comment.distinguished is None
+
+
+class TestCompactSubmission(UnitTest):
+    def test_attributes(self):
+        submission = CompactSubmission(
+            self.reddit,
+            _data={
+                "author": "spez",
+                "id": "dummy",
+                "selftext": "",
+                "subreddit": "redditdev",
+                "title": "dummy",
+            },
+        )
+        assert isinstance(submission, Submission)
+        assert isinstance(submission.author, Redditor)
+        assert submission.fullname == "t3_dummy"
+        assert submission.selftext == ""
+        assert submission.title == "dummy"
+        assert vars(submission) == {}
+
+    def test_compact_models(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            compact_models=True,
+            user_agent="dummy",
+        )
+        assert reddit._objector.parsers["t1"] is CompactComment
+        assert reddit._objector.parsers["t3"] is CompactSubmission
+        assert self.reddit._objector.parsers["t3"] is Submission
@@ -1,9 +1,21 @@
+import io
 import pickle
+from unittest import mock
 
 import pytest
 
+from praw import Reddit
 from praw.exceptions import ClientException
-from praw.models import Submission
+from praw.models import (
+    Comment,
+    CompactComment,
+    CompactSubmission,
+    MoreComments,
+    PollData,
+    Redditor,
+    Submission,
+    Subreddit,
+)
 
 from ... import UnitTest
 
@@ -47,6 +59,23 @@ class TestSubmission(UnitTest):
     def test_construct_from_url(self):
         assert Submission(self.reddit, url="http://my.it/2gmzqe") == "2gmzqe"
 
+    def test_construct_from_data(self):
+        submission = Submission(
+            self.reddit,
+            _data={
+                "author": "spez",
+                "id": "2gmzqe",
+                "poll_data": {"options": [], "total_vote_count": 0},
+                "subreddit": "redditdev",
+                "title": "dummy",
+            },
+        )
+        assert submission.title == "dummy"
+        assert isinstance(submission.author, Redditor)
+        assert isinstance(submission.poll_data, PollData)
+        assert isinstance(submission.subreddit, Subreddit)
+        assert submission.subreddit == "redditdev"
+
     def test_fullname(self):
         submission = Submission(self.reddit, _data={"id": "dummy"})
         assert submission.fullname == "t3_dummy"
@@ -90,6 +119,93 @@ class TestSubmission(UnitTest):
             with pytest.raises(ClientException):
                 Submission.id_from_url(url)
 
+    @staticmethod
+    def _listing(*children):
+        return {"kind": "Listing", "data": {"children": list(children)}}
+
+    def _comment(self, id, parent_id, *replies):
+        return {
+            "kind": "t1",
+            "data": {
+                "id": id,
+                "name": "t1_" + id,
+                "parent_id": parent_id,
+                "replies": self._listing(*replies) if replies else "",
+            },
+        }
+
+    def test_iter_comments(self):
+        more = {
+            "kind": "more",
+            "data": {"children": ["e"], "count": 1, "parent_id": "t3_a"},
+        }
+        data = [
+            self._listing(
+                {"kind": "t3", "data": {"id": "a", "title": "dummy"}}
+            ),
+            self._listing(
+                self._comment(
+                    "b",
+                    "t3_a",
+                    self._comment("c", "t1_b", self._comment("d", "t1_c")),
+                ),
+                self._comment("f", "t3_a"),
+                more,
+            ),
+        ]
+        submission = Submission(self.reddit, "a")
+        with mock.patch.object(
+            submission, "_fetch_data", return_value=data
+        ) as mock_fetch:
+            comments = submission.iter_comments()
+            first = next(comments)
+            assert first.id == "b"
+            assert submission.title == "dummy"
+            assert [comment.id for comment in comments] == ["c", "d", "f"]
+        assert mock_fetch.call_count == 1
+        assert submission._fetched
+        forest = submission.comments
+        assert [type(comment) for comment in forest] == [
+            Comment,
+            Comment,
+            MoreComments,
+        ]
+        assert forest[0] is first
+        assert forest[0].replies[0].replies[0].id == "d"
+        assert forest[0].replies[0].replies[0].submission is submission
+        assert sorted(submission._comments_by_id) == [
+            "t1_b",
+            "t1_c",
+            "t1_d",
+            "t1_f",
+        ]
+
+    def test_iter_comments__abandoned(self):
+        def data():
+            return [
+                self._listing({"kind": "t3", "data": {"id": "a"}}),
+                self._listing(
+                    self._comment("b", "t3_a", self._comment("c", "t1_b")),
+                    self._comment("d", "t3_a"),
+                ),
+            ]
+
+        submission = Submission(self.reddit, "a")
+        with mock.patch.object(
+            submission, "_fetch_data", side_effect=data
+        ) as mock_fetch:
+            comments = submission.iter_comments()
+            assert next(comments).id == "b"
+            comments.close()
+            assert not submission._fetched
+            assert [comment.id for comment in submission.comments] == [
+                "b",
+                "d",
+            ]
+        assert mock_fetch.call_count == 2
+        assert submission._fetched
+        assert sorted(submission._comments_by_id) == ["t1_b", "t1_c", "t1_d"]
+
     def test_pickle(self):
         submission = Submission(self.reddit, _data={"id": "dummy"})
         for level in range(pickle.HIGHEST_PROTOCOL + 1):
@@ -100,6 +216,113 @@ class TestSubmission(UnitTest):
         submission = Submission(self.reddit, id="2gmzqe")
         assert repr(submission) == "Submission(id='2gmzqe')"
 
+    def test_snapshot(self):
+        comment = self._comment("c", "t1_b")
+        comment["data"].update(author="[deleted]", subreddit="redditdev")
+        data = [
+            self._listing(
+                {
+                    "kind": "t3",
+                    "data": {
+                        "author": "spez",
+                        "id": "a",
+                        "poll_data": {
+                            "options": [{"id": "1", "text": "yes"}],
+                            "user_selection": "1",
+                        },
+                        "subreddit": "redditdev",
+                    },
+                }
+            ),
+            self._listing(
+                self._comment(
+                    "b",
+                    "t3_a",
+                    comment,
+                    {
+                        "kind": "more",
+                        "data": {
+                            "children": ["d"],
+                            "count": 1,
+                            "parent_id": "t1_b",
+                        },
+                    },
+                ),
+                self._comment("e", "t3_a"),
+            ),
+        ]
+        submission = Submission(self.reddit, "a")
+        submission.comment_sort = "new"
+        with mock.patch.object(submission, "_fetch_data", return_value=data):
+            file = io.BytesIO()
+            submission.snapshot(file)
+        assert file.getvalue().count(b"\n") == 5
+
+        file.seek(0)
+        with mock.patch.object(
+            self.reddit._objector, "objectify"
+        ) as mock_objectify:
+            loaded = Submission.from_snapshot(self.reddit, file)
+        assert mock_objectify.call_count == 0
+        assert loaded._fetched
+        assert loaded.comment_sort == "new"
+        assert loaded.author == Redditor(self.reddit, "spez")
+        assert loaded.subreddit == Subreddit(self.reddit, "redditdev")
+        assert isinstance(loaded.poll_data, PollData)
+        assert loaded.poll_data.user_selection.text == "yes"
+        assert sorted(loaded._comments_by_id) == ["t1_b", "t1_c", "t1_e"]
+        b, e = loaded.comments
+        c, more = b.replies
+        assert isinstance(c, Comment)
+        assert c.author is None
+        assert c.subreddit == Subreddit(self.reddit, "redditdev")
+        assert c.submission is loaded
+        assert c.replies.list() == []
+        assert isinstance(more, MoreComments)
+        assert more.children == ["d"]
+        assert more.submission is loaded
+        assert e.id == "e"
+
+    def test_snapshot__compact(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            compact_models=True,
+            user_agent="dummy",
+        )
+        comment = self._comment("c", "t1_b")
+        comment["data"].update(body="reply", score=2)
+        data = [
+            self._listing(
+                {
+                    "kind": "t3",
+                    "data": {"author": "spez", "id": "a", "title": "dummy"},
+                }
+            ),
+            self._listing(self._comment("b", "t3_a", comment)),
+        ]
+        submission = CompactSubmission(reddit, "a")
+        with mock.patch.object(submission, "_fetch_data", return_value=data):
+            file = io.BytesIO()
+            submission.snapshot(file)
+
+        file.seek(0)
+        loaded = CompactSubmission.from_snapshot(reddit, file)
+        assert isinstance(loaded, CompactSubmission)
+        assert loaded._fetched
+        assert loaded.author == Redditor(reddit, "spez")
+        assert loaded.title == "dummy"
+        assert loaded.comment_limit == submission.comment_limit
+        c = loaded.comments[0].replies[0]
+        assert isinstance(c, CompactComment)
+        assert (c.id, c.body, c.score, c.name) == ("c", "reply", 2, "t1_c")
+        assert c.submission is loaded
+
+    def test_snapshot__unsupported_version(self):
+        file = io.BytesIO(b'{"data": {"id": "a"}, "version": 0}\n')
+        with pytest.raises(ClientException):
+            Submission.from_snapshot(self.reddit, file)
+
     def test_str(self):
         submission = Submission(self.reddit, _data={"id": "dummy"})
         assert str(submission) == "dummy"
@@ -0,0 +1,419 @@
+"""Test praw.models.comment_forest."""
+from unittest import mock
+
+import pytest
+
+from praw import Reddit
+from praw.exceptions import ClientException
+from praw.models import (
+    Comment,
+    CompactComment,
+    MoreComments,
+    Redditor,
+    Submission,
+    Subreddit,
+)
+from praw.models.comment_forest import CommentForest, CommentStore
+
+from .. import UnitTest
+
+
+class TestCommentForest(UnitTest):
+    def setup(self):
+        super().setup()
+        self._setup_forest()
+
+    def _setup_compact(self):
+        self.reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            compact_models=True,
+            user_agent="dummy",
+        )
+        self.reddit._core._requestor._http = None
+        self._setup_forest()
+
+    def _setup_forest(self):
+        self.submission = Submission(self.reddit, "a")
+
+        def comment(id, parent_id, *replies):
+            return {
+                "kind": "t1",
+                "data": {
+                    "author": "spez",
+                    "body": id,
+                    "edited": False,
+                    "id": id,
+                    "link_id": "t3_a",
+                    "name": "t1_" + id,
+                    "parent_id": parent_id,
+                    "replies": {
+                        "kind": "Listing",
+                        "data": {"children": list(replies)},
+                    }
+                    if replies
+                    else "",
+                    "subreddit": "redditdev",
+                },
+            }
+
+        self.comment = comment
+        more = {
+            "kind": "more",
+            "data": {"children": ["z"], "count": 1, "parent_id": "t1_c"},
+        }
+        #  b       f
+        #  ├─ c    └─ g
+        #  │  ├─ d
+        #  │  └─ more
+        #  └─ e
+        children = [
+            comment(
+                "b",
+                "t3_a",
+                comment("c", "t1_b", comment("d", "t1_c"), more),
+                comment("e", "t1_b"),
+            ),
+            comment("f", "t3_a", comment("g", "t1_f")),
+        ]
+        self.forest = CommentForest(self.submission)
+        self.forest._update(
+            self.reddit._objector.objectify_comment_tree(
+                children, self.submission
+            )
+        )
+
+    @staticmethod
+    def ids(comments):
+        return [
+            "more" if isinstance(comment, MoreComments) else comment.id
+            for comment in comments
+        ]
+
+    def test_iter_bfs(self):
+        assert self.ids(self.forest.iter_bfs()) == [
+            "b",
+            "f",
+            "c",
+            "e",
+            "g",
+            "d",
+            "more",
+        ]
+
+    def test_iter_dfs(self):
+        assert self.ids(self.forest.iter_dfs()) == [
+            "b",
+            "c",
+            "d",
+            "more",
+            "e",
+            "f",
+            "g",
+        ]
+
+    def test_iter__max_depth(self):
+        assert self.ids(self.forest.iter_bfs(max_depth=0)) == ["b", "f"]
+        assert self.ids(self.forest.iter_dfs(max_depth=1)) == [
+            "b",
+            "c",
+            "e",
+            "f",
+            "g",
+        ]
+
+    def test_iter__predicate(self):
+        def predicate(comment):
+            return getattr(comment, "id", None) in {"c", "d", "g"}
+
+        assert self.ids(self.forest.iter_dfs(predicate=predicate)) == [
+            "c",
+            "d",
+            "g",
+        ]
+
+    def test_iter__skip_more(self):
+        assert "more" not in self.ids(self.forest.iter_bfs(skip_more=True))
+        assert "more" not in self.ids(self.forest.iter_dfs(skip_more=True))
+
+    def test_list(self):
+        assert self.forest.list() == list(self.forest.iter_bfs())
+
+    def test_refresh_incremental(self):
+        edited = self.comment(
+            "b",
+            "t3_a",
+            self.comment(
+                "c",
+                "t1_b",
+                self.comment("d", "t1_c"),
+                self.comment("h", "t1_c"),
+            ),
+            {
+                "kind": "more",
+                "data": {
+                    "children": ["e", "i"],
+                    "count": 2,
+                    "parent_id": "t1_b",
+                },
+            },
+        )
+        edited["data"].update(body="edited", edited=1)
+        response = [
+            {
+                "kind": "Listing",
+                "data": {
+                    "children": [
+                        {"kind": "t3", "data": {"id": "a", "num_comments": 9}}
+                    ]
+                },
+            },
+            {
+                "kind": "Listing",
+                "data": {
+                    "children": [
+                        self.comment("j", "t3_a"),
+                        edited,
+                        self.comment("k", "t1_x"),
+                    ]
+                },
+            },
+        ]
+        self.submission._comments = self.forest
+        self.submission._fetched = True
+        b = self.forest[0]
+        with mock.patch.object(
+            self.reddit, "request", return_value=response
+        ) as mock_request, mock.patch.object(
+            self.reddit,
+            "post",
+            return_value=[
+                self.reddit._objector.objectify(self.comment("i", "t1_b"))
+            ],
+        ) as mock_post:
+            changes = self.forest.refresh_incremental()
+        assert mock_request.call_args[0][2] == {"limit": 2048, "sort": "new"}
+        assert mock_post.call_args[1]["data"]["children"] == "i"
+        assert self.ids(changes["added"]) == ["j", "h", "i"]
+        assert changes["edited"] == [b]
+        assert b.body == "edited"
+        assert isinstance(b.author, Redditor)
+        assert b.subreddit == Subreddit(self.reddit, "redditdev")
+        assert self.submission.num_comments == 9
+        assert self.submission._fetched
+        assert self.submission.comments is self.forest
+        assert self.ids(self.forest.iter_dfs()) == [
+            "b",
+            "c",
+            "d",
+            "more",
+            "h",
+            "e",
+            "i",
+            "f",
+            "g",
+            "j",
+        ]
+        assert "t1_k" not in self.submission._comments_by_id
+
+    def test_refresh_incremental__compact(self):
+        self._setup_compact()
+        edited = self.comment("b", "t3_a")
+        edited["data"].update(body="edited", edited=1, score=5)
+        response = [
+            {
+                "kind": "Listing",
+                "data": {"children": [{"kind": "t3", "data": {"id": "a"}}]},
+            },
+            {"kind": "Listing", "data": {"children": [edited]}},
+        ]
+        self.submission._comments = self.forest
+        self.submission._fetched = True
+        b = self.forest[0]
+        assert isinstance(b, CompactComment)
+        with mock.patch.object(self.reddit, "request", return_value=response):
+            changes = self.forest.refresh_incremental()
+        assert changes == {"added": [], "edited": [b]}
+        assert (b.body, b.edited, b.score) == ("edited", 1, 5)
+        assert self.ids(b.replies) == ["c", "e"]
+
+    def test_replace_more__batch(self):
+        more = {
+            "kind": "more",
+            "data": {"children": ["h", "i"], "count": 2, "parent_id": "t3_a"},
+        }
+        self.forest._comments.append(self.reddit._objector.objectify(more))
+        self.forest._comments.append(
+            self.reddit._objector.objectify(
+                {
+                    "kind": "more",
+                    "data": {"children": [], "count": 0, "parent_id": "t1_g"},
+                }
+            )
+        )
+        things = [
+            self.comment("z", "t1_c"),
+            self.comment("h", "t3_a"),
+            self.comment("i", "t1_h"),
+        ]
+        with mock.patch.object(
+            self.reddit,
+            "post",
+            side_effect=lambda *args, **kwargs: (
+                self.reddit._objector.objectify(things)
+            ),
+        ) as mock_post:
+            skipped = self.forest.replace_more(limit=2, batch=True)
+        assert mock_post.call_count == 1
+        assert mock_post.call_args[1]["data"]["children"] == "h,i,z"
+        assert len(skipped) == 1
+        assert skipped[0].count == 0
+        assert self.ids(self.forest.iter_dfs()) == [
+            "b",
+            "c",
+            "d",
+            "z",
+            "e",
+            "f",
+            "g",
+            "h",
+            "i",
+        ]
+
+    def test_replace_more__batch_limit(self):
+        self.forest.MORECHILDREN_LIMIT = 1
+        more = self.forest.list()[-1]
+        more.children = ["x", "y", "z"]
+        with mock.patch.object(
+            self.reddit, "post", return_value=[]
+        ) as mock_post:
+            self.forest.replace_more(batch=True)
+        assert [
+            call[1]["data"]["children"] for call in mock_post.call_args_list
+        ] == ["x", "y", "z"]
+
+    def _replace_more_workers(self, workers, limit):
+        self.setup()
+        # The MoreComments returned for "h" outranks the one for "y"
+        for children, count in ((["h"], 3), (["y"], 1)):
+            self.forest._comments.append(
+                self.reddit._objector.objectify(
+                    {
+                        "kind": "more",
+                        "data": {
+                            "children": children,
+                            "count": count,
+                            "parent_id": "t3_a",
+                        },
+                    }
+                )
+            )
+        responses = {
+            "h": [
+                self.comment("h", "t3_a"),
+                {
+                    "kind": "more",
+                    "data": {
+                        "children": ["i"],
+                        "count": 2,
+                        "id": "i",
+                        "name": "t1_i",
+                        "parent_id": "t3_a",
+                    },
+                },
+            ],
+            "i": [self.comment("i", "t3_a")],
+            "y": [self.comment("y", "t3_a")],
+            "z": [self.comment("z", "t1_c")],
+        }
+        with mock.patch.object(
+            self.reddit,
+            "post",
+            side_effect=lambda *args, **kwargs: (
+                self.reddit._objector.objectify(
+                    responses[kwargs["data"]["children"]]
+                )
+            ),
+        ):
+            self.forest.MORECHILDREN_LIMIT = 1
+            skipped = self.forest.replace_more(
+                limit=limit, batch=True, workers=workers
+            )
+        return self.ids(skipped), self.ids(self.forest.iter_dfs())
+
+    def test_replace_more__workers(self):
+        sequential = self._replace_more_workers(1, None)
+        assert self._replace_more_workers(3, None) == sequential
+        assert sequential == (
+            [],
+            ["b", "c", "d", "z", "e", "f", "g", "h", "i", "y"],
+        )
+
+    def test_replace_more__workers_limit(self):
+        sequential = self._replace_more_workers(1, 2)
+        assert self._replace_more_workers(2, 2) == sequential
+        assert sequential == (
+            ["more", "more"],
+            ["b", "c", "d", "e", "f", "g", "h", "i"],
+        )
+
+    def test_spill(self):
+        self.submission._comments = self.forest
+        dfs = self.ids(self.forest.iter_dfs())
+        store = self.forest.spill()
+        assert isinstance(store, CommentStore)
+        assert self.forest.spill() is store
+        assert self.submission._comments_by_id is store
+        assert sorted(store) == [
+            "t1_b",
+            "t1_c",
+            "t1_d",
+            "t1_e",
+            "t1_f",
+            "t1_g",
+        ]
+        assert self.ids(self.forest.iter_dfs()) == dfs
+        assert self.ids(self.forest.iter_bfs(max_depth=0)) == ["b", "f"]
+        b = self.forest[0]
+        assert isinstance(b, Comment)
+        assert b.body == "b"
+        assert b.submission is self.submission
+        assert b == self.forest[0]
+        assert b is not self.forest[0]
+        assert self.ids(b.replies[:]) == ["c", "e"]
+        with pytest.raises(ClientException):
+            b.replies.spill()
+
+    def test_spill__compact(self):
+        self._setup_compact()
+        self.submission._comments = self.forest
+        self.forest.spill()
+        b = self.forest[0]
+        assert isinstance(b, CompactComment)
+        assert b._fetched
+        assert (b.body, b.edited, b.name) == ("b", False, "t1_b")
+        assert self.ids(b.replies[:]) == ["c", "e"]
+        assert b.replies[0].parent_id == "t1_b"
+
+    def test_spill__replace_more(self):
+        self.submission._comments = self.forest
+        store = self.forest.spill()
+        with mock.patch.object(
+            self.reddit,
+            "post",
+            return_value=[
+                self.reddit._objector.objectify(self.comment("z", "t1_c"))
+            ],
+        ):
+            assert self.forest.replace_more(batch=True) == []
+        assert "t1_z" in store
+        assert self.ids(self.forest.iter_dfs()) == [
+            "b",
+            "c",
+            "d",
+            "z",
+            "e",
+            "f",
+            "g",
+        ]
+        store.close()
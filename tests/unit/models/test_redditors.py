@@ -31,6 +31,22 @@ class TestRedditors(UnitTest):
             assert cal[0][1]["params"]["ids"] == ",".join(in_ids_list[:100])
             assert cal[1][1]["params"]["ids"] == ",".join(in_ids_list[-2:])
 
+    def test_partial_redditors__raw(self):
+        with mock.patch.object(
+            self.reddit,
+            "request",
+            return_value={"t2_a": {"name": "a"}, "t2_b": {"name": "b"}},
+        ):
+            results = list(
+                self.reddit.redditors.partial_redditors(
+                    ["t2_a", "t2_b"], raw=True
+                )
+            )
+        assert results == [
+            {"fullname": "t2_a", "name": "a"},
+            {"fullname": "t2_b", "name": "b"},
+        ]
+
     def test_partial_redditors__no_typeerror(self):
         func = self.reddit.redditors.partial_redditors
         with mock.patch.object(self.reddit, "request"):
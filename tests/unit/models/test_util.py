@@ -1,9 +1,74 @@
 """Test praw.models.util."""
-from praw.models.util import ExponentialCounter, permissions_string
+import json
+import os
+import tempfile
+from collections import Counter
+from unittest import mock
+
+from praw.models.util import (
+    AdaptivePoller,
+    BoundedSet,
+    ExponentialCounter,
+    permissions_string,
+    stream_generator,
+)
 
 from .. import UnitTest
 
 
+class TestAdaptivePoller(UnitTest):
+    def test_busy(self):
+        poller = AdaptivePoller(target_latency=30)
+        poller.observe([100.0 + index for index in range(0, 50, 5)])
+        assert poller.gap == 5
+        assert poller.delay() == 30
+        assert poller.limit() == 12
+
+        poller.observe([146.0, 147.0, 148.0, 149.0, 150.0])
+        assert 2 < poller.gap < 3
+        assert poller.delay() == 30
+        assert poller.limit() == 26
+
+    def test_initial(self):
+        poller = AdaptivePoller()
+        assert poller.gap is None
+        assert poller.delay() == 30
+        assert poller.limit() == 100
+
+    def test_limits(self):
+        poller = AdaptivePoller(min_delay=2, min_limit=5)
+        poller.observe([0.0, 0.01, 0.02])
+        assert poller.delay() == 2
+        assert poller.limit() == 100
+        poller.observe([], now=1000)
+        assert poller.delay() == 30
+        assert poller.limit() == 5
+
+    def test_silence(self):
+        poller = AdaptivePoller(target_latency=600)
+        poller.observe([100.0, 101.0])
+        assert poller.delay() == 50
+        poller.observe([], now=111.0)
+        assert poller.gap == 10
+        assert poller.delay() == 500
+
+
+class TestBoundedSet(UnitTest):
+    def test_add(self):
+        bounded_set = BoundedSet(3)
+        for item in "abcd":
+            bounded_set.add(item)
+        assert "a" not in bounded_set
+        assert list(bounded_set) == ["b", "c", "d"]
+
+    def test_add__existing(self):
+        bounded_set = BoundedSet(3)
+        for item in "abcbd":
+            bounded_set.add(item)
+        assert len(bounded_set) == 3
+        assert list(bounded_set) == ["c", "b", "d"]
+
+
 class TestExponentialCounter(UnitTest):
     MAX_DELTA = 1.0 / 32
 
@@ -59,3 +124,105 @@ class TestUtil(UnitTest):
         assert "-all,-a,-b,-c,+d" == permissions_string(
             ["d"], self.PERMISSIONS
         )
+
+
+@mock.patch("time.sleep", return_value=None)
+class TestStreamGenerator(UnitTest):
+    @staticmethod
+    def _function(*pages):
+        return mock.Mock(
+            side_effect=[
+                [{"name": "t3_{}".format(id_)} for id_ in page]
+                for page in pages
+            ]
+        )
+
+    def test_backfill(self, _):
+        function = self._function(
+            ["0"],
+            [],
+            [str(id_) for id_ in range(200, 100, -1)],
+            [str(id_) for id_ in range(100, 0, -1)],
+            ["0"],
+        )
+        counters = Counter()
+        stream = stream_generator(function, counters=counters)
+        assert [next(stream)["name"] for _ in range(201)] == [
+            "t3_{}".format(id_) for id_ in range(201)
+        ]
+        assert [call[1]["params"] for call in function.call_args_list] == [
+            {"before": None},
+            {"before": "t3_0"},
+            {"before": None},
+            {"after": "t3_101"},
+            {"after": "t3_1"},
+        ]
+        assert counters == {"backfilled": 100, "gaps": 1}
+
+    def test_backfill__not_a_gap(self, _):
+        function = self._function(
+            ["0"], [str(id_) for id_ in range(100, 0, -1)]
+        )
+        counters = Counter()
+        stream = stream_generator(function, counters=counters)
+        assert [next(stream)["name"] for _ in range(101)] == [
+            "t3_{}".format(id_) for id_ in range(101)
+        ]
+        assert function.call_count == 2
+        assert function.call_args[1]["params"] == {"before": "t3_0"}
+        assert counters == {}
+
+    def test_checkpoint(self, _):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "checkpoint.json")
+        try:
+            stream = stream_generator(self._function("cba"), checkpoint=path)
+            assert next(stream)["name"] == "t3_a"
+            assert next(stream)["name"] == "t3_b"
+            stream.close()
+            with open(path) as checkpoint_file:
+                assert json.load(checkpoint_file) == {
+                    "before": "t3_a",
+                    "seen": ["t3_a"],
+                }
+
+            function = self._function("cb")
+            stream = stream_generator(
+                function, skip_existing=True, checkpoint=path
+            )
+            assert [next(stream)["name"] for _ in range(2)] == [
+                "t3_b",
+                "t3_c",
+            ]
+            assert function.call_args[1]["params"] == {"before": "t3_a"}
+        finally:
+            os.remove(path)
+            os.rmdir(directory)
+
+    def test_max_seen(self, _):
+        stream = stream_generator(self._function("cba", "ca", "d"), max_seen=2)
+        assert [next(stream)["name"] for _ in range(3)] == [
+            "t3_a",
+            "t3_b",
+            "t3_c",
+        ]
+        # Only b and c are remembered, so a is yielded again
+        assert [next(stream)["name"] for _ in range(2)] == ["t3_a", "t3_d"]
+
+    def test_poller(self, mock_sleep):
+        poller = AdaptivePoller(target_latency=30)
+        poller.observe([0.0, 10.0])
+        function = mock.Mock(
+            side_effect=[
+                [{"created_utc": 20.0, "name": "t3_a"}],
+                [],
+                [{"created_utc": 40.0, "name": "t3_b"}],
+            ]
+        )
+        stream = stream_generator(function, poller=poller)
+        with mock.patch("time.time", return_value=25.0):
+            assert next(stream)["name"] == "t3_a"
+            assert function.call_args[1]["limit"] == 10
+            assert next(stream)["name"] == "t3_b"
+        assert poller.gap == 10
+        assert [call[0][0] for call in mock_sleep.call_args_list] == [30, 30]
@@ -0,0 +1,274 @@
+import asyncio
+import json
+import time
+from unittest import mock
+
+import pytest
+from prawcore.exceptions import NotFound
+
+from praw import AsyncReddit
+from praw.exceptions import ClientException, RedditAPIException
+from praw.models import Submission, Subreddit
+
+from . import UnitTest
+
+
+class _Response:
+    def __init__(self, status, body=None, headers=None):
+        self.headers = headers or {}
+        self.status = status
+        self._content = b"" if body is None else json.dumps(body).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        pass
+
+    async def read(self):
+        return self._content
+
+
+class _Session:
+    """Reply to each request with the next of ``responses``."""
+
+    def __init__(self, *responses):
+        self.requests = []
+        self._responses = list(responses)
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestAsyncReddit(UnitTest):
+    HEADERS = {
+        "x-ratelimit-remaining": "60",
+        "x-ratelimit-reset": "100",
+        "x-ratelimit-used": "540",
+    }
+
+    def setup(self):
+        super().setup()
+        authorizer = self.reddit._core._authorizer
+        authorizer.access_token = "token"
+        authorizer._expiration_timestamp = time.time() + 3600
+        # Requests must not be sent by the blocking client
+        self.reddit.request = mock.Mock(side_effect=AssertionError("blocking"))
+        self.loop = asyncio.new_event_loop()
+
+    def teardown(self):
+        self.loop.close()
+
+    def async_reddit(self, *responses):
+        self.session = _Session(*responses)
+        return AsyncReddit(reddit=self.reddit, session=self.session)
+
+    @staticmethod
+    def _listing(after, *ids):
+        return {
+            "kind": "Listing",
+            "data": {
+                "after": after,
+                "children": [
+                    {"kind": "t3", "data": {"id": id_, "name": "t3_" + id_}}
+                    for id_ in ids
+                ],
+            },
+        }
+
+    def run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_attribute_delegation(self):
+        async_reddit = self.async_reddit()
+        assert async_reddit.config is self.reddit.config
+        assert async_reddit.subreddit("redditdev") == "redditdev"
+        with pytest.raises(AttributeError):
+            async_reddit._missing
+
+    def test_close(self):
+        async_reddit = self.async_reddit()
+        self.run(async_reddit.close())
+        assert async_reddit._http is self.session
+
+    def test_fetch(self):
+        async_reddit = self.async_reddit(
+            _Response(
+                200,
+                {
+                    "kind": "t5",
+                    "data": {"display_name": "redditdev", "subscribers": 1},
+                },
+            )
+        )
+        subreddit = self.reddit.subreddit("redditdev")
+        assert self.run(async_reddit.fetch(subreddit)) is subreddit
+        assert subreddit._fetched
+        assert subreddit.subscribers == 1
+        assert "_fetch_data" not in vars(subreddit)
+        method, url, _ = self.session.requests[0]
+        assert (method, url) == (
+            "GET",
+            "https://oauth.reddit.com/r/redditdev/about/",
+        )
+
+    def test_fetch__submission(self):
+        async_reddit = self.async_reddit(
+            _Response(
+                200,
+                [
+                    self._listing(None, "a"),
+                    {
+                        "kind": "Listing",
+                        "data": {
+                            "children": [
+                                {
+                                    "kind": "t1",
+                                    "data": {
+                                        "id": "b",
+                                        "name": "t1_b",
+                                        "parent_id": "t3_a",
+                                        "replies": "",
+                                    },
+                                }
+                            ]
+                        },
+                    },
+                ],
+            )
+        )
+        submission = self.reddit.submission("a")
+        self.run(async_reddit.fetch(submission))
+        assert submission._fetched
+        assert [comment.id for comment in submission.comments] == ["b"]
+        params = dict(self.session.requests[0][2]["params"])
+        assert params["sort"] == "confidence"
+
+    @mock.patch("praw.async_reddit.aiohttp", new=None)
+    def test_init__without_aiohttp(self):
+        with pytest.raises(ClientException):
+            AsyncReddit(reddit=self.reddit)
+
+    def test_init__reddit_and_settings(self):
+        with pytest.raises(TypeError):
+            AsyncReddit(reddit=self.reddit, client_id="dummy")
+
+    def test_iterate(self):
+        async_reddit = self.async_reddit(
+            _Response(200, self._listing("t3_b", "a", "b")),
+            _Response(200, self._listing(None, "c")),
+        )
+
+        async def consume():
+            items = []
+            async for item in async_reddit.iterate(
+                self.reddit.subreddit("redditdev").new(limit=None)
+            ):
+                items.append(item)
+            return items
+
+        items = self.run(consume())
+        assert all(isinstance(item, Submission) for item in items)
+        assert [item.id for item in items] == ["a", "b", "c"]
+        assert [
+            dict(kwargs["params"]).get("after")
+            for _, _, kwargs in self.session.requests
+        ] == [None, "t3_b"]
+
+    @mock.patch("time.sleep", side_effect=AssertionError("blocking sleep"))
+    def test_iterate__stream(self, _):
+        async_reddit = self.async_reddit(
+            _Response(200, self._listing(None)),
+            _Response(200, self._listing(None, "a")),
+        )
+        delays = []
+
+        async def sleep(seconds):
+            delays.append(seconds)
+
+        async def consume():
+            stream = self.reddit.subreddit("redditdev").stream.submissions()
+            async for item in async_reddit.iterate(stream):
+                return item
+
+        with mock.patch("asyncio.sleep", new=sleep):
+            assert self.run(consume()).id == "a"
+        assert len(delays) == 1
+        assert 0 < delays[0] < 5
+        assert len(self.session.requests) == 2
+
+    def test_post__api_error(self):
+        async_reddit = self.async_reddit(
+            _Response(
+                400,
+                {
+                    "explanation": "explanation",
+                    "reason": "REASON",
+                    "fields": ["title"],
+                },
+            )
+        )
+        with pytest.raises(RedditAPIException) as excinfo:
+            self.run(async_reddit.post("api/submit", data={"title": ""}))
+        assert excinfo.value.items[0].error_type == "REASON"
+        kwargs = self.session.requests[0][2]
+        assert kwargs["data"] == [("api_type", "json"), ("title", "")]
+
+    def test_request(self):
+        async_reddit = self.async_reddit(
+            _Response(
+                200,
+                {"kind": "t5", "data": {"display_name": "a"}},
+                self.HEADERS,
+            )
+        )
+        subreddit = self.run(
+            async_reddit.get("path", params={"a": 1, "before": None})
+        )
+        assert isinstance(subreddit, Subreddit)
+        assert subreddit == "a"
+        method, url, kwargs = self.session.requests[0]
+        assert (method, url) == ("GET", "https://oauth.reddit.com/path")
+        assert kwargs["params"] == [("a", "1"), ("raw_json", "1")]
+        assert kwargs["headers"]["Authorization"] == "bearer token"
+        assert "PRAW/" in kwargs["headers"]["User-Agent"]
+        assert not kwargs["allow_redirects"]
+        assert self.reddit.rate_limiter.remaining == 60
+
+    def test_request__not_found(self):
+        async_reddit = self.async_reddit(_Response(404))
+        with pytest.raises(NotFound):
+            self.run(async_reddit.request("GET", "path"))
+
+    def test_request__retry(self):
+        async_reddit = self.async_reddit(
+            asyncio.TimeoutError(), _Response(503), _Response(200, {"a": 1}),
+        )
+        delays = []
+
+        async def sleep(seconds):
+            delays.append(seconds)
+
+        with mock.patch("asyncio.sleep", new=sleep):
+            assert self.run(async_reddit.request("GET", "path")) == {"a": 1}
+        assert len(self.session.requests) == 3
+        assert len(delays) == 2
+
+    def test_request__priority(self):
+        async_reddit = self.async_reddit(_Response(200, {}))
+        delays = []
+
+        async def async_delay(*args):
+            delays.append(args)
+
+        with mock.patch.object(
+            self.reddit.rate_limiter, "async_delay", new=async_delay
+        ):
+            self.run(async_reddit.request("POST", "path", priority="high"))
+        assert delays == [("high", 1)]
+        with pytest.raises(ValueError):
+            self.run(async_reddit.request("GET", "path", priority="urgent"))
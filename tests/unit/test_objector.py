@@ -1,11 +1,92 @@
+import sys
+
 import pytest
 
 from praw.exceptions import ClientException, RedditAPIException
+from praw.models import (
+    Button,
+    Comment,
+    MenuLink,
+    MoreComments,
+    Redditor,
+    Submission,
+)
 
 from . import UnitTest
 
 
 class TestObjector(UnitTest):
+    @staticmethod
+    def _chain(depth):
+        children = []
+        listing = {"kind": "Listing", "data": {"children": children}}
+        parent_id = "t3_a"
+        for index in range(depth):
+            data = {
+                "id": str(index),
+                "link_id": "t3_a",
+                "name": "t1_{}".format(index),
+                "parent_id": parent_id,
+                "replies": "",
+            }
+            children.append({"kind": "t1", "data": data})
+            if index + 1 < depth:
+                children = []
+                data["replies"] = {
+                    "kind": "Listing",
+                    "data": {"children": children},
+                }
+            parent_id = data["name"]
+        return listing
+
+    def test_objectify_comment_tree(self):
+        objector = self.reddit._objector
+        listing = self._chain(3)
+        listing["data"]["children"].append(
+            {"kind": "more", "data": {"children": ["b"], "count": 1}}
+        )
+        children = listing["data"]["children"]
+        comments = objector.objectify_comment_tree(children)
+        assert children == []
+        assert [type(comment) for comment in comments] == [
+            Comment,
+            MoreComments,
+        ]
+        assert comments[0].replies[0].id == "1"
+        assert comments[0].replies[0].replies[0].id == "2"
+        assert len(comments[0].replies[0].replies[0].replies) == 0
+
+    def test_objectify_comment_tree__deep(self):
+        depth = sys.getrecursionlimit() * 2
+        submission = Submission(self.reddit, "a")
+        comment = self.reddit._objector.objectify_comment_tree(
+            self._chain(depth)["data"]["children"], submission
+        )[0]
+        assert len(submission._comments_by_id) == depth
+        for _ in range(depth - 1):
+            comment = comment.replies[0]
+        assert comment.id == str(depth - 1)
+        assert comment.submission is submission
+
+    def test_objectify_dict__memoized_by_shape(self):
+        objector = self.reddit._objector
+        first = objector.objectify({"text": "a", "url": "b", "extra": 1})
+        second = objector.objectify({"text": "c", "url": "d"})
+        assert isinstance(first, MenuLink)
+        assert isinstance(second, MenuLink)
+        assert objector._dispatch == {
+            frozenset({"text", "url"}): objector._parse_menu_link.__func__
+        }
+        button = objector.objectify({"color": "e", "text": "f", "url": "g"})
+        assert isinstance(button, Button)
+        assert len(objector._dispatch) == 2
+
+    def test_objectify_dict__plain(self):
+        data = {"user": "spez", "other": 1}
+        result = self.reddit._objector.objectify(data)
+        assert result is data
+        assert isinstance(result["user"], Redditor)
+
     def test_objectify_returns_None_for_None(self):
         assert self.reddit._objector.objectify(None) is None
 
@@ -0,0 +1,274 @@
+import asyncio
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from praw import Reddit
+from praw.rate_limit import FileRateLimitState, RateLimiter
+
+from . import UnitTest
+
+
+class TestRateLimiter(UnitTest):
+    HEADERS = {
+        "x-ratelimit-remaining": "60",
+        "x-ratelimit-reset": "100",
+        "x-ratelimit-used": "540",
+    }
+
+    def setup(self):
+        super().setup()
+        self.rate_limiter = RateLimiter()
+        self.state = self.rate_limiter.state._state
+
+    def update(self, **headers):
+        with mock.patch("time.time", return_value=0):
+            self.rate_limiter.update(
+                dict(
+                    self.HEADERS,
+                    **{
+                        "x-ratelimit-{}".format(key): value
+                        for key, value in headers.items()
+                    }
+                )
+            )
+
+    def test_budget(self):
+        assert self.rate_limiter.budget is None
+        self.update()
+        with mock.patch("time.time", return_value=0):
+            assert self.rate_limiter.budget == 1
+            self.rate_limiter._reserve(self.state, 1, 0)
+            assert self.rate_limiter.budget == 0
+        with mock.patch("time.time", return_value=100):
+            assert self.rate_limiter.budget is None
+
+    @mock.patch("time.sleep", side_effect=AssertionError("blocking sleep"))
+    @mock.patch("time.time", return_value=0)
+    def test_async_delay(self, *_):
+        delays = []
+
+        async def sleep(seconds):
+            delays.append(seconds)
+
+        self.update()
+        loop = asyncio.new_event_loop()
+        with mock.patch("asyncio.sleep", new=sleep):
+            loop.run_until_complete(self.rate_limiter.async_delay())
+            loop.run_until_complete(self.rate_limiter.async_delay())
+            loop.run_until_complete(self.rate_limiter.async_delay("high"))
+        loop.close()
+        assert len(delays) == 1
+        assert 1.6 < delays[0] < 1.8
+        assert self.rate_limiter.remaining == 57
+
+    def test_bind(self):
+        def settings():
+            return (
+                self.rate_limiter._local.priority,
+                self.rate_limiter._local.weight,
+            )
+
+        with self.rate_limiter.priority("low"), self.rate_limiter.weight(2):
+            bound = self.rate_limiter.bind(settings)
+        thread = ThreadPoolExecutor(max_workers=1)
+        assert thread.submit(bound).result() == ("low", 2)
+        thread.shutdown()
+
+    @mock.patch("time.sleep")
+    def test_call(self, mock_sleep):
+        response = mock.Mock(headers=self.HEADERS)
+        request_function = mock.Mock(return_value=response)
+        result = self.rate_limiter.call(
+            request_function, lambda: {"a": "b"}, "GET", "url"
+        )
+        assert result is response
+        request_function.assert_called_once_with(
+            "GET", "url", headers={"a": "b"}
+        )
+        assert self.rate_limiter.remaining == 60
+        assert not mock_sleep.called
+
+    @mock.patch("time.sleep")
+    @mock.patch("time.time", return_value=0)
+    def test_delay(self, _, mock_sleep):
+        self.update()
+        self.rate_limiter.delay()
+        assert not mock_sleep.called
+        self.rate_limiter.delay()
+        assert 1.6 < mock_sleep.call_args[0][0] < 1.8
+
+    @mock.patch("time.sleep")
+    def test_delay__low_priority(self, mock_sleep):
+        self.update()
+        with mock.patch("time.time", return_value=0):
+            self.rate_limiter.delay()
+            self.rate_limiter.delay()
+        with mock.patch("time.time", side_effect=[0, 2, 4]):
+            with self.rate_limiter.priority("low"):
+                self.rate_limiter.delay()
+        assert mock_sleep.call_count == 3
+        assert self.rate_limiter.remaining == 57
+
+    def test_limiter_is_shared(self):
+        assert (
+            self.reddit._read_only_core._rate_limiter
+            is self.reddit.rate_limiter
+        )
+
+    def test_pickle(self):
+        self.update()
+        for level in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(
+                pickle.dumps(self.rate_limiter, protocol=level)
+            )
+            assert other.remaining == 60
+            assert other._reserve(other.state._state, 1, 0) == 0
+
+    def test_priority(self):
+        with self.rate_limiter.priority("high"):
+            assert self.rate_limiter._local.priority == "high"
+            with self.rate_limiter.priority("low"):
+                assert self.rate_limiter._local.priority == "low"
+            assert self.rate_limiter._local.priority == "high"
+        assert self.rate_limiter._local.priority == "normal"
+
+    def test_priority__invalid(self):
+        with pytest.raises(ValueError):
+            with self.rate_limiter.priority("urgent"):
+                pass
+
+    def test_reserve__burst(self):
+        self.update(reset="20")
+        for _ in range(40):
+            assert self.rate_limiter._reserve(self.state, 1, 0) == 0
+        assert self.rate_limiter._reserve(self.state, 1, 0) > 0
+
+    def test_reserve__exhausted(self):
+        self.update(remaining="0")
+        assert self.rate_limiter._reserve(self.state, 1, 10) == 90
+        assert self.rate_limiter._reserve(self.state, 1, 100) == 0
+        assert self.rate_limiter.remaining is None
+
+    def test_reserve__high_priority(self):
+        self.update()
+        self.rate_limiter._reserve(self.state, 1, 0)
+        assert self.rate_limiter._reserve(self.state, 1, 0) > 0
+        assert self.rate_limiter._reserve(self.state, 1, 0, "high") == 0
+        assert self.rate_limiter.remaining == 57
+
+    def test_reserve__low_priority(self):
+        self.update()
+        assert self.rate_limiter._reserve(self.state, 1, 0, "low") == 0
+        wait = self.rate_limiter._reserve(self.state, 1, 0, "low")
+        assert 1.6 < wait < 1.8
+        assert self.rate_limiter.remaining == 59
+        assert self.rate_limiter._reserve(self.state, 1, wait, "low") == 0
+
+    def test_reserve__low_priority_behind_normal(self):
+        self.update()
+        self.rate_limiter._reserve(self.state, 1, 0)
+        normal_wait = self.rate_limiter._reserve(self.state, 1, 0)
+        low_wait = self.rate_limiter._reserve(self.state, 1, 0, "low")
+        assert low_wait > normal_wait
+        assert self.rate_limiter.remaining == 58
+
+    def test_reserve__no_headers(self):
+        assert self.rate_limiter._reserve(self.state, 1, 0) == 0
+        assert self.rate_limiter.remaining is None
+
+    def test_reserve__spaces_requests(self):
+        self.update()
+        assert self.rate_limiter._reserve(self.state, 1, 0) == 0
+        assert self.rate_limiter.remaining == 59
+        assert self.rate_limiter.used == 541
+        wait = self.rate_limiter._reserve(self.state, 1, 0)
+        assert 1.6 < wait < 1.8  # 100 seconds / 59 requests
+        assert self.rate_limiter._reserve(self.state, 1, 2 * wait) == 0
+
+    def test_reserve__weight(self):
+        self.update(reset="58")
+        assert self.rate_limiter._reserve(self.state, 2, 0) == 0
+        assert self.rate_limiter.remaining == 59
+        assert self.rate_limiter._reserve(self.state, 1, 0) > 0
+
+    def test_update__window_boundary(self):
+        self.update(reset="30")
+        self.update(remaining="599", used="1", reset="0")
+        assert self.rate_limiter.remaining == 599
+        assert self.rate_limiter.used == 1
+        assert self.state["tokens"] == 598
+        assert self.rate_limiter._reserve(self.state, 1, 0) == 0
+
+    def test_update__window_expired(self):
+        self.update(reset="30")
+        self.state["tokens"] = -50
+        with mock.patch("time.time", return_value=40):
+            self.rate_limiter.update(self.HEADERS)
+        assert self.state["tokens"] == 1
+        assert self.state["refill_timestamp"] == 40
+
+    def test_weight(self):
+        with self.rate_limiter.weight(3):
+            assert self.rate_limiter._local.weight == 3
+            with self.rate_limiter.weight(5):
+                assert self.rate_limiter._local.weight == 5
+            assert self.rate_limiter._local.weight == 3
+        assert self.rate_limiter._local.weight == 1
+
+
+class TestFileRateLimitState(UnitTest):
+    HEADERS = TestRateLimiter.HEADERS
+
+    def setup(self):
+        super().setup()
+        directory = tempfile.mkdtemp()
+        self.path = os.path.join(directory, "ratelimit")
+
+    def teardown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rmdir(os.path.dirname(self.path))
+
+    def test_config(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            ratelimit_state_file=self.path,
+            user_agent="dummy",
+        )
+        assert isinstance(reddit.rate_limiter.state, FileRateLimitState)
+        assert reddit.rate_limiter.state.path == self.path
+
+    @mock.patch("time.time", return_value=0)
+    def test_shared_budget(self, _):
+        first = RateLimiter(FileRateLimitState(self.path))
+        second = RateLimiter(FileRateLimitState(self.path))
+        assert second.remaining is None
+        first.update(self.HEADERS)
+        assert second.remaining == 60
+        with second.state.transaction() as state:
+            assert second._reserve(state, 1, 0) == 0
+        assert first.remaining == 59
+        assert first.used == 541
+        with first.state.transaction() as state:
+            assert first._reserve(state, 1, 0) > 0
+
+    def test_transaction__exception(self):
+        state = FileRateLimitState(self.path)
+        try:
+            with state.transaction() as data:
+                data["remaining"] = 5
+                raise ValueError
+        except ValueError:
+            pass
+        assert state.peek()["remaining"] is None
+
+    def test_pickle(self):
+        state = FileRateLimitState(self.path)
+        other = pickle.loads(pickle.dumps(state))
+        assert other.path == self.path
@@ -70,6 +70,21 @@ class TestReddit(UnitTest):
             "is test."
         )
 
+    def test_info__raw(self):
+        listing = {
+            "kind": "Listing",
+            "data": {
+                "children": [{"kind": "t3", "data": {"id": "a", "n": 1}}]
+            },
+        }
+        with mock.patch.object(
+            self.reddit, "request", return_value=listing
+        ) as mock_request:
+            results = list(self.reddit.info(["t3_a"], raw=True))
+            assert results == [{"id": "a", "n": 1}]
+            assert mock_request.call_args[1]["params"] == {"id": "t3_a"}
+            assert list(self.reddit.info(url="dummy", raw=True)) == results
+
     def test_info__not_list(self):
         with pytest.raises(TypeError) as excinfo:
             self.reddit.info("Let's try a string")
@@ -284,6 +299,15 @@ class TestReddit(UnitTest):
             "At most one of `data` and `json` is supported."
         )
 
+    def test_request__priority(self):
+        def request(*args, **kwargs):
+            return self.reddit.rate_limiter._local.priority
+
+        with mock.patch.object(self.reddit, "_core") as mock_core:
+            mock_core.request.side_effect = request
+            assert self.reddit.request("GET", "/", priority="low") == "low"
+        assert self.reddit.rate_limiter._local.priority == "normal"
+
     def test_submission(self):
         assert self.reddit.submission("2gmzqe").id == "2gmzqe"
 
@@ -0,0 +1,174 @@
+import os
+import pickle
+import tempfile
+from unittest import mock
+
+from praw import Reddit, ResponseCache
+
+from . import UnitTest
+
+
+class TestResponseCache(UnitTest):
+    def setup(self):
+        super().setup()
+        self.cache = ResponseCache()
+        self.request = mock.Mock(
+            side_effect=lambda: {"data": {"name": "t5_2qizd"}}
+        )
+
+    def fetch(
+        self,
+        path,
+        method="GET",
+        params=None,
+        data=None,
+        cache=None,
+        identity="",
+    ):
+        return (self.cache if cache is None else cache).fetch(
+            self.request,
+            method,
+            path,
+            params=params,
+            data=data,
+            identity=identity,
+        )
+
+    def test_fetch(self):
+        first = self.fetch("r/redditdev/about/")
+        first["data"]["name"] = "modified"
+        assert self.fetch("/r/redditdev/about") == {
+            "data": {"name": "t5_2qizd"}
+        }
+        assert self.request.call_count == 1
+        assert len(self.cache) == 1
+
+    def test_fetch__expired(self):
+        with mock.patch("time.time", return_value=0):
+            self.fetch("r/redditdev/about/")
+        with mock.patch("time.time", return_value=59):
+            self.fetch("r/redditdev/about/")
+        assert self.request.call_count == 1
+        with mock.patch("time.time", return_value=60):
+            self.fetch("r/redditdev/about/")
+        assert self.request.call_count == 2
+
+    def test_fetch__identity(self):
+        self.fetch("r/redditdev/about/", identity="user:a")
+        self.fetch("r/redditdev/about/", identity="user:a")
+        assert self.request.call_count == 1
+        self.fetch("r/redditdev/about/", identity="user:b")
+        self.fetch("r/redditdev/about/")
+        assert self.request.call_count == 3
+
+    def test_fetch__lru(self):
+        cache = ResponseCache(max_entries=2)
+        for subreddit in ("a", "b", "a", "c", "a", "b"):
+            self.fetch("r/{}/about/rules".format(subreddit), cache=cache)
+        assert self.request.call_count == 4
+        assert len(cache) == 2
+
+    def test_fetch__params(self):
+        self.fetch("r/redditdev/api/widgets", params={"a": 1, "b": 2})
+        self.fetch("r/redditdev/api/widgets", params={"b": 2, "a": 1})
+        assert self.request.call_count == 1
+        self.fetch("r/redditdev/api/widgets", params={"a": 2, "b": 2})
+        assert self.request.call_count == 2
+
+    def test_fetch__post(self):
+        self.fetch("r/redditdev/api/flairselector/", "POST", data={"a": 1})
+        self.fetch("r/redditdev/api/flairselector/", "POST", data={"a": 1})
+        assert self.request.call_count == 1
+        self.fetch("r/redditdev/about/rules", "POST")
+        self.fetch("r/redditdev/about/rules", "POST")
+        assert self.request.call_count == 3
+
+    def test_fetch__uncached_endpoint(self):
+        cache = ResponseCache(ttls={"rules": 60, "widgets": 0})
+        self.fetch("r/redditdev/about/", cache=cache)
+        self.fetch("r/redditdev/about/", cache=cache)
+        self.fetch("r/redditdev/api/widgets", cache=cache)
+        self.fetch("r/redditdev/api/widgets", cache=cache)
+        assert self.request.call_count == 4
+        assert len(cache) == 0
+
+    def test_clear(self):
+        self.fetch("r/redditdev/about/")
+        self.cache.clear()
+        self.fetch("r/redditdev/about/")
+        assert self.request.call_count == 2
+
+    def test_path(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "cache.sqlite")
+        try:
+            self.fetch("r/redditdev/about/", cache=ResponseCache(path=path))
+            other = ResponseCache(path=path)
+            assert self.fetch("r/redditdev/about/", cache=other) == {
+                "data": {"name": "t5_2qizd"}
+            }
+            assert self.request.call_count == 1
+            other.clear()
+            self.fetch("r/redditdev/about/", cache=other)
+            assert self.request.call_count == 2
+        finally:
+            os.remove(path)
+            os.rmdir(directory)
+
+    def test_pickle(self):
+        self.fetch("r/redditdev/about/")
+        other = pickle.loads(pickle.dumps(self.cache))
+        assert other.ttls == self.cache.ttls
+        assert len(other) == 0
+
+    def test_reddit(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            response_cache=self.cache,
+            user_agent="dummy",
+        )
+        with mock.patch.object(
+            reddit._core, "request", return_value={"json": {"errors": []}}
+        ) as mock_request:
+            reddit.get("r/redditdev/about/")
+            reddit.get("r/redditdev/about/")
+            reddit.post("r/redditdev/api/subscribe")
+            reddit.post("r/redditdev/api/subscribe")
+        assert mock_request.call_count == 3
+
+    def test_reddit__identity(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            password="dummy",
+            response_cache=self.cache,
+            user_agent="dummy",
+            username="Spez",
+        )
+        assert reddit._cache_identity() == "user:spez"
+        response = {"data": {"user_is_subscriber": True}}
+        with mock.patch.object(
+            reddit._authorized_core, "request", return_value=response
+        ) as mock_authorized, mock.patch.object(
+            reddit._read_only_core, "request", return_value={"data": {}}
+        ) as mock_read_only:
+            assert reddit.get("r/redditdev/about/") == response
+            reddit.read_only = True
+            assert reddit._cache_identity() == ""
+            assert reddit.get("r/redditdev/about/") == {"data": {}}
+            reddit.read_only = False
+            assert reddit.get("r/redditdev/about/") == response
+        assert mock_authorized.call_count == 1
+        assert mock_read_only.call_count == 1
+
+    def test_reddit__identity_token(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            refresh_token="secret",
+            user_agent="dummy",
+        )
+        identity = reddit._cache_identity()
+        assert identity.startswith("token:")
+        assert "secret" not in identity
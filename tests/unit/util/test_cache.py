@@ -1,6 +1,6 @@
 """Test praw.util.cache."""
 
-from praw.util.cache import cachedproperty
+from praw.util.cache import cachedproperty, copy_json
 
 from .. import UnitTest
 
@@ -41,3 +41,13 @@ class TestCachedProperty(UnitTest):
     def test_doc(self):
         assert self.Klass.nine.__doc__ == "Return 9."
         assert self.Klass.ten.__doc__ == "Return 10."
+
+
+class TestCopyJSON(UnitTest):
+    def test_copy_json(self):
+        data = {"a": [{"b": 1}, "c"], "d": None}
+        copy = copy_json(data)
+        assert copy == data
+        copy["a"][0]["b"] = 2
+        copy["a"].append("e")
+        assert data == {"a": [{"b": 1}, "c"], "d": None}
@@ -0,0 +1,74 @@
+"""Test praw.util.json_backend."""
+import pickle
+from unittest import mock
+
+import pytest
+
+from praw import Reddit
+from praw.util.json_backend import JSONBackend
+
+from .. import UnitTest
+
+
+class TestJSONBackend(UnitTest):
+    def test_auto(self):
+        backend = JSONBackend()
+        assert backend.name in JSONBackend.NAMES
+        with mock.patch(
+            "praw.util.json_backend.import_module",
+            side_effect=[ImportError, ImportError, __import__("json")],
+        ):
+            assert JSONBackend().name == "json"
+
+    def test_dumps(self):
+        for name in JSONBackend.NAMES:
+            try:
+                backend = JSONBackend(name)
+            except ImportError:
+                continue
+            assert backend.dumps({"a": "é"}).decode("utf-8") in (
+                '{"a":"é"}',
+                '{"a": "\\u00e9"}',
+                '{"a":"\\u00e9"}',
+            )
+            assert backend.loads('{"a": [1]}') == {"a": [1]}
+
+    def test_invalid_name(self):
+        with pytest.raises(ValueError):
+            JSONBackend("simplejson")
+
+    def test_pickle(self):
+        backend = pickle.loads(pickle.dumps(JSONBackend("json")))
+        assert backend.name == "json"
+
+    def test_reddit(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            json_backend="json",
+            user_agent="dummy",
+        )
+        assert reddit._json_backend.name == "json"
+
+    def test_wrap(self):
+        backend = JSONBackend("json")
+        backend.name = "dummy"
+        response = mock.Mock(content=b'{"a": 1}')
+        request_function = mock.Mock(return_value=response)
+        request = backend.wrap(request_function)
+        assert request("POST", "url", headers={"A": "b"}, json={"b": 2}) is (
+            response
+        )
+        request_function.assert_called_with(
+            "POST",
+            "url",
+            data=b'{"b": 2}',
+            headers={"A": "b", "Content-Type": "application/json"},
+        )
+        assert response.json() == {"a": 1}
+        request("GET", "url", json=None)
+        request_function.assert_called_with("GET", "url")
+
+    def test_wrap__json(self):
+        request_function = mock.Mock()
+        assert JSONBackend("json").wrap(request_function) is request_function
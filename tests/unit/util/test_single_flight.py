@@ -0,0 +1,103 @@
+"""Test praw.util.single_flight."""
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest import mock
+
+import pytest
+
+from praw import Reddit
+from praw.util.single_flight import SingleFlight
+
+from .. import UnitTest
+
+
+class TestSingleFlight(UnitTest):
+    def setup(self):
+        super().setup()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.release = Event()
+        self.single_flight = SingleFlight()
+
+    def teardown(self):
+        self.release.set()
+        self.executor.shutdown()
+
+    def blocking(self, result):
+        def function():
+            self.release.wait()
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return mock.Mock(side_effect=function)
+
+    def start(self, key, function, count):
+        futures = [
+            self.executor.submit(self.single_flight.call, key, function)
+        ]
+        while key not in self.single_flight._calls:
+            pass
+        for _ in range(count - 1):
+            futures.append(
+                self.executor.submit(self.single_flight.call, key, function)
+            )
+        while self.single_flight._calls[key].waiters < count - 1:
+            pass
+        self.release.set()
+        return futures
+
+    def test_call(self):
+        assert self.single_flight.call("key", lambda: {"a": 1}) == {"a": 1}
+        assert self.single_flight._calls == {}
+
+    def test_call__coalesced(self):
+        function = self.blocking({"data": [1]})
+        results = [future.result() for future in self.start("k", function, 3)]
+        assert function.call_count == 1
+        assert results == [{"data": [1]}] * 3
+        assert len({id(result) for result in results}) == 3
+        assert self.single_flight._calls == {}
+
+    def test_call__exception(self):
+        function = self.blocking(ValueError("failure"))
+        for future in self.start("k", function, 2):
+            with pytest.raises(ValueError):
+                future.result()
+        assert function.call_count == 1
+        assert self.single_flight._calls == {}
+
+    def test_call__different_keys(self):
+        function = mock.Mock(return_value=1)
+        self.single_flight.call("a", function)
+        self.single_flight.call("b", function)
+        assert function.call_count == 2
+
+    def test_reddit__disabled(self):
+        reddit = Reddit(
+            client_id="dummy",
+            client_secret="dummy",
+            coalesce_requests=False,
+            user_agent="dummy",
+        )
+        assert reddit.config.coalesce_requests is False
+        with mock.patch.object(reddit, "_single_flight") as single_flight:
+            with mock.patch.object(reddit, "_core"):
+                reddit.request("GET", "r/redditdev/about/")
+        assert not single_flight.call.called
+
+    def test_reddit__get(self):
+        with mock.patch.object(self.reddit, "_single_flight") as single_flight:
+            with mock.patch.object(self.reddit, "_request"):
+                self.reddit.request(
+                    "GET", "/r/redditdev/about/", {"b": 2, "a": 1}
+                )
+                self.reddit.request("POST", "r/redditdev/api/subscribe")
+        single_flight.call.assert_called_once_with(
+            (self.reddit._core, "r/redditdev/about", (("a", 1), ("b", 2))),
+            mock.ANY,
+        )
+
+    def test_pickle(self):
+        other = pickle.loads(pickle.dumps(self.single_flight))
+        assert other.call("key", lambda: 1) == 1
@@ -0,0 +1,101 @@
+"""Helpers shared by the benchmarks.
+
+Each benchmark is a module in this package that is run from the root of the
+repository, for example::
+
+    python -m tools.benchmarks.objector_dispatch
+
+The payloads used are the response bodies recorded in the integration test
+cassettes, so that the benchmarks reflect the data Reddit actually returns.
+
+"""
+import base64
+import gzip
+import json
+import os
+import timeit
+
+from praw import Reddit
+
+CASSETTE_DIRECTORY = os.path.abspath(
+    os.path.join(
+        __file__, "..", "..", "..", "tests", "integration", "cassettes"
+    )
+)
+
+
+def _body_bytes(response):
+    body = response["body"]
+    if body.get("base64_string"):
+        raw = base64.b64decode(body["base64_string"])
+        if "gzip" in response["headers"].get("Content-Encoding", []):
+            raw = gzip.decompress(raw)
+        return raw
+    return body.get("string", "").encode("utf-8")
+
+
+def _decode_body(response):
+    return json.loads(
+        _body_bytes(response).decode(
+            response["body"].get("encoding") or "utf-8"
+        )
+    )
+
+
+def iter_dicts(payload):
+    """Yield every dictionary nested in ``payload``, outermost first."""
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            yield value
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+def load_bodies(directory=CASSETTE_DIRECTORY):
+    """Return the undecoded response bodies recorded in ``directory``."""
+    bodies = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(directory, filename)) as fp:
+            cassette = json.load(fp)
+        for interaction in cassette["http_interactions"]:
+            bodies.append(_body_bytes(interaction["response"]))
+    return bodies
+
+
+def load_payloads(directory=CASSETTE_DIRECTORY):
+    """Return the decoded JSON response bodies recorded in ``directory``."""
+    payloads = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(directory, filename)) as fp:
+            cassette = json.load(fp)
+        for interaction in cassette["http_interactions"]:
+            try:
+                payloads.append(_decode_body(interaction["response"]))
+            except ValueError:
+                continue
+    return payloads
+
+
+def offline_reddit(**settings):
+    """Return a :class:`.Reddit` instance that is never used for requests."""
+    return Reddit(
+        client_id="dummy",
+        client_secret="dummy",
+        user_agent="praw benchmarks",
+        check_for_updates=False,
+        **settings
+    )
+
+
+def report(name, function, number=1, repeat=5):
+    """Print and return the best time in seconds of calling ``function``."""
+    best = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+    print("{:<40} {:>12.6f} s".format(name, best))
+    return best
@@ -0,0 +1,64 @@
+"""Compare adding items to a full BoundedSet with ``list.pop(0)``.
+
+``ListBoundedSet`` reproduces :class:`.BoundedSet` as it was before using
+:py:class:`collections.OrderedDict`. Items are added to sets that are already
+full, so that every addition evicts the oldest item, for capacities ranging
+from the default used by ``stream_generator`` to large ones.
+
+"""
+from praw.models.util import BoundedSet
+
+from . import report
+
+ADDITIONS = 100000
+
+
+class ListBoundedSet:
+    """A BoundedSet evicting items with ``list.pop(0)``."""
+
+    def __init__(self, max_items):
+        """Initialize an instance of ListBoundedSet."""
+        self.max_items = max_items
+        self._fifo = []
+        self._set = set()
+
+    def add(self, item):
+        """Add an item to the set discarding the oldest item if necessary."""
+        if len(self._set) == self.max_items:
+            self._set.remove(self._fifo.pop(0))
+        self._fifo.append(item)
+        self._set.add(item)
+
+
+def fill(cls, max_items):
+    """Return a full set of ``max_items`` items."""
+    bounded_set = cls(max_items)
+    for item in range(max_items):
+        bounded_set.add(item)
+    return bounded_set
+
+
+def add(bounded_set):
+    """Add :data:`ADDITIONS` new items to ``bounded_set``."""
+    for item in range(-ADDITIONS, 0):
+        bounded_set.add(item)
+
+
+def main():
+    """Run the benchmark."""
+    for max_items in (301, 10000, 100000):
+        slow_time = report(
+            "list.pop(0), {} items".format(max_items),
+            lambda: add(fill(ListBoundedSet, max_items)),
+            repeat=3,
+        )
+        fast_time = report(
+            "OrderedDict, {} items".format(max_items),
+            lambda: add(fill(BoundedSet, max_items)),
+            repeat=3,
+        )
+        print("speedup: {:.1f}x\n".format(slow_time / fast_time))
+
+
+if __name__ == "__main__":
+    main()
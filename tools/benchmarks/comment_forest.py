@@ -0,0 +1,113 @@
+"""Compare the traversal of a 100000 comment forest with ``list.pop(0)``.
+
+``pop_list`` and ``pop_gather`` reproduce ``CommentForest.list`` and
+``CommentForest._gather_more_comments`` as they were before using
+:py:class:`collections.deque`. The synthetic forest has 1000 top-level
+comments, each the root of a random tree of 100 comments, and a
+:class:`.MoreComments` instance among the replies of every 50th comment.
+
+"""
+import random
+from heapq import heappush
+
+from praw.models import MoreComments, Submission
+from praw.models.comment_forest import CommentForest
+
+from . import offline_reddit, report
+
+COMMENTS = 100000
+TREES = 1000
+
+
+def pop_list(forest):
+    """Return the comments of ``forest`` as ``CommentForest.list`` did."""
+    comments = []
+    queue = list(forest)
+    while queue:
+        comment = queue.pop(0)
+        comments.append(comment)
+        if not isinstance(comment, MoreComments):
+            queue.extend(comment.replies)
+    return comments
+
+
+def pop_gather(tree):
+    """Gather more comments as ``_gather_more_comments`` did."""
+    more_comments = []
+    queue = [(None, x) for x in tree]
+    while queue:
+        parent, comment = queue.pop(0)
+        if isinstance(comment, MoreComments):
+            heappush(more_comments, comment)
+            if parent:
+                comment._remove_from = parent.replies._comments
+            else:
+                comment._remove_from = tree
+        else:
+            for item in comment.replies:
+                queue.append((comment, item))
+    return more_comments
+
+
+def replies_of(data):
+    """Return the list of replies in the data of a comment."""
+    if not data["replies"]:
+        data["replies"] = {"kind": "Listing", "data": {"children": []}}
+    return data["replies"]["data"]["children"]
+
+
+def synthetic_forest(reddit):
+    """Return a :class:`.CommentForest` of :data:`COMMENTS` comments."""
+    random.seed(0)
+    submission = Submission(reddit, "dummy")
+    children = []
+    for index in range(COMMENTS):
+        data = {
+            "id": str(index),
+            "link_id": "t3_dummy",
+            "name": "t1_{}".format(index),
+            "replies": "",
+        }
+        child = {"kind": "t1", "data": data}
+        if index % (COMMENTS // TREES) == 0:
+            data["parent_id"] = "t3_dummy"
+            children.append(child)
+            tree = [data]
+        else:
+            parent = random.choice(tree)
+            data["parent_id"] = parent["name"]
+            replies_of(parent).append(child)
+            tree.append(data)
+        if index % 50 == 0:
+            replies_of(data).append(
+                {"kind": "more", "data": {"children": ["x"], "count": 1}}
+            )
+    comments = reddit._objector.objectify_comment_tree(children, submission)
+    return CommentForest(submission, comments)
+
+
+def main():
+    """Run the benchmark."""
+    forest = synthetic_forest(offline_reddit())
+    assert pop_list(forest) == forest.list()
+    print("{} items".format(len(forest.list())))
+    for name, slow, fast in (
+        ("list", lambda: pop_list(forest), forest.list),
+        (
+            "_gather_more_comments",
+            lambda: pop_gather(forest._comments),
+            lambda: CommentForest._gather_more_comments(forest._comments),
+        ),
+    ):
+        slow_time = report("{} with list.pop(0)".format(name), slow)
+        fast_time = report("{} with deque".format(name), fast)
+        print("speedup: {:.1f}x\n".format(slow_time / fast_time))
+    report("iter_dfs", lambda: sum(1 for _ in forest.iter_dfs()))
+    report(
+        "iter_bfs(max_depth=2, skip_more=True)",
+        lambda: sum(1 for _ in forest.iter_bfs(max_depth=2, skip_more=True)),
+    )
+
+
+if __name__ == "__main__":
+    main()
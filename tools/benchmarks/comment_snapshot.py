@@ -0,0 +1,51 @@
+"""Compare building a submission's comments from a response and a snapshot.
+
+The largest recorded comment tree is built into the comments of a
+submission, once from the undecoded response as done when
+:attr:`.Submission.comments` is first accessed, and once from a snapshot of
+that submission with :meth:`.Submission.from_snapshot`. Both include decoding
+the JSON, but not the round trip to Reddit that the snapshot also saves.
+
+"""
+import io
+from unittest import mock
+
+from praw.models import Submission
+
+from . import offline_reddit, report
+from .incremental_comments import largest_comment_tree
+
+
+def from_response(reddit, body):
+    """Return a submission built from the response ``body``."""
+    submission = Submission(reddit, "dummy")
+    payload = reddit._json_backend.loads(body)
+    with mock.patch.object(submission, "_fetch_data", side_effect=[payload]):
+        submission._fetch()
+    return submission
+
+
+def main():
+    """Run the benchmark."""
+    reddit = offline_reddit()
+    body = largest_comment_tree()
+    file = io.BytesIO()
+    from_response(reddit, body).snapshot(file)
+    snapshot = file.getvalue()
+    print(
+        "response {:.1f} MB, snapshot {:.1f} MB, {} comments".format(
+            len(body) / 1e6, len(snapshot) / 1e6, snapshot.count(b"\n") - 1,
+        )
+    )
+    response_time = report(
+        "Submission.comments", lambda: from_response(reddit, body)
+    )
+    snapshot_time = report(
+        "Submission.from_snapshot",
+        lambda: Submission.from_snapshot(reddit, io.BytesIO(snapshot)),
+    )
+    print("speedup: {:.1f}x".format(response_time / snapshot_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare a 100000 comment forest held in memory and spilled to SQLite.
+
+The synthetic forest of :mod:`.comment_forest` is given comments of a few
+hundred bytes, like those returned by Reddit, and the memory it retains is
+measured with :py:mod:`tracemalloc`, both in memory and after
+:meth:`.CommentForest.spill` moves it to a temporary database. The time of a
+depth-first traversal is reported for both.
+
+"""
+import gc
+import tracemalloc
+
+from praw.models import Submission
+
+from . import offline_reddit, report
+from .comment_forest import synthetic_forest
+
+BODY = "A comment of a typical length, written in a megathread. " * 4
+
+
+def forest(reddit):
+    """Return a synthetic forest of comments with bodies."""
+    comments = synthetic_forest(reddit)
+    for comment in comments.iter_dfs(skip_more=True):
+        comment.body = BODY
+        comment.score = 1
+    comments._submission._comments = comments
+    return comments
+
+
+def retained(function):
+    """Return the result of ``function`` and the memory it retains."""
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    """Run the benchmark."""
+    reddit = offline_reddit()
+    Submission(reddit, "dummy")  # Import lazily loaded modules first
+    comments, in_memory = retained(lambda: forest(reddit))
+    print("{} items".format(len(comments.list())))
+    report("iter_dfs in memory", lambda: sum(1 for _ in comments.iter_dfs()))
+    comments = None  # Release the forest before measuring the next
+
+    def spilled_forest():
+        spilled = forest(reddit)
+        spilled.spill()
+        return spilled
+
+    spilled, on_disk = retained(spilled_forest)
+    report("iter_dfs spilled", lambda: sum(1 for _ in spilled.iter_dfs()))
+    print(
+        "retained memory: {:.1f} MB in memory, {:.1f} MB spilled".format(
+            in_memory / 1e6, on_disk / 1e6
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compare building comment trees recursively and iteratively.
+
+Every recorded comment tree is built once through a :class:`.Listing`, which
+objectifies the replies of each comment recursively as was done by
+``Submission._fetch``, and once with :meth:`.Objector.objectify_comment_tree`.
+The time taken, and the peak memory allocated while building, are reported.
+The deepest chain of replies each approach can build is also reported.
+
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from praw.models import Listing
+
+from . import load_bodies, offline_reddit
+
+
+def comment_listings():
+    """Return the body of every recorded comment tree."""
+    bodies = []
+    for body in load_bodies():
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except ValueError:
+            continue
+        if (
+            isinstance(payload, list)
+            and len(payload) == 2
+            and payload[1].get("kind") == "Listing"
+            and payload[1]["data"]["children"]
+            and payload[1]["data"]["children"][0]["kind"] in ("t1", "more")
+        ):
+            bodies.append(body)
+    return bodies
+
+
+def chain(depth):
+    """Return a listing holding a chain of ``depth`` replies."""
+    children = []
+    listing = {"kind": "Listing", "data": {"children": children}}
+    for index in range(depth):
+        data = {"id": str(index), "parent_id": "t1_dummy", "replies": ""}
+        children.append({"kind": "t1", "data": data})
+        children = []
+        data["replies"] = {"kind": "Listing", "data": {"children": children}}
+    return listing
+
+
+def deepest(function):
+    """Return the deepest chain, up to 100000 replies, ``function`` builds."""
+    low, high = 1, 100000
+    while low < high:
+        depth = (low + high + 1) // 2
+        try:
+            function(chain(depth))
+        except RecursionError:
+            high = depth - 1
+        else:
+            low = depth
+    return low
+
+
+def main():
+    """Run the benchmark."""
+    reddit = offline_reddit()
+    bodies = comment_listings()
+
+    def recursive(listing):
+        return Listing(reddit, _data=listing["data"]).children
+
+    def iterative(listing):
+        return reddit._objector.objectify_comment_tree(
+            listing["data"]["children"]
+        )
+
+    print(
+        "{} comment trees, recursion limit {}".format(
+            len(bodies), sys.getrecursionlimit()
+        )
+    )
+    for name, function in (("recursive", recursive), ("iterative", iterative)):
+        listings = []
+
+        def setup():
+            listings[:] = [json.loads(body)[1] for body in bodies]
+
+        def build():
+            for listing in listings:
+                function(listing)
+
+        best = None
+        for _ in range(5):
+            setup()
+            start = time.perf_counter()
+            build()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print("{:<40} {:>12.6f} s".format(name, best))
+        setup()
+        tracemalloc.start()
+        build()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("{:<40} {:>10.1f} MB peak".format("", peak / 1e6))
+        print("{:<40} {:>10} replies".format("", deepest(function)))
+
+
+if __name__ == "__main__":
+    main()
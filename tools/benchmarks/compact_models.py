@@ -0,0 +1,64 @@
+"""Report the memory used per comment and submission with tracemalloc.
+
+Every comment and submission found in the recorded payloads is built both as
+a regular model and as its compact variant, and the memory allocated while
+holding all of them is divided by their number. Replies are removed from the
+comments so that only the comments themselves are counted.
+
+"""
+import gc
+import tracemalloc
+
+from praw.models import (
+    Comment,
+    CompactComment,
+    CompactSubmission,
+    Submission,
+)
+
+from . import iter_dicts, load_payloads, offline_reddit
+
+
+def bytes_per_object(reddit, cls, items):
+    """Return the bytes allocated per instance of ``cls`` built from items."""
+    copies = [dict(item) for item in items]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [cls(reddit, _data=data) for data in copies]
+    del copies
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(
+        stat.size_diff for stat in after.compare_to(before, "filename")
+    )
+    return allocated / len(objects)
+
+
+def main():
+    """Run the benchmark."""
+    reddit = offline_reddit()
+    payloads = load_payloads()
+    for name, kind, regular, compact in (
+        ("comments", "t1", Comment, CompactComment),
+        ("submissions", "t3", Submission, CompactSubmission),
+    ):
+        items = [
+            data["data"]
+            for payload in payloads
+            for data in iter_dicts(payload)
+            if data.get("kind") == kind and isinstance(data.get("data"), dict)
+        ]
+        for item in items:
+            item.pop("replies", None)
+        regular_size = bytes_per_object(reddit, regular, items)
+        compact_size = bytes_per_object(reddit, compact, items)
+        print("{} {}".format(len(items), name))
+        print("{:<40} {:>10.0f} bytes".format(regular.__name__, regular_size))
+        print("{:<40} {:>10.0f} bytes".format(compact.__name__, compact_size))
+        print("reduction: {:.1%}\n".format(1 - compact_size / regular_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Compare fetching a comment tree whole with :meth:`.iter_comments`.
+
+The largest recorded comment tree is decoded and built into the comments of
+a submission, once as done when :attr:`.Submission.comments` is first
+accessed, and once through :meth:`.Submission.iter_comments`. The time until
+the first comment is available and the total time are reported for both,
+excluding the time spent decoding, which is identical. So is the peak memory
+allocated while building the comments, including the decoded response, as
+measured with ``tracemalloc.reset_peak``, which requires Python 3.9.
+
+"""
+import json
+import time
+import tracemalloc
+from unittest import mock
+
+from praw.models import Submission
+
+from . import load_bodies, offline_reddit
+
+
+def largest_comment_tree():
+    """Return the body of the largest recorded comment tree."""
+    trees = []
+    for body in load_bodies():
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except ValueError:
+            continue
+        if isinstance(payload, list) and len(payload) == 2:
+            trees.append(body)
+    return max(trees, key=len)
+
+
+def build(reddit, payload, incremental):
+    """Build the comments of ``payload`` and return the time to the first."""
+    submission = Submission(reddit, "dummy")
+    with mock.patch.object(submission, "_fetch_data", side_effect=[payload]):
+        start = time.perf_counter()
+        if incremental:
+            comments = submission.iter_comments()
+            next(comments)
+            first = time.perf_counter()
+            for _ in comments:
+                pass
+        else:
+            submission._fetch()
+            submission.comments[0]
+            first = time.perf_counter()
+    return first - start, time.perf_counter() - start, submission
+
+
+def measure(reddit, body, incremental):
+    """Return the times to the first and every comment, and the peak memory.
+
+    The peak memory is measured from the end of decoding, and includes the
+    decoded response still held.
+
+    """
+    first, total = min(
+        build(reddit, json.loads(body.decode("utf-8")), incremental)[:2]
+        for _ in range(5)
+    )
+    tracemalloc.start()
+    payload = json.loads(body.decode("utf-8"))
+    tracemalloc.reset_peak()
+    decoded = tracemalloc.get_traced_memory()[0]
+    submission = build(reddit, payload, incremental)[2]
+    del payload
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del submission
+    return first, total, decoded, peak
+
+
+def main():
+    """Run the benchmark."""
+    reddit = offline_reddit()
+    body = largest_comment_tree()
+    print("comment tree of {:.1f} MB".format(len(body) / 1e6))
+    for name, incremental in (
+        ("Submission.comments", False),
+        ("Submission.iter_comments", True),
+    ):
+        first, total, decoded, peak = measure(reddit, body, incremental)
+        print(
+            "{:<26} first comment {:6.1f} ms, all {:6.1f} ms, "
+            "peak {:4.1f} MB".format(
+                name, first * 1e3, total * 1e3, peak / 1e6
+            )
+        )
+    print("decoded response: {:.1f} MB".format(decoded / 1e6))
+
+
+if __name__ == "__main__":
+    main()
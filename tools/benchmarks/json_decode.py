@@ -0,0 +1,49 @@
+"""Measure the decode throughput of each installed JSON backend.
+
+The response bodies used are the recorded comment trees, that is the
+responses to requests for a submission's comments, which are the largest
+responses PRAW decodes. Backends that are not installed are skipped.
+
+"""
+import json
+
+from praw.util.json_backend import JSONBackend
+
+from . import load_bodies, report
+
+
+def is_comment_tree(body):
+    """Return whether ``body`` holds a submission and its comments."""
+    try:
+        payload = json.loads(body.decode("utf-8"))
+    except ValueError:
+        return False
+    return (
+        isinstance(payload, list)
+        and len(payload) == 2
+        and payload[1].get("kind") == "Listing"
+    )
+
+
+def main():
+    """Run the benchmark."""
+    bodies = [body for body in load_bodies() if is_comment_tree(body)]
+    megabytes = sum(len(body) for body in bodies) / 1e6
+    print("{} comment trees, {:.1f} MB".format(len(bodies), megabytes))
+    for name in JSONBackend.NAMES:
+        try:
+            backend = JSONBackend(name)
+        except ImportError:
+            print("{:<40} {:>14}".format(name, "not installed"))
+            continue
+
+        def decode(loads=backend.loads):
+            for body in bodies:
+                loads(body)
+
+        seconds = report(name, decode)
+        print("{:<40} {:>12.1f} MB/s".format("", megabytes / seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure how many submissions and comments are built per second.
+
+The data of every submission and comment found in the recorded listings is
+used to build models through ``PRAWBase.__init__``, once with the bulk
+assignment of ``_SPECIAL_ATTRIBUTES`` and once with a ``setattr`` call per
+attribute, as was done for every model before.
+
+"""
+from praw.models import Comment, Submission
+
+from . import iter_dicts, load_payloads, offline_reddit, report
+
+
+class SetattrComment(Comment):
+    """A comment assigning each of its attributes with ``setattr``."""
+
+    _SPECIAL_ATTRIBUTES = None
+
+
+class SetattrSubmission(Submission):
+    """A submission assigning each of its attributes with ``setattr``."""
+
+    _SPECIAL_ATTRIBUTES = None
+
+
+def collect(payloads, kind):
+    """Return the data of the things of ``kind`` in ``payloads``."""
+    return [
+        data["data"]
+        for payload in payloads
+        for data in iter_dicts(payload)
+        if data.get("kind") == kind and isinstance(data.get("data"), dict)
+    ]
+
+
+def main():
+    """Run the benchmark."""
+    reddit = offline_reddit()
+    payloads = load_payloads()
+    for name, kind, fast, slow in (
+        ("submissions", "t3", Submission, SetattrSubmission),
+        ("comments", "t1", Comment, SetattrComment),
+    ):
+        items = collect(payloads, kind)
+        for item in items:
+            # Nested replies would measure the objector instead.
+            item.pop("replies", None)
+
+        def build(cls):
+            def function():
+                for item in items:
+                    cls(reddit, _data=dict(item))
+
+            return function
+
+        print("{} {}".format(len(items), name))
+        slow_time = report("setattr per attribute", build(slow))
+        fast_time = report("bulk __dict__ update", build(fast))
+        print(
+            "objects per second: {:.0f} -> {:.0f} ({:.2f}x)\n".format(
+                len(items) / slow_time,
+                len(items) / fast_time,
+                slow_time / fast_time,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
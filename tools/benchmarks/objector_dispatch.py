@@ -0,0 +1,84 @@
+"""Compare the rule dispatch of ``Objector._objectify_dict`` with a chain.
+
+``chain_handler`` reproduces the chain of ``set.issubset`` checks that
+``Objector._objectify_dict`` used before its rules were memoized by shape.
+Both select the method handling every dictionary nested in the recorded
+payloads, without parsing them, so only the cost of dispatch is measured.
+
+"""
+from praw.objector import Objector
+
+from . import iter_dicts, load_payloads, offline_reddit, report
+
+
+def chain_handler(data):
+    """Return the handler selected by the original chain of checks."""
+    if {"conversation", "messages", "modActions"}.issubset(data):
+        return Objector._parse_modmail_conversation
+    elif {"actionTypeId", "author", "date"}.issubset(data):
+        return Objector._parse_modmail_action
+    elif {"bodyMarkdown", "isInternal"}.issubset(data):
+        return Objector._parse_modmail_message
+    elif {"kind", "short_name", "violation_reason"}.issubset(data):
+        return Objector._parse_rule
+    elif {"isAdmin", "isDeleted"}.issubset(data):
+        return Objector._parse_modmail_author
+    elif {"banStatus", "muteStatus", "recentComments"}.issubset(data):
+        return Objector._parse_modmail_user
+    elif {"displayName", "id", "type"}.issubset(data):
+        return Objector._parse_modmail_subreddit
+    elif {"date", "id", "name"}.issubset(data) or {
+        "id",
+        "name",
+        "permissions",
+    }.issubset(data):
+        return Objector._parse_redditor
+    elif {"text", "url"}.issubset(data):
+        if "color" in data or "linkUrl" in data:
+            return Objector._parse_button
+        return Objector._parse_menu_link
+    elif {"children", "text"}.issubset(data):
+        return Objector._parse_submenu
+    elif {"height", "url", "width"}.issubset(data):
+        return Objector._parse_image
+    elif {"isSubscribed", "name", "subscribers"}.issubset(data):
+        return Objector._parse_subreddit_name
+    elif {"authorFlairType", "name"}.issubset(data):
+        return Objector._parse_redditor_name
+    elif {"parent_id"}.issubset(data):
+        return Objector._parse_comment
+    elif "collection_id" in data.keys():
+        return Objector._parse_collection
+    return Objector._parse_plain_dict
+
+
+def main():
+    """Run the benchmark."""
+    objector = offline_reddit()._objector
+    dicts = [
+        data for payload in load_payloads() for data in iter_dicts(payload)
+    ]
+
+    def dispatch():
+        for data in dicts:
+            objector._handler(data)
+
+    def chain():
+        for data in dicts:
+            chain_handler(data)
+
+    for data in dicts:
+        assert objector._handler(data) is chain_handler(data), data
+
+    print(
+        "{} dictionaries, {} distinct shapes".format(
+            len(dicts), len(objector._dispatch)
+        )
+    )
+    chain_time = report("set.issubset chain", chain)
+    dispatch_time = report("memoized shape dispatch", dispatch)
+    print("speedup: {:.2f}x".format(chain_time / dispatch_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare building the models of listings with keeping their raw data.
+
+Every listing found in the recorded payloads is turned into a
+:class:`.Listing`, whose children are objectified, and into a
+:class:`.RawListing`, whose children are the data of each item, as done by
+``ListingGenerator`` with ``raw=True``. Only listings of comments and
+submissions are used, and both variants are given a copy of each listing, as
+building models may modify their data.
+
+"""
+from praw.models.listing.listing import RawListing
+
+from . import iter_dicts, load_payloads, offline_reddit, report
+
+
+def copy(listing):
+    """Return a copy of ``listing`` and of the data of its children."""
+    children = [
+        {"kind": child["kind"], "data": dict(child["data"])}
+        for child in listing["data"]["children"]
+    ]
+    return {
+        "kind": "Listing",
+        "data": dict(listing["data"], children=children),
+    }
+
+
+def main():
+    """Run the benchmark."""
+    reddit = offline_reddit()
+    listings = [
+        data
+        for payload in load_payloads()
+        for data in iter_dicts(payload)
+        if data.get("kind") == "Listing"
+        and data["data"]["children"]
+        and all(
+            child.get("kind") in ("t1", "t3")
+            for child in data["data"]["children"]
+        )
+    ]
+    for listing in listings:
+        for child in listing["data"]["children"]:
+            child["data"].pop("replies", None)
+    items = sum(len(listing["data"]["children"]) for listing in listings)
+
+    def objectify():
+        for listing in listings:
+            reddit._objector.objectify(copy(listing))
+
+    def raw():
+        for listing in listings:
+            RawListing(reddit, _data=copy(listing)["data"])
+
+    print("{} listings, {} items".format(len(listings), items))
+    objectify_time = report("objectify", objectify)
+    raw_time = report("raw", raw)
+    print("speedup: {:.1f}x".format(objectify_time / raw_time))
+
+
+if __name__ == "__main__":
+    main()
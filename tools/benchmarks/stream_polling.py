@@ -0,0 +1,87 @@
+"""Simulate the requests made by streams with and without AdaptivePoller.
+
+Items arrive as a Poisson process over six simulated hours, for rates ranging
+from a quiet subreddit to a busy one. Each request takes one second, as with
+the rate limit of Reddit, and returns the oldest new items, up to its limit.
+The default policy of ``stream_generator``, which requests again immediately
+after new items and otherwise waits with an exponential delay of up to 16
+seconds, is compared with :class:`.AdaptivePoller` aiming for a latency of
+30 seconds. The number of requests, the number of items requested, and the
+mean and maximum latency between the creation of an item and the request
+returning it are reported.
+
+"""
+import random
+
+from praw.models.util import AdaptivePoller, ExponentialCounter
+
+DURATION = 6 * 3600
+RATES = (1 / 600, 1 / 30, 1 / 2, 5)
+REQUEST_TIME = 1
+
+
+def arrivals(rate):
+    """Return the creation times of the items arriving at ``rate``."""
+    random.seed(0)
+    created = []
+    now = random.expovariate(rate)
+    while now < DURATION:
+        created.append(now)
+        now += random.expovariate(rate)
+    return created
+
+
+def simulate(created, poller):
+    """Return the number of requests, items requested, and latencies."""
+    counter = ExponentialCounter(max_counter=16)
+    latencies = []
+    now = requests = requested = position = 0
+    while now < DURATION:
+        limit = 100 if poller is None else poller.limit()
+        now += REQUEST_TIME
+        requests += 1
+        requested += limit
+        new = []
+        while (
+            position < len(created)
+            and created[position] <= now
+            and len(new) < limit
+        ):
+            new.append(created[position])
+            position += 1
+        latencies.extend(now - timestamp for timestamp in new)
+        if poller is not None:
+            poller.observe(new, now=now)
+            if len(new) < limit:
+                now += poller.delay()
+        elif new:
+            counter.reset()
+        else:
+            now += counter.counter()
+    return requests, requested, latencies
+
+
+def main():
+    """Run the benchmark."""
+    for rate in RATES:
+        created = arrivals(rate)
+        print("{:.4f} items per second, {} items".format(rate, len(created)))
+        for name, poller in (
+            ("exponential", None),
+            ("AdaptivePoller", AdaptivePoller(target_latency=30)),
+        ):
+            requests, requested, latencies = simulate(created, poller)
+            print(
+                "  {:<15} {:>6} requests, {:>8} items requested, latency "
+                "mean {:5.1f} s, max {:5.1f} s".format(
+                    name,
+                    requests,
+                    requested,
+                    sum(latencies) / max(len(latencies), 1),
+                    max(latencies, default=0),
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()